@@ -0,0 +1,23 @@
+"""
+Fixtures shared by the test files
+"""
+import pytest
+
+
+class FakeTime:
+    """A clock for time_source / perf_counter that moves on by step every time it is read,
+    and otherwise only when told to (time.now += seconds)"""
+
+    def __init__(self, start=100.0, step=0):
+        self.now = start
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+@pytest.fixture
+def fake_time():
+    """Makes FakeTimes: fake_time() stands still, fake_time(step=1000) moves on every read"""
+    return FakeTime
@@ -0,0 +1,481 @@
+"""
+Test suite for the board backends (board.py and bit_board.py)
+
+Both backends are run through the same tests so they stay interchangeable
+for the gamemodes and the renderer.
+"""
+import pytest
+import random
+import sys
+import os
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tetris.new_code.tetris_game.game.board import Board
+from tetris.new_code.tetris_game.game.bit_board import BitBoard
+from tetris.new_code.tetris_game.game.board_factory import BoardFactory
+from tetris.new_code.tetris_game.game.piece.piece import Piece, FIGURES
+from tetris.new_code.tetris_game.game.piece.piece_masks import FIGURE_MASKS, get_collision_mask
+from tetris.new_code.tetris_game.game.piece.special_pieces.rocket_piece import RocketPiece
+from tetris.new_code.tetris_game.game.piece.piece_action import PieceAction
+from tetris.new_code.tetris_game.game.game_command import CommandFactory, COMMANDS
+
+
+BOARD_CLASSES = [Board, BitBoard]
+
+
+class CellPiece(Piece):
+    """A one block piece, figure (0,) is the top left cell of the 4x4 grid"""
+
+    def get_figure(self):
+        return (0,)
+
+
+def place_cell(board, x, y, color=1):
+    """Freeze a single block at (x, y)"""
+    return board.freeze_piece(CellPiece(x, y, piece_type='cell', piece_color=color))
+
+
+def fill_row(board, row, skip=()):
+    """Fill a row one block at a time, leaving the columns in skip empty"""
+    for x in range(board.width):
+        if x not in skip:
+            place_cell(board, x, row)
+
+
+# ============================================================================
+# BOARD BACKENDS
+# ============================================================================
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+class TestBoardBackends:
+    """Tests that every board backend has to pass"""
+
+    def test_new_board_is_empty(self, board_class):
+        """Test that a new board has no blocks"""
+        board = board_class(20, 10)
+
+        assert all(board.field[i][j] == 0 for i in range(20) for j in range(10))
+
+    def test_piece_in_open_space_does_not_intersect(self, board_class):
+        """Test that a piece in the middle of an empty board is free"""
+        board = board_class(20, 10)
+        piece = Piece(3, 5, piece_type='T', piece_color=1)
+
+        assert not board.intersects(piece)
+
+    def test_piece_outside_walls_intersects(self, board_class):
+        """Test that pieces past the left, right and bottom walls intersect"""
+        board = board_class(20, 10)
+
+        assert board.intersects(Piece(-2, 0, piece_type='O', piece_color=1))
+        assert board.intersects(Piece(8, 0, piece_type='O', piece_color=1))
+        assert board.intersects(Piece(3, 19, piece_type='O', piece_color=1))
+
+    def test_empty_grid_columns_can_hang_past_the_wall(self, board_class):
+        """Test that a vertical I piece can use a negative xShift when its column is on the board"""
+        board = board_class(20, 10)
+        piece = Piece(-1, 0, piece_type='I', piece_color=1)
+
+        assert not board.intersects(piece)
+
+    def test_freeze_piece_writes_color(self, board_class):
+        """Test that a frozen piece shows up in field with its color"""
+        board = board_class(20, 10)
+        piece = Piece(0, 18, piece_type='O', piece_color=4)
+
+        assert board.freeze_piece(piece) == (0, [])
+        assert board.field[18][1] == 4
+        assert board.field[19][2] == 4
+        assert board.intersects(Piece(0, 18, piece_type='O', piece_color=1))
+
+    def test_break_single_line(self, board_class):
+        """Test that a full bottom row is cleared and the rows above move down"""
+        board = board_class(20, 10)
+        fill_row(board, 18, skip=(0,))
+        fill_row(board, 19, skip=(5,))
+
+        lines, cleared = place_cell(board, 5, 19, color=2)
+
+        assert (lines, cleared) == (1, [19])
+        assert board.field[19][0] == 0
+        assert board.field[19][1] == 1
+        assert all(board.field[18][j] == 0 for j in range(10))
+
+    def test_break_lines_reports_shifted_indices(self, board_class):
+        """Test that stacked clears report the row each line was at when it was cleared"""
+        board = board_class(20, 10)
+        fill_row(board, 16, skip=(0, 5))
+        fill_row(board, 17, skip=(0,))
+        fill_row(board, 18, skip=(0, 3))
+        fill_row(board, 19, skip=(0,))
+
+        # Vertical I piece down column 0 completes rows 17 and 19
+        lines, cleared = board.freeze_piece(Piece(-1, 16, piece_type='I', piece_color=2))
+
+        assert lines == 2
+        assert cleared == [19, 18]
+        assert board.field[19][3] == 0
+        assert board.field[19][4] == 1
+        assert board.field[18][5] == 0
+        assert all(board.field[17][j] == 0 for j in range(10))
+
+    def test_break_lines_shifts_top_rows(self, board_class):
+        """Test that the blocks in rows 0 and 1 move down with the rest of the stack"""
+        board = board_class(6, 4)
+        place_cell(board, 0, 0, color=3)
+        place_cell(board, 1, 1, color=4)
+        fill_row(board, 5, skip=(2,))
+
+        lines, cleared = place_cell(board, 2, 5)
+
+        assert (lines, cleared) == (1, [5])
+        assert [board.field[1][j] for j in range(4)] == [3, 0, 0, 0]
+        assert [board.field[2][j] for j in range(4)] == [0, 4, 0, 0]
+        assert all(board.field[0][j] == 0 for j in range(4))
+
+    def test_clear_column(self, board_class):
+        """Test that clear_column removes the blocks in one column only"""
+        board = board_class(20, 10)
+        fill_row(board, 19, skip=(9,))
+
+        board.clear_column(4)
+
+        assert board.field[19][4] == 0
+        assert board.field[19][5] == 1
+        assert not board.intersects(Piece(3, 16, piece_type='I', piece_color=1))
+
+    def test_rocket_intersects_as_rectangle(self, board_class):
+        """Test that the rocket uses its full width and height for collision"""
+        board = board_class(20, 10)
+        rocket = RocketPiece(3, 14)
+
+        assert not board.intersects(rocket)
+
+        rocket.yShift = 15
+        assert board.intersects(rocket)
+
+        rocket.yShift = 0
+        rocket.xShift = 8
+        assert board.intersects(rocket)
+
+    def test_rocket_special_ability_clears_columns(self, board_class):
+        """Test that the rocket clears every column it covers"""
+        board = board_class(20, 10)
+        fill_row(board, 19, skip=(9,))
+        rocket = RocketPiece(2, 0)
+
+        rocket.instant_drop(board)
+
+        assert [board.field[19][j] for j in range(10)] == [1, 1, 0, 0, 0, 1, 1, 1, 1, 0]
+
+    def test_snapshot_restore(self, board_class):
+        """Test that a snapshot put on an empty board gives the same cells and skyline"""
+        board = board_class(20, 10)
+        place_cell(board, 3, 12, color=4)
+        fill_row(board, 19, skip=(5,))
+        other = board_class(20, 10)
+
+        other.restore(board.snapshot())
+
+        assert [list(row) for row in other.field] == [list(row) for row in board.field]
+        assert other.column_tops == board.column_tops
+        assert other.snapshot() == board.snapshot()
+        assert other.intersects(CellPiece(3, 12, piece_type='cell', piece_color=1))
+
+
+# ============================================================================
+# SKYLINE / HARD DROP
+# ============================================================================
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+class TestSkyline:
+    """Tests for the column tops kept by the boards and the hard drop that uses them"""
+
+    def test_empty_board_tops_are_the_floor(self, board_class):
+        """Test that every column of a new board is empty"""
+        board = board_class(20, 10)
+
+        assert board.column_tops == [20] * 10
+        assert board.get_column_heights() == [0] * 10
+
+    def test_freeze_raises_column_tops(self, board_class):
+        """Test that freezing a piece moves the tops of the columns it covers"""
+        board = board_class(20, 10)
+        board.freeze_piece(Piece(0, 17, piece_type='T', piece_color=1))
+
+        assert board.column_tops[:4] == [18, 17, 18, 20]
+        assert board.get_column_heights()[:4] == [2, 3, 2, 0]
+
+    def test_line_clear_lowers_column_tops(self, board_class):
+        """Test that the tops follow the stack down after a line clear"""
+        board = board_class(20, 10)
+        place_cell(board, 3, 17)
+        fill_row(board, 19, skip=(0,))
+        place_cell(board, 0, 19)
+
+        assert board.column_tops[3] == 18
+        assert board.column_tops[4] == 20
+
+    def test_clear_column_empties_column_top(self, board_class):
+        """Test that the rocket's column clear resets the column top"""
+        board = board_class(20, 10)
+        fill_row(board, 19, skip=(9,))
+        board.clear_column(2)
+
+        assert board.column_tops[2] == 20
+        assert board.column_tops[3] == 19
+
+    def test_drop_y_lands_on_stack(self, board_class):
+        """Test that the landing row comes from the piece's bottom profile"""
+        board = board_class(20, 10)
+        place_cell(board, 2, 19)
+
+        # T piece pointing down, its middle column is one row lower than the sides
+        piece = Piece(1, 0, piece_type='T', piece_color=1)
+        piece.rotation = 2
+
+        assert board.drop_y(piece) == 16
+        assert piece.yShift == 0
+
+    def test_drop_y_under_overhang(self, board_class):
+        """Test that a piece tucked under an overhang still falls to the floor"""
+        board = board_class(20, 10)
+        place_cell(board, 1, 15)
+        piece = Piece(-1, 16, piece_type='I', piece_color=1)
+
+        assert board.drop_y(piece) == 16
+        piece.xShift = 0
+        assert board.drop_y(piece) == 16
+
+    def test_drop_y_matches_stepping(self, board_class):
+        """Test that the skyline drop agrees with stepping down one row at a time"""
+        rng = random.Random(3)
+        board = board_class(20, 6)
+
+        for _ in range(300):
+            piece_type = rng.choice(list(FIGURES))
+            piece = Piece(rng.randint(-1, 4), 0, piece_type, 1)
+            piece.rotation = rng.randrange(len(FIGURES[piece_type]))
+            if board.intersects(piece):
+                board = board_class(20, 6)
+                continue
+
+            assert board.drop_y(piece) == board._step_drop_y(piece)
+            piece.instant_drop(board)
+
+            for j in range(6):
+                column = [board.field[i][j] for i in range(20)]
+                top = next((i for i, color in enumerate(column) if color > 0), 20)
+                assert board.column_tops[j] == top
+
+    def test_rocket_drop_lands_on_stack(self, board_class):
+        """Test that the rocket's hard drop uses its whole width"""
+        board = board_class(20, 10)
+        place_cell(board, 5, 12)
+        rocket = RocketPiece(3, 0)
+
+        assert board.drop_y(rocket) == 6
+
+
+# ============================================================================
+# BIT BOARD
+# ============================================================================
+class TestBitBoard:
+    """Tests for the bit board internals"""
+
+    def test_rows_match_color_plane(self):
+        """Test that the occupancy bits follow the color plane"""
+        board = BitBoard(20, 10)
+        board.freeze_piece(Piece(0, 17, piece_type='I', piece_color=3))
+
+        for i in range(20):
+            expected = sum(1 << j for j in range(10) if board.field[i][j] > 0)
+            assert board.rows[i] == expected
+
+    def test_break_lines_keeps_field_identity(self):
+        """Test that the renderer can keep a reference to field across line clears"""
+        board = BitBoard(20, 10)
+        field = board.field
+        fill_row(board, 19)
+
+        assert board.field is field
+        assert board.rows[19] == 0
+
+
+    def test_same_game_as_list_board(self):
+        """Test that random drops give the same field and line clears on both backends"""
+        # A narrow board so random drops clear plenty of lines
+        rng = random.Random(7)
+        list_board = Board(20, 4)
+        bit_board = BitBoard(20, 4)
+        lines = 0
+
+        for _ in range(400):
+            piece_type = rng.choice(list(FIGURES))
+            rotation = rng.randrange(len(FIGURES[piece_type]))
+            x = rng.randint(-1, 2)
+            pieces = [Piece(x, 0, piece_type, 1 + rng.randrange(6)) for _ in range(2)]
+            pieces[1].color = pieces[0].color
+            for piece in pieces:
+                piece.rotation = rotation
+
+            if list_board.intersects(pieces[0]):
+                assert bit_board.intersects(pieces[1])
+                list_board = Board(20, 4)
+                bit_board = BitBoard(20, 4)
+                continue
+
+            expected = pieces[0].instant_drop(list_board)
+            assert pieces[1].instant_drop(bit_board) == expected
+            assert list_board.field == [list(row) for row in bit_board.field]
+            lines += expected[0]
+
+        assert lines > 0
+
+
+# ============================================================================
+# PIECE MASKS
+# ============================================================================
+class TestPieceMasks:
+    """Tests for the precomputed collision masks"""
+
+    def test_every_rotation_has_a_mask(self):
+        """Test that the table covers every shape and rotation in FIGURES"""
+        expected = {(t, r) for t, rotations in FIGURES.items() for r in range(len(rotations))}
+
+        assert set(FIGURE_MASKS) == expected
+
+    def test_masks_match_figures(self):
+        """Test that the cells and row bits describe the same blocks as the figure"""
+        for (piece_type, rotation), mask in FIGURE_MASKS.items():
+            figure = FIGURES[piece_type][rotation]
+
+            assert sorted(i * 4 + j for i, j in mask.cells) == sorted(figure)
+
+            from_bits = sorted(
+                i * 4 + j + mask.min_x
+                for i, bits in mask.rows
+                for j in range(4) if bits >> j & 1
+            )
+            assert from_bits == sorted(figure)
+
+    def test_rocket_mask_is_full_rectangle(self):
+        """Test that the rocket collides with its whole 3x6 rectangle"""
+        mask = get_collision_mask(RocketPiece(0, 0))
+
+        assert len(mask.cells) == 18
+        assert (mask.min_x, mask.max_x, mask.min_y, mask.max_y) == (0, 2, 0, 5)
+        assert all(bits == 0b111 for i, bits in mask.rows)
+
+
+# ============================================================================
+# PIECE FLYWEIGHT
+# ============================================================================
+class TestPieceFlyweight:
+    """Tests for the shared shape tables and the __slots__ pieces"""
+
+    def test_pieces_have_no_instance_dict(self):
+        """Test that pieces only hold their own state"""
+        assert not hasattr(Piece(0, 0, 'T', 1), '__dict__')
+        assert not hasattr(RocketPiece(0, 0), '__dict__')
+
+    def test_figures_are_shared_and_read_only(self):
+        """Test that every piece reads the same shapes and cannot change them"""
+        first = Piece(0, 0, 'L', 1)
+        second = Piece(0, 0, 'L', 2)
+
+        assert first.figures is second.figures is FIGURES
+        assert first.get_figure() is second.get_figure()
+        with pytest.raises(TypeError):
+            FIGURES['L'] = ((0,),)
+
+    def test_rocket_dimensions_are_class_level(self):
+        """Test that the rocket's size and spawn interval are shared by every rocket"""
+        rocket = RocketPiece(0, 0)
+
+        assert (rocket.width, rocket.height, rocket.interval) == (3, 6, 15)
+        assert rocket.is_special
+
+
+# ============================================================================
+# COMMANDS
+# ============================================================================
+class TestCommands:
+    """Tests for the shared commands behind CommandFactory"""
+
+    def test_same_command_every_time(self):
+        """Test that the factory hands out the shared command instead of creating one"""
+        first = CommandFactory()
+        second = CommandFactory()
+
+        for action, command in COMMANDS.items():
+            assert first.create_command(action) is command
+            assert second.create_command(action) is command
+
+    def test_unknown_action(self):
+        """Test that actions without a command (pause, quit) give None"""
+        assert CommandFactory().create_command(PieceAction.PAUSE) is None
+
+    def test_commands_keep_no_state(self):
+        """Test that running a command does not keep the piece or board around"""
+        board = Board(20, 10)
+        piece = Piece(3, 0, 'T', 1)
+
+        for command in COMMANDS.values():
+            command.execute(piece, board)
+            assert not hasattr(command, '__dict__')
+
+    @pytest.mark.parametrize("action,expected", [
+        (PieceAction.ROTATE_CLOCKWISE, 1),
+        (PieceAction.ROTATE_COUNTERCLOCKWISE, 3),
+    ])
+    def test_rotate_direction(self, action, expected):
+        """Test that each rotate command turns the piece its own way"""
+        piece = Piece(3, 5, 'T', 1)
+
+        CommandFactory().create_command(action).execute(piece, Board(20, 10))
+
+        assert piece.rotation == expected
+
+    def test_blocked_rotation_is_undone(self):
+        """Test that a rotation that does not fit leaves the piece as it was"""
+        board = Board(20, 10)
+        piece = Piece(-1, 5, 'I', 1)   # vertical I against the left wall, flat would stick out
+
+        CommandFactory().create_command(PieceAction.ROTATE_CLOCKWISE).execute(piece, board)
+
+        assert piece.rotation == 0
+
+    def test_rocket_does_not_rotate(self):
+        """Test that rotating a special piece does nothing"""
+        rocket = RocketPiece(3, 0)
+
+        CommandFactory().create_command(PieceAction.ROTATE_CLOCKWISE).execute(rocket, Board(20, 10))
+
+        assert rocket.rotation == 0
+
+
+# ============================================================================
+# BOARD FACTORY
+# ============================================================================
+class TestBoardFactory:
+    """Tests for picking a board backend from the gamemode config"""
+
+    def test_default_board_is_list_board(self):
+        """Test that no board key gives the list based board"""
+        factory = BoardFactory({'mode': 'classic'})
+
+        assert isinstance(factory.create_board(20, 10), Board)
+
+    def test_bitboard_from_config(self):
+        """Test that 'bitboard' gives a BitBoard"""
+        factory = BoardFactory({'mode': 'classic', 'board': 'bitboard'})
+        board = factory.create_board(20, 10)
+
+        assert isinstance(board, BitBoard)
+        assert (board.height, board.width) == (20, 10)
+
+    def test_unknown_board_raises(self):
+        """Test that a typo in the config fails early"""
+        with pytest.raises(ValueError):
+            BoardFactory({'mode': 'classic', 'board': 'bits'})
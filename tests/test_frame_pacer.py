@@ -0,0 +1,178 @@
+"""
+Tests for the adaptive frame pacing (main/frame_pacer.py) and run_frame skipping the drawing of
+frames the pacer drops
+"""
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tetris.new_code.tetris_game.main.frame_pacer import FramePacer
+from tetris.new_code.tetris_game.main.game import run_frame, run_game
+from tetris.new_code.tetris_game.profiling.frame_profiler import FrameProfiler
+
+
+def pace(pacer, time, frame_times):
+    """Runs a frame of each of frame_times seconds, returns which of them were drawn"""
+    drawn = []
+    for frame_time in frame_times:
+        drawn.append(pacer.begin_frame())
+        time.now += frame_time
+    return drawn
+
+
+# ============================================================================
+# PACER
+# ============================================================================
+class TestFramePacer:
+    """Frames are due on a fixed schedule, drawing is skipped to catch up"""
+
+    def test_on_time_frames_are_drawn(self, fake_time):
+        """Test that frames shorter than the period are all drawn and none are late"""
+        time = fake_time()
+        pacer = FramePacer(25, time_source=time)
+        for _ in range(10):
+            assert pacer.begin_frame()
+            time.now = pacer.next_frame
+        assert (pacer.dropped_frames, pacer.late_frames) == (0, 0)
+
+    def test_long_frame_skips_drawing_to_catch_up(self, fake_time):
+        """Test that after a frame three periods long the next frames aren't drawn until on schedule"""
+        time = fake_time()
+        pacer = FramePacer(25, time_source=time)
+        drawn = pace(pacer, time, [0.12, 0.005, 0.005, 0.005])
+        assert drawn == [True, False, False, True]
+        assert pacer.dropped_frames == 2
+        assert pacer.late_frames == 3
+
+    def test_skips_in_a_row_are_capped(self, fake_time):
+        """Test that no more than max_skip frames in a row go undrawn"""
+        time = fake_time()
+        pacer = FramePacer(25, max_skip=2, time_source=time)
+        drawn = pace(pacer, time, [0.1] * 7)
+        assert drawn == [True, False, False, True, False, False, True]
+
+    def test_far_behind_starts_over(self, fake_time):
+        """Test that a stall longer than max_skip frames isn't caught up on"""
+        time = fake_time()
+        pacer = FramePacer(25, max_skip=4, time_source=time)
+        pace(pacer, time, [5.0])
+        assert not pacer.begin_frame()
+        assert pacer.next_frame == pytest.approx(time.now + 0.04)
+        time.now += 0.01
+        assert pacer.begin_frame()
+        assert not pacer.late
+
+    @patch('tetris.new_code.tetris_game.main.frame_pacer.pygame')
+    def test_wait_sleeps_until_due(self, mock_pygame, fake_time):
+        """Test that wait sleeps the rest of the period and not at all when behind"""
+        time = fake_time()
+        pacer = FramePacer(25, time_source=time)
+        pacer.begin_frame()
+        time.now += 0.015
+        pacer.wait()
+        mock_pygame.time.wait.assert_called_once_with(25)
+
+        time.now += 0.1
+        pacer.wait()
+        assert mock_pygame.time.wait.call_count == 1
+
+    @patch('tetris.new_code.tetris_game.main.frame_pacer.pygame')
+    def test_busy_wait_spins_to_the_deadline(self, mock_pygame, fake_time):
+        """Test that the busy loop delays most of the wait and spins the rest"""
+        time = fake_time()
+        pacer = FramePacer(25, busy_loop=True, time_source=time)
+        pacer.begin_frame()
+        # delay comes back a little early, the spin reads the time until it is due
+        mock_pygame.time.delay.side_effect = lambda ms: setattr(time, 'now', time.now + ms / 1000 - 0.0005)
+        reads = []
+        def spinning():
+            reads.append(time.now)
+            time.now += 0.0001
+            return time.now
+        pacer._time = spinning
+
+        pacer.wait()
+        mock_pygame.time.delay.assert_called_once_with(39)
+        assert time.now >= pacer.next_frame
+        assert len(reads) > 2
+        mock_pygame.time.wait.assert_not_called()
+
+
+# ============================================================================
+# RUN FRAME
+# ============================================================================
+class TestPacedFrames:
+    """run_frame draws and presents only the frames the pacer keeps"""
+
+    def setup_frame(self):
+        config = Mock()
+        config.profiler = FrameProfiler(enabled=True)
+        renderer = Mock()
+        state_manager = Mock()
+        state_manager.update.return_value = True
+        return config, renderer, state_manager
+
+    def test_dropped_frame_still_updates(self):
+        """Test that a dropped frame runs the state update but doesn't present"""
+        config, renderer, state_manager = self.setup_frame()
+        pacer = Mock()
+        pacer.begin_frame.return_value = False
+        pacer.late = True
+        pacer.behind = 0.05
+
+        assert run_frame(config, renderer, state_manager, pacer)
+        state_manager.update.assert_called_once()
+        assert config.render_frame is False
+        renderer.present.assert_not_called()
+        renderer.particle_lod.frame.assert_called_once()
+        assert (config.profiler.dropped_frames, config.profiler.late_frames) == (1, 1)
+
+    def test_kept_frame_presents(self):
+        """Test that a frame the pacer keeps is drawn and presented"""
+        config, renderer, state_manager = self.setup_frame()
+        pacer = Mock()
+        pacer.begin_frame.return_value = True
+        pacer.late = False
+
+        run_frame(config, renderer, state_manager, pacer)
+        assert config.render_frame is True
+        renderer.present.assert_called_once()
+        assert config.profiler.dropped_frames == 0
+
+    def test_unknown_pacing_raises(self):
+        """Test that an unknown pacing mode is refused before pygame starts"""
+        with patch('tetris.new_code.tetris_game.main.game.pygame') as mock_pygame:
+            with pytest.raises(ValueError):
+                run_game('null', pacing='vsync')
+        mock_pygame.init.assert_not_called()
+
+    @patch.dict(os.environ)
+    def test_game_state_skips_drawing(self):
+        """E2E: in game a dropped frame ticks the simulation without drawing"""
+        import pygame
+        from tetris.new_code.tetris_game.main.game import start_game
+
+        config, renderer, state_manager = start_game('offscreen')
+        try:
+            config.replay_dir = None
+            config.play_sounds = False
+            state_manager._change_state('game')
+            game = state_manager.current_state
+            game.draw = Mock()
+
+            pacer = Mock()
+            pacer.begin_frame.return_value = False
+            pacer.late = False
+            run_frame(config, renderer, state_manager, pacer)
+            game.draw.assert_not_called()
+            assert config.counter > 0
+
+            pacer.begin_frame.return_value = True
+            run_frame(config, renderer, state_manager, pacer)
+            game.draw.assert_called_once()
+        finally:
+            pygame.quit()
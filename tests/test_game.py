@@ -16,7 +16,9 @@ import os
 # Add the tetris module to the path so we can import it
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from tetris.new_code.tetris_game.main.game import run_game
+from tetris.new_code.tetris_game.main.game import run_game, start_game, run_frame
+from tetris.new_code.tetris_game.ui.abstract_renderer import AbstractRenderer
+from tetris.new_code.tetris_game.ui.null_renderer import NullRenderer
 
 
 # ============================================================================
@@ -208,7 +210,7 @@ class TestRunGameUnit:
     @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
     def test_game_loop_refreshes_display(self, mock_state_manager_class, mock_config_class, 
                                           mock_input_class, mock_renderer_class, mock_pygame):
-        """Test that display is flipped each iteration"""
+        """Test that the renderer presents the frame each iteration"""
         # Setup
         mock_config = Mock()
         mock_config.window_width = 800
@@ -226,8 +228,8 @@ class TestRunGameUnit:
         # Execute
         run_game()
 
-        # Assert - display.flip should be called twice (once per loop iteration)
-        assert mock_pygame.display.flip.call_count == 2
+        # Assert - present should be called twice (once per loop iteration)
+        assert mock_renderer_class.return_value.present.call_count == 2
 
     @patch('tetris.new_code.tetris_game.main.game.pygame')
     @patch('tetris.new_code.tetris_game.main.game.Renderer')
@@ -287,60 +289,6 @@ class TestRunGameUnit:
         # Assert
         mock_pygame.quit.assert_called_once()
 
-    @patch('tetris.new_code.tetris_game.main.game.pygame')
-    @patch('tetris.new_code.tetris_game.main.game.Renderer')
-    @patch('tetris.new_code.tetris_game.main.game.Input')
-    @patch('tetris.new_code.tetris_game.main.game.Config')
-    @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
-    def test_game_counter_increments_by_level(self, mock_state_manager_class, mock_config_class, 
-                                               mock_input_class, mock_renderer_class, mock_pygame):
-        """Test that counter increments by level each iteration"""
-        # Setup
-        mock_config = Mock()
-        mock_config.window_width = 800
-        mock_config.window_height = 600
-        mock_config.fps = 60
-        mock_config.counter = 0
-        mock_config.level = 5
-        mock_config_class.return_value = mock_config
-
-        mock_state_manager_instance = Mock()
-        mock_state_manager_instance.update.side_effect = [True, True, False]
-        mock_state_manager_class.return_value = mock_state_manager_instance
-
-        # Execute
-        run_game()
-
-        # Assert - counter should be incremented twice (5 + 5 = 10)
-        assert mock_config.counter == 10
-
-    @patch('tetris.new_code.tetris_game.main.game.pygame')
-    @patch('tetris.new_code.tetris_game.main.game.Renderer')
-    @patch('tetris.new_code.tetris_game.main.game.Input')
-    @patch('tetris.new_code.tetris_game.main.game.Config')
-    @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
-    def test_game_counter_resets_on_overflow(self, mock_state_manager_class, mock_config_class, 
-                                              mock_input_class, mock_renderer_class, mock_pygame):
-        """Test that counter resets to 0 when it exceeds 100000"""
-        # Setup
-        mock_config = Mock()
-        mock_config.window_width = 800
-        mock_config.window_height = 600
-        mock_config.fps = 60
-        mock_config.counter = 99999
-        mock_config.level = 5
-        mock_config_class.return_value = mock_config
-
-        mock_state_manager_instance = Mock()
-        mock_state_manager_instance.update.side_effect = [True, False]
-        mock_state_manager_class.return_value = mock_state_manager_instance
-
-        # Execute
-        run_game()
-
-        # Assert - counter should be reset to 0 (99999 + 5 = 100004, which is > 100000)
-        assert mock_config.counter == 0
-
     @patch('tetris.new_code.tetris_game.main.game.pygame')
     @patch('tetris.new_code.tetris_game.main.game.Renderer')
     @patch('tetris.new_code.tetris_game.main.game.Input')
@@ -396,7 +344,8 @@ class TestRunGameIntegration:
         mock_pygame.display.set_mode.assert_called_once()
         mock_pygame.display.set_caption.assert_called_with("Code^3 Tetris")
         mock_pygame.time.Clock.assert_called_once()
-        mock_pygame.font.SysFont.assert_called_once()
+        # Fonts come from the renderer's shared text cache, run_game loads none itself
+        mock_pygame.font.SysFont.assert_not_called()
         mock_renderer_class.assert_called_once()
         mock_input_class.assert_called_once()
         mock_state_manager_class.assert_called_once()
@@ -426,7 +375,7 @@ class TestRunGameIntegration:
 
         # Assert
         assert mock_state_manager_instance.update.call_count == 6  # 5 True + 1 False
-        assert mock_pygame.display.flip.call_count == 6
+        assert mock_renderer_class.return_value.present.call_count == 6
         clock_mock = mock_pygame.time.Clock()
         assert clock_mock.tick.call_count == 6
 
@@ -556,60 +505,6 @@ class TestRunGameIntegration:
             mock_pygame.display.set_mode.assert_called_with((width, height))
             mock_pygame.reset_mock()
 
-    @patch('tetris.new_code.tetris_game.main.game.pygame')
-    @patch('tetris.new_code.tetris_game.main.game.Renderer')
-    @patch('tetris.new_code.tetris_game.main.game.Input')
-    @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
-    def test_game_counter_progression_over_iterations(self, mock_state_manager_class, 
-                                                       mock_input_class, mock_renderer_class, mock_pygame):
-        """Integration test: verify counter increments correctly over multiple iterations"""
-        # Setup
-        mock_config = Mock()
-        mock_config.window_width = 800
-        mock_config.window_height = 600
-        mock_config.fps = 60
-        mock_config.counter = 50000
-        mock_config.level = 10000
-
-        mock_state_manager_instance = Mock()
-        # 3 iterations: 50000 -> 60000 -> 70000 -> 80000
-        mock_state_manager_instance.update.side_effect = [True, True, True, False]
-        mock_state_manager_class.return_value = mock_state_manager_instance
-
-        # Execute
-        run_game()
-
-        # Assert - final counter should be 80000 (50000 + 3*10000)
-        assert mock_config.counter == 80000
-
-    @patch('tetris.new_code.tetris_game.main.game.pygame')
-    @patch('tetris.new_code.tetris_game.main.game.Renderer')
-    @patch('tetris.new_code.tetris_game.main.game.Input')
-    @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
-    def test_game_counter_overflow_multiple_times(self, mock_state_manager_class, 
-                                                    mock_input_class, mock_renderer_class, mock_pygame):
-        """Integration test: verify counter resets multiple times if needed"""
-        # Setup
-        mock_config = Mock()
-        mock_config.window_width = 800
-        mock_config.window_height = 600
-        mock_config.fps = 60
-        mock_config.counter = 99000
-        mock_config.level = 500  # Will overflow multiple times
-
-        mock_state_manager_instance = Mock()
-        # After first iteration: 99000 + 500 = 99500 (no reset)
-        # After second: 99500 + 500 = 100000 (reset to 0)
-        # After third: 0 + 500 = 500 (no reset)
-        mock_state_manager_instance.update.side_effect = [True, True, True, False]
-        mock_state_manager_class.return_value = mock_state_manager_instance
-
-        # Execute
-        run_game()
-
-        # Assert
-        assert mock_config.counter == 500
-
 
 # ============================================================================
 # REGRESSION TESTS: Ensure previously fixed bugs don't reoccur
@@ -641,32 +536,32 @@ class TestRunGameRegression:
 
         call_order = []
         
-        def track_flip():
-            call_order.append('flip')
+        def track_present():
+            call_order.append('present')
         
         def track_quit():
             call_order.append('quit')
             
-        mock_pygame.display.flip.side_effect = track_flip
+        mock_renderer_class.return_value.present.side_effect = track_present
         mock_pygame.quit.side_effect = track_quit
 
         # Execute
         run_game()
 
-        # Assert - flip should come before quit in call order
-        flip_index = call_order.index('flip')
+        # Assert - present should come before quit in call order
+        present_index = call_order.index('present')
         quit_index = call_order.index('quit')
-        assert flip_index < quit_index, "pygame.display.flip should be called before pygame.quit"
+        assert present_index < quit_index, "renderer.present should be called before pygame.quit"
 
     @patch('tetris.new_code.tetris_game.main.game.pygame')
     @patch('tetris.new_code.tetris_game.main.game.Renderer')
     @patch('tetris.new_code.tetris_game.main.game.Input')
     @patch('tetris.new_code.tetris_game.main.game.Config')
     @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
-    def test_regression_counter_exact_threshold(self, mock_state_manager_class, 
+    def test_regression_counter_left_to_game_state(self, mock_state_manager_class, 
                                                  mock_config_class, mock_input_class, 
                                                  mock_renderer_class, mock_pygame):
-        """Regression test: counter resets at exactly 100000, not before or after"""
+        """Regression test: run_game leaves the counter to the game state's simulation ticks"""
         # Setup
         mock_config = Mock()
         mock_config.window_width = 800
@@ -683,8 +578,9 @@ class TestRunGameRegression:
         # Execute
         run_game()
 
-        # Assert - counter should be exactly 0 (99999 + 1 = 100000 which triggers reset)
-        assert mock_config.counter == 0, "Counter should reset at > 100000"
+        # Assert - the frame doesn't move the counter, the game state's ticks do (and reset it
+        # past 100000, see test_simulation_clock.py)
+        assert mock_config.counter == 99999, "Counter should only move in simulation ticks"
 
     @patch('tetris.new_code.tetris_game.main.game.pygame')
     @patch('tetris.new_code.tetris_game.main.game.Renderer')
@@ -1038,7 +934,7 @@ class TestRunGameAcceptance:
     def test_acceptance_game_frame_is_updated_every_iteration(self, mock_state_manager_class, 
                                                                mock_config_class, mock_input_class, 
                                                                mock_renderer_class, mock_pygame):
-        """Acceptance: Game display is refreshed (flipped) every frame"""
+        """Acceptance: Game display is refreshed (presented) every frame"""
         # Setup
         mock_config = Mock()
         mock_config.window_width = 800
@@ -1056,8 +952,8 @@ class TestRunGameAcceptance:
         # Execute
         run_game()
 
-        # Assert - display should be flipped once per frame (51 times)
-        assert mock_pygame.display.flip.call_count == 51
+        # Assert - the frame should be presented once per frame (51 times)
+        assert mock_renderer_class.return_value.present.call_count == 51
 
     @patch('tetris.new_code.tetris_game.main.game.pygame')
     @patch('tetris.new_code.tetris_game.main.game.Renderer')
@@ -1093,32 +989,66 @@ class TestRunGameAcceptance:
         assert shutdown_clean, "Game should shut down gracefully"
         mock_pygame.quit.assert_called_once()
 
+
+# ============================================================================
+# RENDERER BACKENDS: picked at startup, the null one draws nothing
+# ============================================================================
+class TestRendererBackends:
+    """Tests for choosing the renderer backend in run_game"""
+
+    def test_unknown_backend_raises(self):
+        """Test that an unknown backend is refused before pygame starts"""
+        with patch('tetris.new_code.tetris_game.main.game.pygame') as mock_pygame:
+            with pytest.raises(ValueError):
+                run_game('opengl')
+        mock_pygame.init.assert_not_called()
+
+    @patch.dict(os.environ)
     @patch('tetris.new_code.tetris_game.main.game.pygame')
+    @patch('tetris.new_code.tetris_game.main.game.NullRenderer')
     @patch('tetris.new_code.tetris_game.main.game.Renderer')
     @patch('tetris.new_code.tetris_game.main.game.Input')
     @patch('tetris.new_code.tetris_game.main.game.Config')
     @patch('tetris.new_code.tetris_game.main.game.EnhancedStateManager')
-    def test_acceptance_game_tracks_score_progression(self, mock_state_manager_class, 
-                                                       mock_config_class, mock_input_class, 
-                                                       mock_renderer_class, mock_pygame):
-        """Acceptance: Game tracks player score/counter throughout gameplay"""
-        # Setup
-        mock_config = Mock()
-        mock_config.window_width = 800
-        mock_config.window_height = 600
-        mock_config.fps = 60
-        mock_config.counter = 0
-        mock_config.level = 10  # Player is at level 10
-
-        mock_config_class.return_value = mock_config
-
-        mock_state_manager_instance = Mock()
-        # 5 frames of gameplay
-        mock_state_manager_instance.update.side_effect = [True] * 5 + [False]
-        mock_state_manager_class.return_value = mock_state_manager_instance
+    def test_null_backend_from_environment(self, mock_state_manager_class, mock_config_class,
+                                           mock_input_class, mock_renderer_class,
+                                           mock_null_renderer_class, mock_pygame):
+        """Test that TETRIS_RENDERER=null starts the game on the NullRenderer with no window"""
+        os.environ['TETRIS_RENDERER'] = 'null'
+        mock_config_class.return_value.counter = 0
+        mock_config_class.return_value.level = 1
+        mock_screen = Mock()
+        mock_pygame.display.set_mode.return_value = mock_screen
+        mock_state_manager_class.return_value.update.return_value = False
 
-        # Execute
         run_game()
 
-        # Assert - counter should increment based on level (5 frames * level 10 = 50)
-        assert mock_config.counter == 50
+        mock_renderer_class.assert_not_called()
+        mock_null_renderer_class.assert_called_once_with(screen=mock_screen)
+        assert os.environ['SDL_VIDEODRIVER'] == 'dummy'
+        assert os.environ['SDL_AUDIODRIVER'] == 'dummy'
+        mock_state_manager_class.assert_called_once_with(
+            mock_config_class.return_value, mock_input_class.return_value,
+            mock_null_renderer_class.return_value)
+
+    @pytest.mark.parametrize('backend', ['null', 'offscreen'])
+    @patch.dict(os.environ, {'SDL_AUDIODRIVER': 'dummy'})
+    def test_real_states_run_without_a_window(self, backend):
+        """E2E: the real state machine takes a click from the menu to the gamemode screen"""
+        import pygame
+        config, renderer, state_manager = start_game(backend)
+        try:
+            config.replay_dir = None
+            config.play_sounds = False
+            assert isinstance(renderer, AbstractRenderer)
+            assert isinstance(renderer, NullRenderer) == (backend == 'null')
+
+            assert run_frame(config, renderer, state_manager)
+            start_button = state_manager.current_state.buttons[0]["rect"]
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=start_button.center))
+            assert run_frame(config, renderer, state_manager)
+            assert run_frame(config, renderer, state_manager)
+
+            assert state_manager.current_state_string == 'gamemode'
+        finally:
+            pygame.quit()
@@ -0,0 +1,315 @@
+"""
+Test suite for the headless simulation engine (simulation/headless_engine.py)
+
+The engine drives the real gamemodes without pygame, so these tests also
+cover the gamemode logic frame by frame.
+"""
+import pytest
+import random
+import sys
+import os
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tetris.new_code.tetris_game.game.piece.piece_action import PieceAction
+from tetris.new_code.tetris_game.gamemodes.classic import Classic
+from tetris.new_code.tetris_game.simulation.headless_engine import HeadlessEngine
+from tetris.new_code.tetris_game.simulation.headless_config import HeadlessConfig
+from tetris.new_code.tetris_game.simulation.policies import PolicyFactory, GreedyPolicy
+from tetris.new_code.tetris_game.simulation.batch_runner import BatchRunner, play_game
+from tetris.new_code.tetris_game.game.piece.piece import PIECE_TYPES
+from tetris.new_code.tetris_game.game.piece.piece_factory import PieceFactory
+from tetris.new_code.tetris_game.game.piece.piece_queue import PieceQueue
+from tetris.new_code.tetris_game.gamemodes.special_gamemode import Special
+
+
+CLASSIC = {'mode': 'classic', 'special_pieces': [], 'include_classic': True}
+SPECIAL = {'mode': 'special', 'special_pieces': ['rocket'], 'include_classic': True}
+
+ACTION_CYCLE = [
+    PieceAction.MOVE_LEFT,
+    None,
+    PieceAction.ROTATE_CLOCKWISE,
+    PieceAction.MOVE_RIGHT,
+    PieceAction.MOVE_RIGHT,
+    None,
+    PieceAction.HARD_DROP,
+]
+
+
+def play(engine, frames=3000):
+    """Play a fixed action cycle until game over or the frame limit"""
+    return engine.run((ACTION_CYCLE[i % len(ACTION_CYCLE)] for i in range(frames)))
+
+
+# ============================================================================
+# HEADLESS ENGINE
+# ============================================================================
+class TestHeadlessEngine:
+    """Tests for stepping the gamemodes without a display"""
+
+    def test_reset_starts_a_fresh_game(self):
+        """Test that reset gives an empty board and zeroed stats"""
+        engine = HeadlessEngine(CLASSIC, seed=1)
+        summary = engine.summary()
+
+        assert summary['score'] == 0
+        assert summary['lines'] == 0
+        assert summary['frames'] == 0
+        assert not engine.done
+
+    def test_gravity_moves_piece_without_input(self):
+        """Test that empty frames still move the piece down at the normal speed"""
+        engine = HeadlessEngine(CLASSIC, seed=1)
+        start_y = engine.gamemode.piece.yShift
+
+        for _ in range(engine.fps // 2):
+            engine.step(None)
+
+        assert engine.gamemode.piece.yShift == start_y + 1
+
+    def test_hard_drops_end_the_game(self):
+        """Test that stacking hard drops in one column reaches game over"""
+        engine = HeadlessEngine(CLASSIC, seed=3)
+
+        for _ in range(200):
+            if engine.step(PieceAction.HARD_DROP) == 'gameover':
+                break
+
+        assert engine.done
+        assert engine.summary()['gameover']
+        assert engine.step(PieceAction.HARD_DROP) == 'gameover'
+
+    @pytest.mark.parametrize("gamemode_config", [CLASSIC, SPECIAL])
+    def test_same_seed_same_game(self, gamemode_config):
+        """Test that a seed and an action stream always give the same result"""
+        first = play(HeadlessEngine(gamemode_config, seed=11))
+        second = play(HeadlessEngine(gamemode_config, seed=11))
+
+        assert first == second
+        assert first['blocks_placed'] > 0
+
+    @pytest.mark.parametrize("gamemode_config", [CLASSIC, SPECIAL])
+    def test_board_backends_play_the_same_game(self, gamemode_config):
+        """Test that the list board and the bitboard give the same game"""
+        with_list = play(HeadlessEngine(dict(gamemode_config, board='list'), seed=5))
+        with_bits = play(HeadlessEngine(dict(gamemode_config, board='bitboard'), seed=5))
+
+        assert with_list == with_bits
+
+    def test_vfx_pool_is_drained(self):
+        """Test that effects do not pile up when nothing renders them"""
+        engine = HeadlessEngine(CLASSIC, seed=2)
+        play(engine)
+
+        assert engine.gamemode.vfx_pool == []
+
+    def test_several_actions_in_one_frame(self):
+        """Test that a list of actions is played in order within a single frame"""
+        engine = HeadlessEngine(CLASSIC, seed=2)
+        x = engine.gamemode.piece.xShift
+
+        engine.step([PieceAction.MOVE_LEFT, PieceAction.MOVE_LEFT, PieceAction.HARD_DROP])
+
+        assert engine.frames == 1
+        assert engine.gamemode.blocks_placed == 1
+        assert any(engine.gamemode.board.field[19][j] for j in range(x - 2, x + 2))
+
+    def test_unknown_gamemode_raises(self):
+        """Test that a bad mode fails early"""
+        with pytest.raises(ValueError):
+            HeadlessEngine({'mode': 'marathon'})
+
+
+class TestSeededGames:
+    """Tests for the per game random streams"""
+
+    def piece_sequence(self, gamemode, count=20):
+        """Types and colors of the next count pieces the gamemode would spawn"""
+        factory = gamemode.piece_factory
+        pieces = [factory.create_random_piece(0, 0) for _ in range(count)]
+        return [(piece.type, piece.color) for piece in pieces]
+
+    def test_seed_from_constructor(self):
+        """Test that two gamemodes with the same seed spawn the same pieces"""
+        first = Classic(CLASSIC, HeadlessConfig(), seed=21)
+        second = Classic(CLASSIC, HeadlessConfig(), seed=21)
+
+        assert (first.piece.type, first.piece.color) == (second.piece.type, second.piece.color)
+        assert self.piece_sequence(first) == self.piece_sequence(second)
+
+    def test_interleaved_games_do_not_share_state(self):
+        """Test that drawing pieces in one game does not change another game's stream"""
+        alone = Classic(CLASSIC, HeadlessConfig(), seed=8)
+        expected = self.piece_sequence(alone)
+
+        first = Classic(CLASSIC, HeadlessConfig(), seed=8)
+        other = Classic(CLASSIC, HeadlessConfig(), seed=9)
+        interleaved = []
+        for _ in range(20):
+            self.piece_sequence(other, 3)
+            interleaved.extend(self.piece_sequence(first, 1))
+
+        assert interleaved == expected
+
+    def test_global_random_is_untouched(self):
+        """Test that games neither read nor reseed the random module"""
+        random.seed(1234)
+        expected = random.random()
+
+        random.seed(1234)
+        play(HeadlessEngine(CLASSIC, seed=3))
+
+        assert random.random() == expected
+
+    def test_restart_replays_the_seed(self):
+        """Test that restarting a seeded game gives the same pieces again"""
+        gamemode = Classic(CLASSIC, HeadlessConfig(), seed=30)
+        first = (gamemode.piece.type, gamemode.next_piece.type, gamemode.next_piece.color)
+
+        self.piece_sequence(gamemode)
+        gamemode.restart()
+
+        assert (gamemode.piece.type, gamemode.next_piece.type, gamemode.next_piece.color) == first
+
+
+# ============================================================================
+# RANDOMIZERS AND LOOKAHEAD
+# ============================================================================
+class TestRandomizers:
+    """Tests for the pluggable randomizers and the lookahead queue"""
+
+    def types(self, factory, count):
+        return [factory.create_random_piece(0, 0).type for _ in range(count)]
+
+    def test_bag_deals_every_piece_once_per_bag(self):
+        """Test that every 7 pieces from the bag randomizer hold each piece exactly once"""
+        factory = PieceFactory(dict(CLASSIC, randomizer='bag'), random.Random(4))
+        types = self.types(factory, 70)
+
+        for start in range(0, 70, 7):
+            assert sorted(types[start:start + 7]) == sorted(PIECE_TYPES)
+
+    def test_history_avoids_recent_pieces(self):
+        """Test that the history randomizer repeats a piece less often than uniform"""
+        uniform = self.types(PieceFactory(CLASSIC, random.Random(5)), 2000)
+        history = self.types(PieceFactory(dict(CLASSIC, randomizer='history'), random.Random(5)), 2000)
+
+        def repeats(types):
+            return sum(a == b for a, b in zip(types, types[1:]))
+
+        assert repeats(history) < repeats(uniform) / 4
+
+    def test_unknown_randomizer(self):
+        """Test that an unknown randomizer name raises ValueError"""
+        with pytest.raises(ValueError):
+            PieceFactory(dict(CLASSIC, randomizer='nope'), random.Random(0))
+
+    @pytest.mark.parametrize("randomizer", ['uniform', 'bag', 'history'])
+    def test_peek_does_not_change_the_sequence(self, randomizer):
+        """Test that looking ahead gives the pieces that spawn next, in order"""
+        config = dict(CLASSIC, randomizer=randomizer)
+        expected = PieceFactory(config, random.Random(6))
+        peeked = PieceFactory(config, random.Random(6))
+
+        preview = peeked.peek(5)
+        pieces = [peeked.create_random_piece(0, 0) for _ in range(5)]
+
+        assert preview == [(piece.type, piece.color) for piece in pieces]
+        assert [p.type for p in pieces] == self.types(expected, 5)
+
+    def test_queue_is_lazy(self):
+        """Test that the queue only pulls what has been peeked at from its stream"""
+        pulled = []
+
+        def stream():
+            count = 0
+            while True:
+                pulled.append(count)
+                yield count
+                count += 1
+
+        queue = PieceQueue(stream())
+        assert queue.peek(3) == [0, 1, 2]
+        assert len(pulled) == 3
+        assert queue.pop() == 0
+        assert queue.peek(1) == [1]
+        assert len(pulled) == 3
+
+    def test_rocket_follows_its_interval(self):
+        """Test that the rocket spawns exactly every interval-th piece in Special"""
+        factory = PieceFactory(SPECIAL, random.Random(7))
+        pieces = [factory.create_random_piece(0, 0) for _ in range(60)]
+
+        specials = [n for n, piece in enumerate(pieces, start=1) if piece.is_special]
+        assert specials == [15, 30, 45, 60]
+
+    def test_restart_restarts_the_schedule(self):
+        """Test that restarting a Special game starts the bag and the rocket schedule over"""
+        config = dict(SPECIAL, randomizer='bag')
+        gamemode = Special(config, HeadlessConfig(), seed=12)
+        first = gamemode.piece_factory.peek(20)
+
+        gamemode.piece_factory.create_random_piece(0, 0)
+        gamemode.restart()
+
+        assert gamemode.piece_factory.peek(20) == first
+
+
+class TestHeadlessConfig:
+    """Tests for the config stand in"""
+
+    def test_sounds_do_nothing(self):
+        """Test that the sound calls the gamemodes make are safe without a mixer"""
+        config = HeadlessConfig()
+
+        assert config.play_block_sound() is None
+        assert config.play_bomb_sound() is None
+
+
+# ============================================================================
+# POLICIES AND BATCH RUNNER
+# ============================================================================
+class TestPolicies:
+    """Tests for the policies that play the engine"""
+
+    def test_greedy_policy_clears_lines(self):
+        """Test that the greedy placement search plays a real game"""
+        engine = HeadlessEngine(CLASSIC, seed=4)
+        policy = GreedyPolicy(seed=4)
+
+        while not engine.done and engine.frames < 2000:
+            engine.step(policy.next_action(engine))
+
+        assert engine.summary()['lines'] >= 10
+
+    def test_unknown_policy_raises(self):
+        """Test that a bad policy name fails early"""
+        with pytest.raises(ValueError):
+            PolicyFactory.create_policy('perfect')
+
+
+class TestBatchRunner:
+    """Tests for running seeded games on a process pool"""
+
+    def test_play_game_is_reproducible(self):
+        """Test that a worker job gives the same summary for the same seed"""
+        job = (9, CLASSIC, 'random', 5000)
+        first = play_game(job)
+        second = play_game(job)
+
+        for key in ('seed', 'score', 'lines', 'blocks_placed', 'frames'):
+            assert first[key] == second[key]
+
+    def test_batch_streams_every_game(self):
+        """Test that every seeded game comes back to the parent and is aggregated"""
+        runner = BatchRunner(games=6, workers=2, policy='hard_drop', seed=100)
+        seen = []
+
+        stats = runner.run(seen.append)
+
+        assert sorted(summary['seed'] for summary in seen) == list(range(100, 106))
+        assert stats.games == 6
+        assert stats.blocks_placed == sum(summary['blocks_placed'] for summary in seen)
+        assert sum(games for games, busy in stats.workers.values()) == 6
@@ -0,0 +1,232 @@
+"""
+Tests for the frame profiler (profiling/frame_profiler.py) and where the game times its phases
+"""
+import csv
+import json
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tetris.new_code.tetris_game.profiling.frame_profiler import FrameProfiler, PHASES
+from tetris.new_code.tetris_game.main.game import start_game, run_frame
+
+
+def timed_frame(profiler, phases):
+    """One frame where each phase in phases is started and stopped once"""
+    profiler.begin_frame()
+    for phase in phases:
+        profiler.start(phase)
+        profiler.stop(phase)
+    profiler.end_frame()
+
+
+@pytest.fixture
+def clock(fake_time):
+    """perf_counter_ns moving on by 1000 ns every time it is read"""
+    fake = fake_time(start=0, step=1000)
+    with patch('tetris.new_code.tetris_game.profiling.frame_profiler.time.perf_counter_ns', fake):
+        yield fake
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+class TestFrameProfiler:
+    """Phases are timed per frame and kept for the rolling percentiles"""
+
+    def test_off_records_nothing(self, clock):
+        """Test that a profiler that is off doesn't read the clock or keep frames"""
+        profiler = FrameProfiler()
+        timed_frame(profiler, PHASES)
+
+        assert profiler.frames == 0
+        assert clock.now == 0
+        assert profiler.percentiles('frame') is None
+
+    def test_phase_timed_twice_adds_up(self, clock):
+        """Test that a phase started twice in one frame gets both times"""
+        profiler = FrameProfiler(enabled=True)
+        timed_frame(profiler, ['simulation', 'simulation', 'render'])
+
+        assert profiler.history['simulation'][-1] == 2000
+        assert profiler.history['render'][-1] == 1000
+        assert profiler.history['input'][-1] == 0
+        assert profiler.history['frame'][-1] == 7000
+
+    def test_percentiles_over_window(self):
+        """Test that the percentiles only cover the last window frames"""
+        profiler = FrameProfiler(window=100, enabled=True)
+        for ns in [10**9] * 50 + [k * 10**6 for k in range(1, 101)]:
+            profiler.history['render'].append(ns)
+
+        p50, p95, p99 = profiler.percentiles('render')
+        assert p50 == pytest.approx(50.5)
+        assert p95 == pytest.approx(95.05)
+        assert p99 == pytest.approx(99.01)
+
+    def test_toggle_cycles_overlay(self):
+        """Test that toggling goes off -> on -> overlay -> off"""
+        profiler = FrameProfiler()
+        states = []
+        for _ in range(4):
+            profiler.toggle()
+            states.append((profiler.enabled, profiler.overlay))
+        assert states == [(True, False), (True, True), (False, False), (True, False)]
+
+    def test_frame_turned_on_midway_is_skipped(self, clock):
+        """Test that the frame the profiler is switched on in isn't counted"""
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        profiler.toggle()
+        profiler.end_frame()
+        assert profiler.frames == 0
+
+        timed_frame(profiler, ['input'])
+        assert profiler.frames == 1
+
+    def test_summary_has_every_phase(self, clock):
+        """Test that the overlay lines name every phase and the whole frame"""
+        profiler = FrameProfiler(enabled=True)
+        timed_frame(profiler, PHASES)
+        lines = profiler.summary_lines()
+
+        assert len(lines) == len(PHASES) + 2
+        assert [line.split()[0] for line in lines[1:]] == list(PHASES) + ['frame']
+
+
+# ============================================================================
+# LOG FILES
+# ============================================================================
+class TestProfilerLog:
+    """Every frame can be written out for comparing runs"""
+
+    def test_csv_log(self, clock, tmp_path):
+        """Test that a .csv log has a header and one row per frame"""
+        path = str(tmp_path / 'frames.csv')
+        profiler = FrameProfiler(enabled=True)
+        profiler.log_to(path)
+        timed_frame(profiler, ['input'])
+        timed_frame(profiler, ['render', 'present'])
+        profiler.close()
+
+        with open(path, newline='') as log_file:
+            rows = list(csv.DictReader(log_file))
+        assert len(rows) == 2
+        assert rows[0]['input_ns'] == '1000' and rows[0]['render_ns'] == '0'
+        assert rows[1]['frame'] == '2' and rows[1]['present_ns'] == '1000'
+        assert int(rows[1]['frame_ns']) == 5000
+
+    def test_jsonl_log(self, clock, tmp_path):
+        """Test that a .jsonl log has one JSON object per frame"""
+        path = str(tmp_path / 'frames.jsonl')
+        profiler = FrameProfiler(enabled=True)
+        profiler.log_to(path)
+        timed_frame(profiler, ['simulation'])
+        profiler.close()
+
+        with open(path) as log_file:
+            rows = [json.loads(line) for line in log_file]
+        assert rows == [{'frame': 1, 'input_ns': 0, 'simulation_ns': 1000, 'render_ns': 0,
+                         'present_ns': 0, 'frame_ns': 3000, 'dropped': False, 'late_ns': 0}]
+
+    def test_log_has_pacing(self, clock, tmp_path):
+        """Test that dropped and late frames from the frame pacer are logged and counted"""
+        path = str(tmp_path / 'frames.csv')
+        profiler = FrameProfiler(enabled=True)
+        profiler.log_to(path)
+        timed_frame(profiler, [])
+        profiler.begin_frame()
+        profiler.pacing(True, 40000000)
+        profiler.end_frame()
+        profiler.close()
+
+        with open(path, newline='') as log_file:
+            rows = list(csv.DictReader(log_file))
+        assert [(row['dropped'], row['late_ns']) for row in rows] == [('0', '0'), ('1', '40000000')]
+        assert (profiler.dropped_frames, profiler.late_frames) == (1, 1)
+        assert profiler.summary_lines()[-1] == 'dropped 1  late 1'
+
+
+# ============================================================================
+# IN THE GAME
+# ============================================================================
+class TestGameProfiling:
+    """run_frame and the game state time their phases"""
+
+    @patch.dict(os.environ)
+    def test_game_frames_time_every_phase(self, tmp_path):
+        """E2E: frames played in game time input, simulation, render and present"""
+        import pygame
+        os.environ['TETRIS_PROFILE'] = str(tmp_path / 'frames.jsonl')
+        config, renderer, state_manager = start_game('offscreen')
+        try:
+            config.replay_dir = None
+            config.play_sounds = False
+            profiler = config.profiler
+            assert profiler.enabled
+
+            state_manager._change_state('game')
+            profiler.overlay = True
+            for _ in range(5):
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=config.get_control('move_left')))
+                run_frame(config, renderer, state_manager)
+
+            assert profiler.frames == 5
+            for phase in PHASES:
+                assert all(ns > 0 for ns in profiler.history[phase]), phase
+        finally:
+            config.profiler.close()
+            pygame.quit()
+
+        with open(tmp_path / 'frames.jsonl') as log_file:
+            assert len(log_file.readlines()) == 5
+
+    @patch.dict(os.environ, {'SDL_AUDIODRIVER': 'dummy'})
+    def test_overlay_over_menu_is_taken_down(self):
+        """E2E: the overlay turned on and off over the menu (drawn only once) leaves the menu as it was"""
+        import pygame
+        config, renderer, state_manager = start_game('offscreen')
+        try:
+            config.replay_dir = None
+            config.play_sounds = False
+            run_frame(config, renderer, state_manager)
+            menu = pygame.image.tobytes(renderer.screen, 'RGB')
+
+            config.profiler.toggle()
+            config.profiler.toggle()
+            for _ in range(5):
+                run_frame(config, renderer, state_manager)
+            assert pygame.image.tobytes(renderer.screen, 'RGB') != menu
+            assert not renderer._vfx_rects
+
+            config.profiler.toggle()
+            run_frame(config, renderer, state_manager)
+            assert state_manager.current_state_string == 'menu'
+            assert pygame.image.tobytes(renderer.screen, 'RGB') == menu
+        finally:
+            pygame.quit()
+
+    def test_f3_toggles_profiler(self):
+        """Test that F3 cycles the profiler instead of reaching the game"""
+        import pygame
+        from tetris.new_code.tetris_game.input.input import Input
+
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+        try:
+            config = Mock()
+            config.get_control.side_effect = lambda action: {'move_left': pygame.K_LEFT}.get(action, -1)
+            input = Input(config)
+
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3))
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+            actions = input.get_actions()
+        finally:
+            pygame.quit()
+
+        config.profiler.toggle.assert_called_once()
+        assert len(actions) == 1
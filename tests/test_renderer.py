@@ -0,0 +1,693 @@
+"""
+Test suite for the Renderer: dirty region drawing, background layer, assets, text and particles
+
+A frame drawn from the changes since the last one has to end up with exactly the
+pixels of a frame drawn from scratch, while only handing the changed rects to the
+display.
+"""
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame
+
+from tetris.new_code.tetris_game.game.board import Board
+from tetris.new_code.tetris_game.game.piece.piece import Piece
+from tetris.new_code.tetris_game.game.piece.special_pieces.rocket_piece import RocketPiece
+from tetris.new_code.tetris_game.main.constants import GRAY, LIGHT_BROWN, DARK_BROWN
+from tetris.new_code.tetris_game.ui.renderer import Renderer, xStart, yStart, block_pixel_size
+from tetris.new_code.tetris_game.ui.asset_manager import AssetManager, BLOCK_IMAGES
+from tetris.new_code.tetris_game.ui.text_cache import TextCache
+from tetris.new_code.tetris_game.ui.particle_system import ParticleSystem, ParticleLOD
+
+
+WINDOW_SIZE = (400, 500)
+
+
+@pytest.fixture(autouse=True)
+def pygame_display():
+    pygame.init()
+    pygame.display.set_mode(WINDOW_SIZE)
+    yield
+    pygame.quit()
+
+
+def new_renderer():
+    return Renderer(screen=pygame.Surface(WINDOW_SIZE))
+
+
+def draw_frame(renderer, board, piece, next_piece, score=0, level=1):
+    """Everything Game.draw renders in one frame"""
+    renderer.render_board(board)
+    renderer.draw_piece(piece)
+    renderer.draw_score(score)
+    renderer.draw_level(level)
+    renderer.draw_next_piece(next_piece)
+    renderer.update_vfx()
+    renderer.draw_vfx()
+
+
+def pixels(renderer):
+    return pygame.image.tobytes(renderer.screen, 'RGB')
+
+
+def repainted(board, piece, next_piece, score=0, level=1):
+    """The same frame drawn by a renderer that has never drawn anything"""
+    renderer = new_renderer()
+    draw_frame(renderer, board, piece, next_piece, score, level)
+    return pixels(renderer)
+
+
+def cell_rect(x, y):
+    return pygame.Rect(xStart + block_pixel_size * x, yStart + block_pixel_size * y,
+                       block_pixel_size, block_pixel_size)
+
+
+def present(renderer):
+    """Calls present and returns what it handed to the display, None for a full flip"""
+    with patch('tetris.new_code.tetris_game.ui.renderer.pygame.display') as display:
+        renderer.present()
+    if display.flip.called:
+        return None
+    if not display.update.called:
+        return []
+    rects = display.update.call_args[0][0]
+    return rects if isinstance(rects, list) else [rects]
+
+
+# ============================================================================
+# DIRTY REGIONS
+# ============================================================================
+class TestDirtyRegions:
+    """Only what changed is drawn and presented"""
+
+    def setup_method(self):
+        self.board = Board(20, 10)
+        self.piece = Piece(3, 0, piece_type='O', piece_color=2)
+        self.next_piece = Piece(3, 0, piece_type='T', piece_color=4)
+
+    def test_first_frame_is_flipped_whole(self):
+        """Test that the first frame repaints and flips the whole display"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+
+        assert present(renderer) is None
+
+    def test_unchanged_frame_updates_nothing(self):
+        """Test that a frame with nothing new does not touch the display"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        present(renderer)
+
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        assert present(renderer) == []
+
+    def test_board_change_updates_only_that_cell(self):
+        """Test that a changed board cell is the only rect updated"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        present(renderer)
+
+        self.board.field[19][0] = 3
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        assert present(renderer) == [cell_rect(0, 19)]
+
+    def test_moving_piece_updates_old_and_new_cells(self):
+        """Test that a piece moving down updates the cells it left and the ones it covers"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        present(renderer)
+
+        self.piece.yShift += 1
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+
+        # The O piece covers columns 4-5, it left row 0 and moved into row 2
+        rects = present(renderer)
+        assert set(map(tuple, rects)) == {tuple(cell_rect(x, y)) for x in (4, 5) for y in (0, 1, 2)}
+
+    def test_score_change_updates_score_field(self):
+        """Test that a new score only updates the score field"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece, score=0)
+        present(renderer)
+
+        draw_frame(renderer, self.board, self.piece, self.next_piece, score=100)
+        assert present(renderer) == [renderer._hud_areas['score']]
+
+    def test_clear_flips_whole_display_again(self):
+        """Test that clearing for a menu makes the next frame a full repaint"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        present(renderer)
+
+        renderer.clear()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        assert present(renderer) is None
+
+    def test_many_rects_are_merged(self):
+        """Test that a frame with lots of changes is updated as one bounding rect"""
+        renderer = new_renderer()
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+        present(renderer)
+
+        for x in range(10):
+            for y in range(10, 20):
+                self.board.field[y][x] = 1
+        draw_frame(renderer, self.board, self.piece, self.next_piece)
+
+        rects = present(renderer)
+        assert len(rects) == 1
+        assert rects[0].contains(cell_rect(0, 10).union(cell_rect(9, 19)))
+
+
+# ============================================================================
+# SAME PIXELS AS A FULL REPAINT
+# ============================================================================
+class TestIncrementalMatchesRepaint:
+    """Drawing only the changes leaves the screen as a full repaint would"""
+
+    def setup_method(self):
+        self.board = Board(20, 10)
+        self.next_piece = Piece(3, 0, piece_type='I', piece_color=1)
+
+    def test_piece_falling_and_landing(self):
+        """Test that a piece falling, landing and a new score match a repaint"""
+        renderer = new_renderer()
+        piece = Piece(3, 0, piece_type='T', piece_color=5)
+
+        for _ in range(18):
+            draw_frame(renderer, self.board, piece, self.next_piece)
+            piece.yShift += 1
+        piece.yShift -= 1
+        self.board.freeze_piece(piece)
+
+        piece = Piece(3, 0, piece_type='L', piece_color=2)
+        draw_frame(renderer, self.board, piece, self.next_piece, score=40, level=2)
+
+        assert pixels(renderer) == repainted(self.board, piece, self.next_piece, score=40, level=2)
+
+    def test_profiler_overlay_is_put_back(self):
+        """Test that the frame after the profiler overlay matches a repaint"""
+        renderer = new_renderer()
+        piece = Piece(3, 0, piece_type='T', piece_color=5)
+        self.board.field[19] = [1] * 9 + [0]
+
+        draw_frame(renderer, self.board, piece, self.next_piece)
+        renderer.draw_overlay(['ms         p50   p95   p99', 'render      0.10  0.20  0.30'] * 4)
+        assert renderer._overlay_rect
+
+        draw_frame(renderer, self.board, piece, self.next_piece)
+        assert pixels(renderer) == repainted(self.board, piece, self.next_piece)
+
+    def test_special_piece(self):
+        """Test that the rocket moving sideways matches a repaint"""
+        renderer = new_renderer()
+        piece = RocketPiece(3, 0)
+
+        draw_frame(renderer, self.board, piece, self.next_piece)
+        piece.xShift += 1
+        piece.yShift += 2
+        draw_frame(renderer, self.board, piece, self.next_piece)
+
+        assert pixels(renderer) == repainted(self.board, piece, self.next_piece)
+
+    def test_special_next_piece(self):
+        """Test that the rocket's preview, which is taller than its box, is cleared when it leaves"""
+        renderer = new_renderer()
+        piece = Piece(3, 0, piece_type='T', piece_color=5)
+
+        draw_frame(renderer, self.board, piece, RocketPiece(3, 0))
+        draw_frame(renderer, self.board, piece, self.next_piece)
+
+        assert pixels(renderer) == repainted(self.board, piece, self.next_piece)
+
+    @pytest.mark.parametrize("vfx", [
+        ('line_clear', {'line_y': 19, 'board_width': 10}),
+        ('column_flame', {'column_x': 9, 'board_height': 20}),
+    ])
+    def test_particles_leave_nothing_behind(self, vfx):
+        """Test that once the particles are gone the screen matches a repaint"""
+        renderer = new_renderer()
+        piece = Piece(3, 0, piece_type='S', piece_color=3)
+        draw_frame(renderer, self.board, piece, self.next_piece)
+
+        vfx_type, params = vfx
+        renderer.handle_vfx_pool([dict(type=vfx_type, **params)])
+        for _ in range(100):
+            draw_frame(renderer, self.board, piece, self.next_piece)
+        assert not renderer.particles and not renderer.column_flame_particles
+
+        draw_frame(renderer, self.board, piece, self.next_piece)
+        assert pixels(renderer) == repainted(self.board, piece, self.next_piece)
+
+
+# ============================================================================
+# BACKGROUND LAYER
+# ============================================================================
+class TestBackgroundLayer:
+    """The static background is built once per board and window size"""
+
+    def setup_method(self):
+        self.piece = Piece(3, 0, piece_type='O', piece_color=2)
+        self.next_piece = Piece(3, 0, piece_type='T', piece_color=4)
+
+    def test_background_is_reused_between_frames(self):
+        """Test that drawing frames and menus does not rebuild the background"""
+        renderer = new_renderer()
+        board = Board(20, 10)
+        draw_frame(renderer, board, self.piece, self.next_piece)
+        background = renderer._background
+
+        renderer.clear()
+        for _ in range(3):
+            draw_frame(renderer, board, self.piece, self.next_piece)
+        assert renderer._background is background
+
+    def test_background_is_rebuilt_for_new_board_size(self):
+        """Test that a board of another size gets its own background"""
+        renderer = new_renderer()
+        draw_frame(renderer, Board(20, 10), self.piece, self.next_piece)
+        background = renderer._background
+
+        draw_frame(renderer, Board(18, 10), self.piece, self.next_piece)
+        assert renderer._background is not background
+        assert present(renderer) is None
+
+    def test_background_is_rebuilt_for_new_window_size(self):
+        """Test that a resized screen gets a background of its size"""
+        renderer = new_renderer()
+        board = Board(20, 10)
+        draw_frame(renderer, board, self.piece, self.next_piece)
+
+        renderer.screen = pygame.Surface((500, 600))
+        draw_frame(renderer, board, self.piece, self.next_piece)
+        assert renderer._background.get_size() == (500, 600)
+
+    def test_background_holds_grid_and_labels(self):
+        """Test that an empty board frame is the background plus the HUD values"""
+        renderer = new_renderer()
+        board = Board(20, 10)
+        draw_frame(renderer, board, self.piece, self.next_piece)
+
+        # Grid line and inside of an empty cell come straight from the background
+        x, y = cell_rect(0, 19).topleft
+        assert renderer._background.get_at((x, y))[:3] == GRAY
+        assert renderer._background.get_at((x + 5, y + 5))[:3] == LIGHT_BROWN
+        assert renderer.screen.get_at((x, y)) == renderer._background.get_at((x, y))
+
+
+# ============================================================================
+# ASSETS
+# ============================================================================
+class TestAssetManager:
+    """Images are loaded once, converted and packed into an atlas"""
+
+    def test_image_is_loaded_once(self):
+        """Test that asking for an image twice returns the same surface"""
+        assets = AssetManager()
+        assert assets.image('block1.png') is assets.image('block1.png')
+
+    def test_missing_image_is_none(self):
+        """Test that a file that does not exist gives None"""
+        assert AssetManager().image('no_such_block.png') is None
+
+    def test_images_are_in_display_format(self):
+        """Test that loaded images have the display's pixel layout"""
+        image = AssetManager().image('block1.png')
+        display_masks = pygame.display.get_surface().get_masks()
+        assert image.get_masks()[:3] == display_masks[:3]
+
+    def test_atlas_has_every_block(self):
+        """Test that the atlas holds a tile for every block image and the special block"""
+        atlas = AssetManager().block_atlas(block_pixel_size)
+
+        for color_index in BLOCK_IMAGES:
+            assert atlas.rects[color_index].size == (block_pixel_size - 2, block_pixel_size - 2)
+        assert atlas.rects['special'].size == (block_pixel_size * 3 - 2, block_pixel_size * 6 - 2)
+
+        rects = list(atlas.rects.values())
+        assert not any(a.colliderect(b) for k, a in enumerate(rects) for b in rects[k + 1:])
+
+    def test_atlas_tile_matches_scaled_image(self):
+        """Test that blitting a tile from the atlas gives the scaled image"""
+        assets = AssetManager()
+        atlas = assets.block_atlas(block_pixel_size)
+        size = (block_pixel_size - 2, block_pixel_size - 2)
+        expected = pygame.transform.scale(assets.image('block3.png'), size)
+
+        assert pygame.image.tobytes(atlas.tile(3), 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+    def test_atlas_is_built_once_per_size(self):
+        """Test that renderers sharing an asset manager share the atlas"""
+        assets = AssetManager()
+        first = Renderer(screen=pygame.Surface(WINDOW_SIZE), assets=assets)
+        second = Renderer(screen=pygame.Surface(WINDOW_SIZE), assets=assets)
+        assert first.block_atlas is second.block_atlas
+
+
+# ============================================================================
+# SCALED SPRITE CACHE
+# ============================================================================
+class TestScaledSprites:
+    """Preview images are scaled once per image and size"""
+
+    def test_scaled_image_is_cached(self):
+        """Test that the same image at the same size is only scaled once"""
+        assets = AssetManager()
+        assert assets.scaled('block2.png', (13, 13)) is assets.scaled('block2.png', (13, 13))
+        assert assets.scaled('block2.png', (10, 10)).get_size() == (10, 10)
+
+    def test_preview_does_not_rescale_every_frame(self):
+        """Test that drawing many next pieces scales each block image once"""
+        renderer = new_renderer()
+        board = Board(20, 10)
+        piece = Piece(3, 0, piece_type='O', piece_color=2)
+
+        with patch('tetris.new_code.tetris_game.ui.asset_manager.pygame.transform.scale',
+                   wraps=pygame.transform.scale) as scale:
+            for k in range(30):
+                next_piece = RocketPiece(3, 0) if k % 5 == 0 else Piece(3, 0, piece_type='T', piece_color=k % 6 + 1)
+                draw_frame(renderer, board, piece, next_piece)
+
+        # Six block colors and the rocket
+        assert scale.call_count == 7
+
+    def test_block_size_change_evicts_scaled_images(self):
+        """Test that a new block size drops the scaled images and rebuilds the tiles"""
+        renderer = new_renderer()
+        board = Board(20, 10)
+        piece = Piece(3, 0, piece_type='O', piece_color=2)
+        draw_frame(renderer, board, piece, piece)
+        assert renderer.assets._scaled
+
+        renderer.block_pixel_size = 16
+        renderer.render_board(board)
+        assert not renderer.assets._scaled
+        assert renderer.block_images[1].get_size() == (14, 14)
+        assert present(renderer) is None
+
+    def test_theme_change_reloads_images(self, tmp_path):
+        """Test that switching the image directory drops everything loaded from the old one"""
+        assets = AssetManager()
+        assets.scaled('block1.png', (13, 13))
+
+        assets.set_theme(str(tmp_path))
+        assert assets.image('block1.png') is None
+        assert assets.scaled('block1.png', (13, 13)) is None
+
+
+# ============================================================================
+# TEXT CACHE
+# ============================================================================
+class TestTextCache:
+    """Fonts are resolved once and rendered strings are reused"""
+
+    def test_font_is_resolved_once(self):
+        """Test that the same font asked for twice is looked up once"""
+        text = TextCache()
+        with patch('tetris.new_code.tetris_game.ui.text_cache.pygame.font.SysFont',
+                   wraps=pygame.font.SysFont) as sys_font:
+            first = text.font('Comic Sans', 25, True, False)
+            second = text.font('Comic Sans', 25, True, False)
+            text.font('Comic Sans', 18, False, False)
+
+        assert first is second
+        assert sys_font.call_count == 2
+
+    def test_default_font(self):
+        """Test that no name gives pygame's default font"""
+        text = TextCache()
+        assert text.font(None, 28) is text.font(None, 28)
+
+    def test_renderer_shares_its_font(self):
+        """Test that states asking the renderer's cache get the renderer's own font"""
+        renderer = new_renderer()
+        assert renderer.text.font('Comic Sans', 25, True, False) is renderer.font
+
+    def test_render_is_cached(self):
+        """Test that rendering the same string again returns the same surface"""
+        text = TextCache()
+        font = text.font(None, 28)
+
+        first = text.render(font, 'SCORE', True, (0, 0, 0))
+        assert text.render(font, 'SCORE', True, (0, 0, 0)) is first
+        assert (text.hits, text.misses) == (1, 1)
+
+    @pytest.mark.parametrize("change", [
+        {'text': 'NEXT'},
+        {'color': (255, 0, 0)},
+        {'antialias': False},
+    ])
+    def test_render_key(self, change):
+        """Test that a different string, color or antialiasing is rendered on its own"""
+        text = TextCache()
+        font = text.font(None, 28)
+        args = dict({'text': 'SCORE', 'antialias': True, 'color': (0, 0, 0)}, **change)
+
+        first = text.render(font, 'SCORE', True, (0, 0, 0))
+        assert text.render(font, args['text'], args['antialias'], args['color']) is not first
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache keeps max_entries strings and drops the oldest unused one"""
+        text = TextCache(max_entries=3)
+        font = text.font(None, 28)
+
+        kept = text.render(font, '0', True, (0, 0, 0))
+        for score in ('100', '200'):
+            text.render(font, score, True, (0, 0, 0))
+        text.render(font, '0', True, (0, 0, 0))      # '0' used again
+        text.render(font, '300', True, (0, 0, 0))    # '100' goes
+
+        assert len(text) == 3
+        assert text.render(font, '0', True, (0, 0, 0)) is kept
+        misses = text.misses
+        text.render(font, '100', True, (0, 0, 0))
+        assert text.misses == misses + 1
+
+
+# ============================================================================
+# PARTICLES
+# ============================================================================
+class TestParticleSystem:
+    """Particles kept as arrays move, fade and expire like the old dict particles"""
+
+    def emit(self, system, particles):
+        """particles: (x, y, vx, vy, lifetime, size, age) rows"""
+        x, y, vx, vy, lifetime, size, age = zip(*particles)
+        system.emit(x, y, vx, vy, [(200, 100, 50)] * len(particles), lifetime, size, age=list(age))
+
+    def test_update_matches_dict_particles(self):
+        """Test that position and velocity follow the old per particle update"""
+        system = ParticleSystem(gravity=0.2)
+        self.emit(system, [(10.0, 20.0, 1.5, -2.0, 30, 4, 0)])
+
+        x, y, vx, vy = 10.0, 20.0, 1.5, -2.0
+        for _ in range(5):
+            system.update()
+            x += vx
+            y += vy
+            vy += 0.2
+
+        assert system.position[0].tolist() == [x, y]
+        assert system.velocity[0].tolist() == [vx, vy]
+        assert system.age[0] == 5
+
+    def test_expired_particles_are_compacted(self):
+        """Test that expired particles are dropped and the rest keep their order"""
+        system = ParticleSystem(gravity=0)
+        self.emit(system, [(k, 0, 0, 0, lifetime, 3, 0) for k, lifetime in enumerate((5, 2, 9, 2, 7))])
+
+        for _ in range(2):
+            system.update()
+
+        assert len(system) == 3
+        assert system.position[:3, 0].tolist() == [0, 2, 4]
+
+        for _ in range(10):
+            system.update()
+        assert len(system) == 0
+
+    def test_waiting_particles_do_not_move_or_draw(self):
+        """Test that a particle with a negative age waits in place and is not drawn"""
+        system = ParticleSystem(gravity=0.15, fade_size=True)
+        self.emit(system, [(50, 50, 1, 1, 30, 5, -3), (80, 80, 1, 1, 30, 5, 0)])
+        surface = pygame.Surface((200, 200))
+
+        system.update()
+        assert system.position[0].tolist() == [50, 50]
+        assert system.position[1].tolist() == [81, 81]
+        assert len(system.draw(surface)) == 1
+
+    def test_fading(self):
+        """Test that color fades with age and size too when fade_size is set"""
+        surface = pygame.Surface((200, 200))
+        for fade_size, radius in ((False, 6), (True, 3)):
+            system = ParticleSystem(gravity=0, fade_size=fade_size)
+            self.emit(system, [(100, 100, 0, 0, 10, 6, 5)])
+
+            rect, = system.draw(surface)
+            assert rect.width == 2 * radius
+            assert surface.get_at((100, 100))[:3] == (100, 50, 25)
+
+    def test_drawn_part_way_to_next_update(self):
+        """Test that alpha draws a particle that far along its velocity, without moving it"""
+        system = ParticleSystem(gravity=0)
+        self.emit(system, [(100.0, 100.0, 8.0, -4.0, 10, 3, 0)])
+        surface = pygame.Surface((200, 200))
+
+        rect, = system.draw(surface, 0.5)
+        assert rect.center == (104, 98)
+        assert system.position[0].tolist() == [100.0, 100.0]
+
+    def test_full_pool_drops_the_rest(self):
+        """Test that a full pool keeps what fits, counts the rest and reuses expired slots"""
+        system = ParticleSystem(gravity=0, capacity=4)
+        self.emit(system, [(k, k, 0, 0, 1, 3, 0) for k in range(3)])
+        self.emit(system, [(k, k, 0, 0, 10, 3, 0) for k in range(3, 10)])
+
+        assert len(system) == 4
+        assert system.capacity == 4
+        assert system.dropped == 6
+        assert system.position[:4, 0].tolist() == [0, 1, 2, 3]
+
+        system.update()
+        self.emit(system, [(k, k, 0, 0, 10, 3, 0) for k in range(10, 15)])
+
+        assert len(system) == 4
+        assert system.dropped == 8
+        assert system.position[:4, 0].tolist() == [3, 10, 11, 12]
+
+
+class TestParticleLOD:
+    """Effects emit fewer, smaller particles while frames run over budget"""
+
+    def test_full_detail_within_budget(self):
+        """Test that frames within the budget keep every particle at full size"""
+        lod = ParticleLOD(budget=0.016)
+        for _ in range(10):
+            lod.frame(0.005)
+
+        assert lod.level == 1.0
+        assert lod.count(50) == 50
+        assert lod.size_scale == 1.0
+
+    def test_slow_frames_lower_the_level(self):
+        """Test that slow frames lower the level down to min_level"""
+        lod = ParticleLOD(budget=0.016, min_level=0.25)
+        lod.frame(0.05)
+        assert lod.level < 1.0
+        assert lod.count(50) < 50
+        assert lod.size_scale < 1.0
+
+        for _ in range(100):
+            lod.frame(0.05)
+        assert lod.level == 0.25
+        assert lod.count(40) == 10
+        assert lod.count(1) == 1
+        assert lod.count(0) == 0
+
+    def test_recovers_once_frames_are_fast(self):
+        """Test that the level climbs back to full detail once frames are fast"""
+        lod = ParticleLOD(budget=0.016)
+        for _ in range(20):
+            lod.frame(0.05)
+        low = lod.level
+
+        for _ in range(200):
+            lod.frame(0.002)
+        assert low < lod.level == 1.0
+
+    def test_renderer_emits_less_under_load(self):
+        """Test that the renderer's effects follow the LOD level"""
+        renderer = new_renderer()
+        renderer.create_line_clear_particles(5, 10)
+        assert len(renderer.particles) == 50
+
+        renderer.particles.clear()
+        renderer.particle_lod.level = 0.5
+        renderer.create_line_clear_particles(5, 10)
+        renderer.create_column_flame_effect(3, 20)
+        assert len(renderer.particles) == 25
+        assert len(renderer.column_flame_particles) == 20
+        assert renderer.particles.size[:25].max() <= 5 * renderer.particle_lod.size_scale
+
+
+# ============================================================================
+# OVERLAYS AND MENUS
+# ============================================================================
+class TestOverlays:
+    """The flash and the menu screens are drawn once and reused"""
+
+    BUTTONS = [
+        {"label": "Start", "rect": pygame.Rect(100, 150, 200, 50)},
+        {"label": "Quit", "rect": pygame.Rect(100, 220, 200, 50)},
+    ]
+
+    def test_flash_reuses_its_surface(self):
+        """Test that a flash over several frames draws its overlay once"""
+        renderer = new_renderer()
+        renderer.screen_flash_alpha = 150
+        with patch('tetris.new_code.tetris_game.ui.overlay.pygame.Surface',
+                   wraps=pygame.Surface) as surface:
+            for _ in range(5):
+                renderer.draw_screen_flash()
+        assert surface.call_count == 1
+        assert renderer.overlays.builds == 1
+
+    def test_flash_blends_red_over_the_scene(self):
+        """Test that the reused overlay still blends with the current alpha"""
+        renderer = new_renderer()
+        renderer.screen.fill((0, 0, 0))
+        renderer.screen_flash_alpha = 128
+        renderer.draw_screen_flash()
+        red, green, blue, _ = renderer.screen.get_at((0, 0))
+        assert 120 <= red <= 136 and green == blue == 0
+
+        renderer.screen.fill((0, 0, 0))
+        renderer.screen_flash_alpha = 255
+        renderer.draw_screen_flash()
+        assert renderer.screen.get_at((0, 0))[:3] == (255, 0, 0)
+
+    def test_new_window_size_redraws_the_layers(self):
+        """Test that the layers are drawn again after the window changes size"""
+        overlays = new_renderer().overlays
+        first = overlays.solid('flash', (400, 500), (255, 0, 0))
+        assert overlays.solid('flash', (400, 500), (255, 0, 0)) is first
+
+        resized = overlays.solid('flash', (600, 500), (255, 0, 0))
+        assert resized.get_size() == (600, 500)
+        assert overlays.builds == 2
+        assert len(overlays) == 1
+
+    def test_menu_is_presented_with_one_flip(self):
+        """Test that drawing the buttons never flips and present flips once"""
+        renderer = new_renderer()
+        renderer.clear()
+        with patch('tetris.new_code.tetris_game.ui.renderer.pygame.display') as display:
+            renderer.render_menu(self.BUTTONS)
+            assert not display.flip.called
+            renderer.present()
+        assert display.flip.call_count == 1
+
+    def test_menu_matches_drawing_on_screen(self):
+        """Test that the composed menu has the same pixels as drawing the buttons directly"""
+        renderer = new_renderer()
+        renderer.render_menu(self.BUTTONS)
+        renderer.render_pause(self.BUTTONS)
+
+        expected = pygame.Surface(WINDOW_SIZE)
+        expected.fill(LIGHT_BROWN)
+        for button in self.BUTTONS:
+            pygame.draw.rect(expected, DARK_BROWN, button["rect"])
+            text = renderer.font.render(button["label"], True, (255, 255, 255))
+            expected.blit(text, text.get_rect(center=button["rect"].center))
+
+        assert pixels(renderer) == pygame.image.tobytes(expected, 'RGB')
+        assert renderer.overlays.builds == 1
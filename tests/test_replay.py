@@ -0,0 +1,423 @@
+"""
+Test suite for replays (replay/replay_format.py, replay/replay_recorder.py,
+replay/replay_player.py, replay/keyframe.py)
+
+Games are played on the headless engine with a recorder attached and the
+recording is read back with Replay.from_bytes.
+"""
+import pytest
+import io
+import sys
+import os
+from unittest.mock import patch
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tetris.new_code.tetris_game.game.piece.piece_action import PieceAction
+from tetris.new_code.tetris_game.replay import replay_format as fmt
+from tetris.new_code.tetris_game.replay.replay_format import Replay, ReplayResult
+from tetris.new_code.tetris_game.replay.replay_recorder import ReplayRecorder
+from tetris.new_code.tetris_game.replay.replay_player import ReplayPlayer, main as replay_main
+from tetris.new_code.tetris_game.replay.keyframe import Keyframe
+from tetris.new_code.tetris_game.simulation.headless_engine import HeadlessEngine
+from tetris.new_code.tetris_game.simulation.policies import GreedyPolicy
+
+
+CLASSIC = {'mode': 'classic', 'special_pieces': [], 'include_classic': True}
+SPECIAL = {'mode': 'special', 'special_pieces': ['rocket'], 'include_classic': True}
+
+
+class CountingStream(io.BytesIO):
+    """BytesIO that counts how often it is written to"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def record_game(gamemode_config=CLASSIC, seed=5, frames=3000, stream=None, **recorder_args):
+    """Play a greedy game with a recorder attached, returns the engine and the recorded bytes"""
+    stream = stream if stream is not None else io.BytesIO()
+    engine = HeadlessEngine(gamemode_config, seed=seed)
+    policy = GreedyPolicy(seed)
+    engine.gamemode.attach_recorder(ReplayRecorder(stream, **recorder_args))
+
+    for frame in range(frames):
+        if engine.done:
+            break
+        action = policy.next_action(engine) if frame % 3 == 0 else None
+        engine.step(action, pressing_down=(frame // 50) % 4 == 0)
+
+    engine.gamemode.detach_recorder(engine.done)
+    return engine, stream.getvalue()
+
+
+# ============================================================================
+# FORMAT
+# ============================================================================
+class TestReplayFormat:
+    """Tests for the varint and header encoding"""
+
+    @pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 32 - 1, 2 ** 63])
+    def test_varint_round_trip(self, value):
+        """Test that every value reads back the same"""
+        out = bytearray()
+        fmt.write_varint(out, value)
+
+        assert fmt.read_varint(out, 0) == (value, len(out))
+
+    def test_small_values_take_one_byte(self):
+        """Test that values under 128 are a single byte"""
+        out = bytearray()
+        fmt.write_varint(out, 127)
+
+        assert len(out) == 1
+
+    def test_rejects_other_files(self):
+        """Test that loading something that is not a replay raises ValueError"""
+        with pytest.raises(ValueError):
+            Replay.from_bytes(b'not a replay at all')
+
+    def test_every_action_has_a_code(self):
+        """Test that the action codes stay clear of the frame event codes"""
+        assert sorted(fmt.ACTION_CODES.values()) == list(range(len(PieceAction)))
+        assert len(PieceAction) <= fmt.DOWN_PRESSED
+
+
+# ============================================================================
+# RECORDER
+# ============================================================================
+class TestReplayRecorder:
+    """Tests for recording games"""
+
+    @pytest.mark.parametrize("gamemode_config", [CLASSIC, SPECIAL])
+    def test_header_round_trip(self, gamemode_config):
+        """Test that the recording keeps the gamemode config, seed and fps"""
+        engine, data = record_game(gamemode_config, seed=17, frames=200)
+        replay = Replay.from_bytes(data)
+
+        assert replay.gamemode_config == gamemode_config
+        assert replay.seed == 17
+        assert replay.fps == engine.config.fps
+        assert replay.last_move_counter == 0
+
+    def test_result_matches_the_game(self):
+        """Test that the end record holds the final score, lines, blocks and board"""
+        engine, data = record_game(frames=20000)
+        replay = Replay.from_bytes(data)
+
+        assert replay.result == ReplayResult.from_gamemode(engine.gamemode, engine.done)
+        assert replay.ticks == engine.frames
+
+    def test_actions_are_recorded_in_order(self):
+        """Test that every action lands on the frame it was played"""
+        stream = io.BytesIO()
+        engine = HeadlessEngine(CLASSIC, seed=2)
+        engine.gamemode.attach_recorder(ReplayRecorder(stream))
+        played = [PieceAction.MOVE_LEFT, None, None, PieceAction.ROTATE_CLOCKWISE, PieceAction.HARD_DROP]
+        for action in played:
+            engine.step(action)
+        engine.gamemode.detach_recorder(gameover=False)
+
+        replay = Replay.from_bytes(stream.getvalue())
+        actions = [(tick, fmt.ACTIONS[code]) for tick, code, _ in replay.events if code < fmt.DOWN_PRESSED]
+
+        assert actions == [(1, PieceAction.MOVE_LEFT), (4, PieceAction.ROTATE_CLOCKWISE), (5, PieceAction.HARD_DROP)]
+        assert replay.result.gameover is False
+
+    def test_counter_only_stored_when_it_jumps(self):
+        """Test that the counter is stored on the first frame and after a jump, not every frame"""
+        stream = io.BytesIO()
+        engine = HeadlessEngine(CLASSIC, seed=2)
+        engine.gamemode.attach_recorder(ReplayRecorder(stream))
+        for _ in range(10):
+            engine.step()
+        engine.config.counter = 0       # what the game loop does when the counter wraps
+        for _ in range(10):
+            engine.step()
+        engine.gamemode.detach_recorder(gameover=False)
+
+        replay = Replay.from_bytes(stream.getvalue())
+        counters = [(tick, value) for tick, code, value in replay.events if code == fmt.COUNTER]
+
+        assert counters == [(1, 1), (11, 1)]
+
+    def test_down_key_changes_are_recorded(self):
+        """Test that holding and releasing the down key are events"""
+        _, data = record_game(frames=400)
+        codes = [code for _, code, _ in Replay.from_bytes(data).events]
+
+        assert codes.count(fmt.DOWN_PRESSED) >= 1
+        assert codes.count(fmt.DOWN_RELEASED) >= 1
+
+    def test_buffered_writes(self):
+        """Test that a whole game is written out in one go after the header when it fits the buffer"""
+        stream = CountingStream()
+        record_game(frames=3000, stream=stream)
+
+        assert stream.writes == 2
+
+    def test_unfinished_recording_can_be_read(self):
+        """Test that the header is written on start so an aborted recording still loads"""
+        stream = io.BytesIO()
+        engine = HeadlessEngine(CLASSIC, seed=5)
+        engine.gamemode.attach_recorder(ReplayRecorder(stream))
+        for _ in range(100):
+            engine.step(None)
+
+        replay = Replay.from_bytes(stream.getvalue())
+        assert replay.seed == 5
+        assert replay.result is None
+
+    def test_flushes_when_the_buffer_fills(self):
+        """Test that a small buffer is flushed as it fills and nothing is lost"""
+        small = CountingStream()
+        _, data = record_game(frames=3000, stream=small, buffer_size=64)
+        _, expected = record_game(frames=3000)
+
+        assert small.writes > 1
+        assert data == expected
+
+    def test_recording_is_compact(self):
+        """Test that a long game takes only a few bytes per piece"""
+        engine, data = record_game(frames=20000)
+
+        assert len(data) < 16 * engine.gamemode.blocks_placed + 64
+
+    def test_fresh_seed_is_recorded(self):
+        """Test that a game without a seed records the seed it actually ran on"""
+        engine = HeadlessEngine(CLASSIC)
+        stream = io.BytesIO()
+        engine.gamemode.attach_recorder(ReplayRecorder(stream))
+        engine.gamemode.detach_recorder(gameover=False)
+
+        assert Replay.from_bytes(stream.getvalue()).seed == engine.gamemode.game_seed
+        assert engine.gamemode.game_seed is not None
+
+
+# ============================================================================
+# PLAYER
+# ============================================================================
+class TestReplayPlayer:
+    """Tests for playing recordings back"""
+
+    @pytest.mark.parametrize("gamemode_config", [CLASSIC, SPECIAL, dict(CLASSIC, board='bitboard'),
+                                                 dict(SPECIAL, randomizer='bag')])
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_replay_matches_the_recording(self, gamemode_config, seed):
+        """Test that every recorded game plays back to the same result"""
+        engine, data = record_game(gamemode_config, seed=seed, frames=20000)
+        replay = Replay.from_bytes(data)
+
+        player = ReplayPlayer(replay)
+
+        assert player.verify()
+        assert player.tick == engine.frames
+        assert player.gameover == engine.done
+
+    def test_frame_by_frame_matches_full_speed(self):
+        """Test that skipping idle frames ends in the same place as playing every frame"""
+        _, data = record_game(frames=20000)
+        replay = Replay.from_bytes(data)
+
+        stepped = ReplayPlayer(replay)
+        while not stepped.done:
+            stepped.play(stepped.tick + 1)
+
+        assert stepped.result() == ReplayPlayer(replay).play()
+
+    def test_play_to_a_tick(self):
+        """Test that playing to a tick stops there and can carry on"""
+        _, data = record_game(frames=20000)
+        replay = Replay.from_bytes(data)
+        player = ReplayPlayer(replay)
+
+        player.play(replay.ticks // 2)
+        assert player.tick == replay.ticks // 2
+
+        assert player.play() == replay.result
+
+    def test_counter_jump_is_replayed(self):
+        """Test that a wrapped counter (or a pause) plays back the same"""
+        stream = io.BytesIO()
+        engine = HeadlessEngine(CLASSIC, seed=4)
+        policy = GreedyPolicy(4)
+        engine.gamemode.attach_recorder(ReplayRecorder(stream))
+        for frame in range(600):
+            if frame == 300:
+                engine.config.counter = 0
+            engine.step(policy.next_action(engine) if frame % 3 == 0 else None)
+        engine.gamemode.detach_recorder(engine.done)
+
+        assert ReplayPlayer(Replay.from_bytes(stream.getvalue())).verify()
+
+    def test_detects_drift(self):
+        """Test that a replay that ends differently than recorded fails verification"""
+        _, data = record_game(frames=20000)
+        replay = Replay.from_bytes(data)
+        replay.seed += 1
+
+        assert not ReplayPlayer(replay).verify()
+
+    def test_effects_are_handed_out(self):
+        """Test that the line clear effects reach on_vfx while playing"""
+        _, data = record_game(frames=20000)
+        player = ReplayPlayer(Replay.from_bytes(data))
+        effects = []
+        player.on_vfx = effects.extend
+        player.play()
+
+        assert len([vfx for vfx in effects if vfx['type'] == 'line_clear']) == player.result().lines
+
+    def test_command_line(self, tmp_path, capsys):
+        """Test that the command line exits 0 when every replay matches and 1 otherwise"""
+        _, data = record_game(frames=2000, keyframe_interval=0)    # ends on the board hash
+        good = tmp_path / 'good.replay'
+        good.write_bytes(data)
+
+        assert replay_main([str(good)]) == 0
+
+        bad = tmp_path / 'bad.replay'
+        bad.write_bytes(data[:-2] + bytes([data[-2] ^ 1]) + data[-1:])   # flip a bit of the board hash
+
+        assert replay_main([str(good), str(bad)]) == 1
+        assert 'MISMATCH' in capsys.readouterr().out
+
+    def test_command_line_reports_corrupt_files(self, tmp_path, capsys):
+        """Test that empty and truncated files are reported as CORRUPT and the rest still run"""
+        _, data = record_game(frames=2000)
+        good = tmp_path / 'good.replay'
+        good.write_bytes(data)
+        empty = tmp_path / 'empty.replay'
+        empty.write_bytes(b'')
+        truncated = tmp_path / 'truncated.replay'
+        truncated.write_bytes(data[:len(fmt.MAGIC) + 3])
+
+        assert replay_main([str(empty), str(truncated), str(good)]) == 1
+        out = capsys.readouterr().out
+        assert f'CORRUPT    {empty}' in out
+        assert f'CORRUPT    {truncated}' in out
+        assert f'OK         {good}' in out
+
+
+# ============================================================================
+# KEYFRAMES AND SEEKING
+# ============================================================================
+class TestKeyframes:
+    """Tests for the keyframes in a recording and seeking with them"""
+
+    def game_state(self, player):
+        """Everything about the game a seek has to get right"""
+        gamemode = player.gamemode
+        return (player.tick, player.result(), player.config.counter, player.config.level,
+                gamemode.last_move_counter, gamemode.display_level,
+                (gamemode.piece.type, gamemode.piece.xShift, gamemode.piece.yShift, gamemode.piece.rotation),
+                (gamemode.next_piece.type, gamemode.next_piece.color))
+
+    def test_keyframes_every_interval(self):
+        """Test that the recorder takes a keyframe every keyframe_interval frames"""
+        _, data = record_game(frames=20000, keyframe_interval=100)
+        replay = Replay.from_bytes(data)
+
+        assert replay.keyframe_ticks == list(range(100, replay.ticks, 100))
+
+    def test_no_keyframes(self):
+        """Test that a keyframe_interval of 0 records none"""
+        _, data = record_game(frames=2000, keyframe_interval=0)
+
+        assert Replay.from_bytes(data).keyframe_ticks == []
+
+    def test_keyframe_round_trip(self):
+        """Test that a keyframe reads back with the same values"""
+        engine, _ = record_game(frames=600)
+        engine.gamemode.piece.xShift = -1
+        keyframe = Keyframe.capture(engine.gamemode, 600, engine.config.counter, True)
+
+        copy = Keyframe.from_bytes(600, keyframe.to_bytes())
+
+        assert all(getattr(copy, name) == getattr(keyframe, name) for name in Keyframe.__slots__)
+
+    @pytest.mark.parametrize("gamemode_config", [CLASSIC, SPECIAL, dict(CLASSIC, board='bitboard', randomizer='bag')])
+    def test_seek_matches_playing_there(self, gamemode_config):
+        """Test that seeking lands on the same game as playing every frame up to it"""
+        _, data = record_game(gamemode_config, frames=20000, keyframe_interval=100)
+        replay = Replay.from_bytes(data)
+        seeker = ReplayPlayer(replay)
+
+        for tick in [replay.ticks - 1, 350, 100, 99, 101, 0, replay.ticks // 2, replay.ticks]:
+            seeker.seek(tick)
+            player = ReplayPlayer(replay)
+            player.play(tick)
+
+            assert self.game_state(seeker) == self.game_state(player)
+
+    def test_seek_then_finish(self):
+        """Test that a game seeked back and forth still ends the way it was recorded"""
+        _, data = record_game(frames=20000, keyframe_interval=100)
+        replay = Replay.from_bytes(data)
+        player = ReplayPlayer(replay)
+
+        player.seek(replay.ticks)
+        player.seek(replay.ticks // 3)
+
+        assert player.verify()
+
+    def test_restore_from_the_seed(self):
+        """Test that a keyframe can be put back without the player's piece sequence"""
+        _, data = record_game(frames=20000, keyframe_interval=100)
+        replay = Replay.from_bytes(data)
+        keyframe = replay.keyframe_before(replay.ticks // 2)
+
+        player = ReplayPlayer(replay)
+        keyframe.restore(player.gamemode)
+        expected = ReplayPlayer(replay)
+        expected.play(keyframe.tick)
+
+        assert player.result() == expected.result()
+        assert player.gamemode.next_piece.type == expected.gamemode.next_piece.type
+
+
+# ============================================================================
+# IN THE GAME
+# ============================================================================
+class TestGameRecording:
+    """The game state records games when TETRIS_REPLAY_DIR is set"""
+
+    @patch.dict(os.environ, {'SDL_AUDIODRIVER': 'dummy'})
+    def test_recording_is_off_by_default(self):
+        """Test that games aren't recorded unless TETRIS_REPLAY_DIR is set"""
+        from tetris.new_code.tetris_game.config.config import Config
+        os.environ.pop('TETRIS_REPLAY_DIR', None)
+        assert Config().replay_dir is None
+
+    @patch.dict(os.environ)
+    def test_quit_from_pause_finishes_recording(self, tmp_path):
+        """E2E: quitting from the pause menu writes out the whole recording with its result"""
+        import pygame
+        from tetris.new_code.tetris_game.main.game import start_game, run_frame
+
+        os.environ['TETRIS_REPLAY_DIR'] = str(tmp_path)
+        config, renderer, state_manager = start_game('null')
+        try:
+            config.play_sounds = False
+            state_manager._change_state('game')
+            for _ in range(200):
+                run_frame(config, renderer, state_manager)
+            gamemode = state_manager.current_state.gamemode
+
+            state_manager._change_state('pause')
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            assert not run_frame(config, renderer, state_manager)
+        finally:
+            pygame.quit()
+
+        assert gamemode.recorder is None
+        files = list(tmp_path.glob('*.replay'))
+        assert len(files) == 1
+        replay = Replay.load(str(files[0]))
+        assert replay.result == ReplayResult.from_gamemode(gamemode, gameover=False)
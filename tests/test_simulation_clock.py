@@ -0,0 +1,167 @@
+"""
+Tests for the fixed timestep simulation clock (main/simulation_clock.py) and the game state
+running its simulation in ticks
+"""
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add the tetris module to the path so we can import it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tetris.new_code.tetris_game.main.simulation_clock import SimulationClock
+from tetris.new_code.tetris_game.simulation.headless_config import HeadlessConfig
+from tetris.new_code.tetris_game.profiling.frame_profiler import FrameProfiler
+from tetris.new_code.tetris_game.state.game_state import Game
+from tetris.new_code.tetris_game.game.piece.piece_action import PieceAction
+
+
+def new_game(time_source, tick_rate=25):
+    config = HeadlessConfig(tick_rate)
+    config.profiler = FrameProfiler()
+    input = Mock()
+    input.get_actions.return_value = []
+    input.is_down_pressed.return_value = False
+    game = Game(config, input, Mock())
+    game.sim_clock = SimulationClock(tick_rate, time_source=time_source)
+    return game
+
+
+def play(game, time, frames, frame_time):
+    """Plays frames frames of frame_time seconds each"""
+    for _ in range(frames):
+        game.update()
+        time.now += frame_time
+
+
+# ============================================================================
+# CLOCK
+# ============================================================================
+class TestSimulationClock:
+    """Ticks follow the time that passed, not the number of frames"""
+
+    def test_first_frame_ticks_once(self, fake_time):
+        """Test that the first frame runs one tick straight away"""
+        clock = SimulationClock(25, time_source=fake_time())
+        assert clock.advance() == 1
+        assert clock.alpha == 0
+
+    def test_ticks_follow_time(self, fake_time):
+        """Test that the number of ticks depends on the time, whatever the frame rate"""
+        for frame_time in (1 / 100, 1 / 60, 1 / 25, 1 / 10):
+            time = fake_time()
+            clock = SimulationClock(25, time_source=time)
+            clock.advance()
+            ticks = 0
+            for _ in range(round(2 / frame_time)):
+                time.now += frame_time
+                ticks += clock.advance()
+            assert ticks == 50, frame_time
+
+    def test_accumulator_carries_over(self, fake_time):
+        """Test that time short of a tick is kept for the next frame and sets alpha"""
+        time = fake_time()
+        clock = SimulationClock(10, time_source=time)
+        clock.advance()
+
+        time.now += 0.025
+        assert clock.advance() == 0
+        assert clock.alpha == pytest.approx(0.25)
+
+        time.now += 0.1
+        assert clock.advance() == 1
+        assert clock.alpha == pytest.approx(0.25)
+
+    def test_catch_up_is_capped(self, fake_time):
+        """Test that a long frame runs at most max_ticks and drops the rest"""
+        time = fake_time()
+        clock = SimulationClock(25, max_ticks=5, time_source=time)
+        clock.advance()
+
+        time.now += 1.0
+        assert clock.advance() == 5
+        assert clock.dropped_ticks == 20
+
+        time.now += 0.04
+        assert clock.advance() == 1
+
+    def test_reset_skips_time_away(self, fake_time):
+        """Test that time before a reset isn't simulated"""
+        time = fake_time()
+        clock = SimulationClock(25, time_source=time)
+        clock.advance()
+        time.now += 0.03
+        clock.advance()
+
+        clock.reset()
+        time.now += 30.0
+        assert clock.advance() == 1
+        assert clock.dropped_ticks == 0
+
+
+# ============================================================================
+# GAME STATE
+# ============================================================================
+class TestGameTicks:
+    """The game state runs gravity and keys in simulation ticks"""
+
+    def test_game_speed_is_independent_of_frame_rate(self, fake_time):
+        """Test that a second of play moves the counter the same at any frame rate"""
+        counters = []
+        for frame_time in (1 / 100, 1 / 25, 1 / 8):
+            time = fake_time()
+            game = new_game(time)
+            start_y = game.gamemode.piece.yShift
+            # The first frame's tick, then a second's worth
+            play(game, time, round(1 / frame_time) + 1, frame_time)
+            counters.append((game.config.counter, game.gamemode.piece.yShift - start_y))
+        assert counters[0] == counters[1] == counters[2] == (26, 2)
+
+    def test_keys_wait_for_the_next_tick(self, fake_time):
+        """Test that keys from a frame with no tick are used by the next tick"""
+        time = fake_time()
+        game = new_game(time)
+        play(game, time, 1, 0.01)
+        x = game.gamemode.piece.xShift
+
+        game.input.get_actions.return_value = [PieceAction.MOVE_LEFT]
+        play(game, time, 1, 0.01)
+        assert game.gamemode.piece.xShift == x
+
+        game.input.get_actions.return_value = []
+        time.now += 0.04
+        play(game, time, 1, 0.01)
+        assert game.gamemode.piece.xShift == x - 1
+
+    def test_counter_resets_past_threshold(self, fake_time):
+        """Test that the counter resets once a tick takes it past 100000"""
+        time = fake_time()
+        game = new_game(time)
+        game.config.counter = 100000
+        game.gamemode.last_move_counter = 100000
+        play(game, time, 1, 0.04)
+        assert game.config.counter == 0
+
+    def test_resume_doesnt_catch_up(self, fake_time):
+        """Test that coming back from the pause menu doesn't run the paused time"""
+        time = fake_time()
+        game = new_game(time)
+        play(game, time, 5, 0.04)
+        counter = game.config.counter
+
+        time.now += 60.0
+        game.resume()
+        play(game, time, 1, 0.04)
+        assert game.config.counter == counter + 1
+
+    def test_effects_drawn_between_ticks(self, fake_time):
+        """Test that the effects step once per tick and are drawn with the clock's alpha"""
+        time = fake_time()
+        game = new_game(time)
+        play(game, time, 1, 0.01)
+        time.now += 0.01
+        game.update()
+
+        assert game.renderer.update_vfx.call_count == 1
+        assert game.renderer.draw_vfx.call_args[0][0] == pytest.approx(0.5)
@@ -2,5 +2,5 @@
 # . YOUR_VIRTUAL_ENV/bin/activate
 # . ~/venv/p311/bin/activate # Example
 
-pip install pygame
+pip install pygame numpy
 python3 ./tetris_game/main/game.py
\ No newline at end of file
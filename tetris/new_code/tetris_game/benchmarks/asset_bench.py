@@ -0,0 +1,92 @@
+"""
+    Block image loading and blitting, the way the Renderer used to do it (every image loaded
+    twice, scaled but never converted to the display format) against the AssetManager (loaded
+    once, converted, packed into one atlas). Reports the load time and how many block blits a
+    second each way manages onto the display surface.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.asset_bench
+"""
+
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+from ..ui.asset_manager import AssetManager, IMG_DIR
+
+BLOCK_SIZE = 20
+WINDOW_SIZE = (400, 500)
+
+
+# The loading code from Renderer.__init__ before the AssetManager (both directories)
+def legacy_load(img_dirs=(IMG_DIR, os.path.join(os.path.dirname(IMG_DIR), '..', 'assets', 'img'))):
+    block_images = {}
+    special_block_image = None
+    for img_dir in img_dirs:
+        for i in range(1, 7):
+            img_path = os.path.join(img_dir, f'block{i}.png')
+            if os.path.exists(img_path):
+                img = pygame.image.load(img_path)
+                block_images[i] = pygame.transform.scale(img, (BLOCK_SIZE - 2, BLOCK_SIZE - 2))
+
+        bomb_block_path = os.path.join(img_dir, 'bombBlock.png')
+        if os.path.exists(bomb_block_path):
+            bomb_img = pygame.image.load(bomb_block_path)
+            special_block_image = pygame.transform.scale(bomb_img, (BLOCK_SIZE * 3 - 2, BLOCK_SIZE * 6 - 2))
+    return block_images, special_block_image
+
+
+# A board's worth of block positions
+def _positions():
+    return [(100 + BLOCK_SIZE * j + 1, 60 + BLOCK_SIZE * i + 1) for i in range(20) for j in range(10)]
+
+
+def _blits_per_second(draw, seconds):
+    positions = _positions()
+    blits = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for k, position in enumerate(positions):
+            draw(k % 6 + 1, position)
+        blits += len(positions)
+    return blits / (time.perf_counter() - start)
+
+
+def run(loads=20, seconds=1.0):
+    pygame.init()
+    screen = pygame.display.set_mode(WINDOW_SIZE)
+
+    start = time.perf_counter()
+    for _ in range(loads):
+        block_images, _ = legacy_load()
+    legacy_load_ms = (time.perf_counter() - start) / loads * 1000
+
+    load_times = []
+    for _ in range(loads):
+        assets = AssetManager()
+        atlas = assets.block_atlas(BLOCK_SIZE)
+        load_times.append(assets.load_time)
+    atlas_load_ms = sum(load_times) / loads * 1000
+
+    results = {
+        'unconverted': (legacy_load_ms, _blits_per_second(
+            lambda color, position: screen.blit(block_images[color], position), seconds)),
+        'atlas': (atlas_load_ms, _blits_per_second(
+            lambda color, position: atlas.blit(screen, color, position), seconds)),
+    }
+
+    pygame.quit()
+    return results
+
+
+def main():
+    print(f"{'blocks':<14}{'load ms':>10}{'blits/s':>14}")
+    for name, (load_ms, per_second) in run().items():
+        print(f"{name:<14}{load_ms:>10.2f}{per_second:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+    Micro benchmark for Board.intersects. Compares the old 4x4 grid walk (kept here as
+    legacy_intersects) against the precomputed masks on both board backends.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.collision_bench
+"""
+
+import random
+import timeit
+
+from ..game.board import Board
+from ..game.bit_board import BitBoard
+from ..game.piece.piece import Piece, FIGURES
+from ..game.piece.special_pieces.rocket_piece import RocketPiece
+
+BOARD_HEIGHT = 20
+BOARD_WIDTH = 10
+
+
+# The way Board.intersects worked before the masks, only here to compare against
+def legacy_intersects(board, piece):
+    if piece.is_special:
+        for i in range(piece.height):
+            for j in range(piece.width):
+                board_y = piece.yShift + i
+                board_x = piece.xShift + j
+                if (board_y >= board.height or board_y < 0 or
+                    board_x >= board.width or board_x < 0):
+                    return True
+                if board.field[board_y][board_x] > 0:
+                    return True
+        return False
+
+    for i in range(4):
+        for j in range(4):
+            if i * 4 + j in piece.get_figure():
+                board_y = i + piece.yShift
+                board_x = j + piece.xShift
+                if (board_y >= board.height or board_y < 0 or
+                    board_x >= board.width or board_x < 0):
+                    return True
+                if board.field[board_y][board_x] > 0:
+                    return True
+    return False
+
+
+# A one block piece, used to build the garbage cell by cell
+class CellPiece(Piece):
+    def get_figure(self):
+        return (0,)
+
+
+def _fill_bottom(board, rng, rows=8):
+    # Random garbage on the bottom rows so the checks have something to hit
+    for y in range(BOARD_HEIGHT - rows, BOARD_HEIGHT):
+        for x in range(BOARD_WIDTH):
+            if rng.random() < 0.6:
+                board.freeze_piece(CellPiece(x, y, piece_type='cell', piece_color=1))
+
+
+def _make_pieces(rng, count=500):
+    pieces = []
+    for _ in range(count):
+        piece_type = rng.choice(list(FIGURES))
+        piece = Piece(rng.randint(-1, BOARD_WIDTH - 2), rng.randint(0, BOARD_HEIGHT - 3), piece_type, 1)
+        piece.rotation = rng.randrange(len(FIGURES[piece_type]))
+        pieces.append(piece)
+    for _ in range(count // 10):
+        pieces.append(RocketPiece(rng.randint(0, BOARD_WIDTH - 3), rng.randint(0, BOARD_HEIGHT - 6)))
+    return pieces
+
+
+def run(repeat=5, seed=0):
+    rng = random.Random(seed)
+    pieces = _make_pieces(rng)
+
+    boards = {}
+    for name, board_class in (('list', Board), ('bitboard', BitBoard)):
+        board = board_class(BOARD_HEIGHT, BOARD_WIDTH)
+        _fill_bottom(board, random.Random(seed))
+        boards[name] = board
+
+    # Every version has to agree before the timings mean anything
+    for piece in pieces:
+        expected = legacy_intersects(boards['list'], piece)
+        for board in boards.values():
+            assert board.intersects(piece) == expected
+
+    cases = {
+        'legacy grid walk': lambda: [legacy_intersects(boards['list'], p) for p in pieces],
+        'list board masks': lambda: [boards['list'].intersects(p) for p in pieces],
+        'bitboard masks': lambda: [boards['bitboard'].intersects(p) for p in pieces],
+    }
+
+    results = {}
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=20, repeat=repeat))
+        results[name] = best / (20 * len(pieces)) * 1e9   # ns per call
+    return results
+
+
+def main():
+    results = run()
+    baseline = results['legacy grid walk']
+    print(f"{'case':<20}{'ns/call':>10}{'speedup':>10}")
+    for name, ns in results.items():
+        print(f"{name:<20}{ns:>10.0f}{baseline / ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+    Micro benchmark for command dispatch. Compares the old CommandFactory (a lambda and a new
+    command object per input, plus a trial rotation before the real one, kept here as
+    LegacyCommandFactory) against the shared commands in COMMANDS. The legacy counterclockwise
+    rotation actually turned the piece clockwise, so the two do not end up in the same place.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.command_bench
+"""
+
+import random
+import timeit
+
+from ..game.board import Board
+from ..game.game_command import CommandFactory
+from ..game.piece.piece import Piece, PIECE_TYPES
+from ..game.piece.piece_action import PieceAction
+
+BOARD_HEIGHT = 20
+BOARD_WIDTH = 10
+
+# Hard drops are left out so the piece and board stay the same between rounds
+ACTIONS = (
+    PieceAction.MOVE_LEFT,
+    PieceAction.MOVE_RIGHT,
+    PieceAction.ROTATE_CLOCKWISE,
+    PieceAction.ROTATE_COUNTERCLOCKWISE,
+    PieceAction.SOFT_DROP,
+)
+
+
+# The way commands were built and run before they were shared, only here to compare against
+class LegacyMoveCommand:
+    def __init__(self, direction, distance=1):
+        self.direction = direction
+        self.distance = distance
+
+    def execute(self, piece, board):
+        self.piece = piece
+        self.board = board
+        piece.go_side(self.direction * self.distance, self.board)
+        return False
+
+
+class LegacyRotateCommand:
+    def __init__(self, clockwise=True):
+        self.clockwise = clockwise
+
+    def execute(self, piece, board):
+        self.piece = piece
+        self.board = board
+        if piece.is_special:
+            return False
+        old_rotation = piece.rotation
+        if self.clockwise:
+            piece.rotation = (piece.rotation + 1) % len(piece.figures[piece.type])
+        else:
+            piece.rotation = (piece.rotation - 1) % len(piece.figures[piece.type])
+        can_rotate = not board.intersects(piece)
+        piece.rotation = old_rotation
+        if can_rotate:
+            piece.rotate(board)
+        return False
+
+
+class LegacySoftDropCommand:
+    def execute(self, piece, board):
+        old_y = piece.yShift
+        piece.yShift += 1
+        if board.intersects(piece):
+            piece.yShift = old_y
+        return False
+
+
+class LegacyCommandFactory:
+    def __init__(self):
+        self._command_map = {
+            PieceAction.MOVE_LEFT: lambda: LegacyMoveCommand(-1),
+            PieceAction.MOVE_RIGHT: lambda: LegacyMoveCommand(+1),
+            PieceAction.ROTATE_CLOCKWISE: lambda: LegacyRotateCommand(True),
+            PieceAction.ROTATE_COUNTERCLOCKWISE: lambda: LegacyRotateCommand(False),
+            PieceAction.SOFT_DROP: lambda: LegacySoftDropCommand(),
+        }
+
+    def create_command(self, action):
+        command_constructor = self._command_map.get(action)
+        return command_constructor() if command_constructor else None
+
+
+def _dispatch(factory, actions, pieces, board):
+    for action, piece in zip(actions, pieces):
+        command = factory.create_command(action)
+        if command:
+            command.execute(piece, board)
+
+
+def run(count=5000, repeat=5, seed=0):
+    rng = random.Random(seed)
+    board = Board(BOARD_HEIGHT, BOARD_WIDTH)
+    actions = [rng.choice(ACTIONS) for _ in range(count)]
+
+    def fresh_pieces():
+        piece_rng = random.Random(seed)
+        return [Piece(3, piece_rng.randint(0, 10), piece_rng.choice(PIECE_TYPES), 1) for _ in range(count)]
+
+    results = {}
+    for name, factory in (('legacy new command', LegacyCommandFactory()), ('shared commands', CommandFactory())):
+        pieces = fresh_pieces()
+        best = min(timeit.repeat(lambda: _dispatch(factory, actions, pieces, board), number=5, repeat=repeat))
+        results[name] = best / (5 * count) * 1e9   # ns per command
+    return results
+
+
+def main():
+    results = run()
+    baseline = results['legacy new command']
+    print(f"{'case':<22}{'ns/command':>12}{'speedup':>10}")
+    for name, ns in results.items():
+        print(f"{name:<22}{ns:>12.0f}{baseline / ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
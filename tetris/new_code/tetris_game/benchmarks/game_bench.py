@@ -0,0 +1,109 @@
+"""
+    Frames per second of the whole game: run_game's frame (EnhancedStateManager, Input and the
+    gamemode) with no frame cap, on the 'null' renderer backend (game logic only) and on the
+    'offscreen' one (everything drawn, on SDL's dummy driver). A scripted player clicks through
+    the menu into a special mode game, presses random keys and starts over from game over.
+    The frame profiler is on, its percentiles per phase are printed for each backend.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.game_bench
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+from ..main.game import start_game, run_frame
+from ..main.simulation_clock import SimulationClock
+
+BACKENDS = ('null', 'offscreen')
+
+# Controls the player presses, None is a frame without a key
+KEYS = ['move_left', 'move_right', 'rotate', 'soft_drop', 'hard_drop'] + [None] * 6
+
+
+# Time for the game's simulation clock that moves one tick on every frame, so the uncapped
+# frames still play the game as it plays at its frame cap
+class FrameTime:
+    def __init__(self, tick_rate):
+        self.dt = 1 / tick_rate
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += self.dt
+        return self.now
+
+
+def _click(position):
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=position))
+
+
+# Posts this frame's input for whatever state the game is in
+def _play(state_manager, config, rng):
+    state = state_manager.current_state_string
+    current = state_manager.current_state
+
+    if state == 'menu':
+        _click(current.buttons[0]["rect"].center)       # Start Game
+    elif state == 'gamemode':
+        if current.current_phase == 1:
+            _click(current.mode_buttons[1]["rect"].center)      # Special Mode
+        elif not current.selected_special_pieces:
+            _click(current.piece_selection_buttons[0]["rect"].center)
+        else:
+            _click(current.confirm_button["rect"].center)
+    elif state == 'gameover':
+        _click(current.buttons[0]["rect"].center)       # Try Again
+    elif state == 'game':
+        key = rng.choice(KEYS)
+        if key is not None:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=config.get_control(key)))
+
+
+# (frames per second, games played, profiler summary) over frames frames on backend
+def _run(backend, frames, seed):
+    config, renderer, state_manager = start_game(backend)
+    config.replay_dir = None
+    config.play_sounds = False
+    config.profiler.enabled = True
+    state_manager.states['game'].sim_clock = SimulationClock(config.fps, time_source=FrameTime(config.fps))
+    rng = random.Random(seed)
+
+    games = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        before = state_manager.current_state_string
+        _play(state_manager, config, rng)
+        run_frame(config, renderer, state_manager)
+        if before == 'game' and state_manager.current_state_string == 'gameover':
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    pygame.quit()
+    return frames / elapsed, games, config.profiler.summary_lines()
+
+
+def run(frames=5000, seed=0):
+    return {backend: _run(backend, frames, seed) for backend in BACKENDS}
+
+
+def main():
+    results = run()
+    print(f"{'backend':<12}{'fps':>12}{'games':>8}")
+    for backend, (fps, games, _) in results.items():
+        print(f"{backend:<12}{fps:>12,.0f}{games:>8}")
+
+    for backend, (_, _, summary) in results.items():
+        print()
+        print(backend)
+        for line in summary:
+            print('    ' + line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+    Actions per second of the headless engine. Plays seeded games with a random action stream
+    (one action per frame) on both gamemodes and both board backends.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.headless_bench
+"""
+
+import random
+import time
+
+from ..game.piece.piece_action import PieceAction
+from ..simulation.headless_engine import HeadlessEngine
+
+ACTIONS = [
+    PieceAction.MOVE_LEFT,
+    PieceAction.MOVE_RIGHT,
+    PieceAction.ROTATE_CLOCKWISE,
+    PieceAction.SOFT_DROP,
+    PieceAction.HARD_DROP,
+    None,
+    None,
+]
+
+GAMEMODES = {
+    'classic': {'mode': 'classic', 'special_pieces': [], 'include_classic': True},
+    'special': {'mode': 'special', 'special_pieces': ['rocket'], 'include_classic': True},
+}
+
+
+def run(frames=200000, seed=0):
+    results = {}
+    for mode, gamemode_config in GAMEMODES.items():
+        for board in ('list', 'bitboard'):
+            engine = HeadlessEngine(dict(gamemode_config, board=board))
+            rng = random.Random(seed)
+            actions = [rng.choice(ACTIONS) for _ in range(frames)]
+
+            games = 0
+            start = time.perf_counter()
+            engine.reset(seed)
+            for action in actions:
+                engine.step(action)
+                if engine.done:
+                    games += 1
+                    engine.reset(seed + games)
+            elapsed = time.perf_counter() - start
+
+            results[(mode, board)] = (frames / elapsed, games)
+    return results
+
+
+def main():
+    print(f"{'gamemode':<10}{'board':<10}{'actions/s':>12}{'games':>8}")
+    for (mode, board), (per_second, games) in run().items():
+        print(f"{mode:<10}{board:<10}{per_second:>12,.0f}{games:>8}")
+
+
+if __name__ == "__main__":
+    main()
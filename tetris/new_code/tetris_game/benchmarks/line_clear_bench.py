@@ -0,0 +1,99 @@
+"""
+    Benchmark for Board.break_lines. Compares the old row by row shifting (kept here as
+    legacy_break_lines) against the single pass compaction, on normal and tall boards.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.line_clear_bench
+"""
+
+import random
+import timeit
+
+from ..game.board import Board
+from ..game.bit_board import BitBoard
+
+BOARD_WIDTH = 10
+
+
+# The way Board.break_lines worked before (with rows 0 and 1 shifted too, so the result
+# can be compared), only here to compare against
+def legacy_break_lines(board):
+    lines = 0
+    cleared_indicies = []
+    i = board.height - 1
+    while i >= 0:
+        zeros = 0
+        for j in range(board.width):
+            if board.field[i][j] == 0:
+                zeros += 1
+        if zeros == 0:
+            lines += 1
+            cleared_indicies.append(i)
+            for k in range(i, 0, -1):
+                for j in range(board.width):
+                    board.field[k][j] = board.field[k - 1][j]
+            for j in range(board.width):
+                board.field[0][j] = 0
+        else:
+            i -= 1
+    return lines, cleared_indicies
+
+
+def _set_cell(board, x, y, color):
+    # Written straight into the planes so the full rows are not cleared while building
+    board.field[y][x] = color
+    board.column_tops[x] = min(board.column_tops[x], y)
+    if isinstance(board, BitBoard):
+        board.rows[y] |= 1 << x
+
+
+def _make_board(board_class, height, seed):
+    # Half full garbage with a Tetris (4 full rows) spread through the bottom 8 rows
+    rng = random.Random(seed)
+    board = board_class(height, BOARD_WIDTH)
+    full_rows = {height - 1, height - 3, height - 4, height - 7}
+    for y in range(height // 2, height):
+        hole = rng.randrange(BOARD_WIDTH)
+        for x in range(BOARD_WIDTH):
+            if y in full_rows or x != hole:
+                _set_cell(board, x, y, rng.randint(1, 6))
+    return board
+
+
+def _time_clear(clear, board_class, height, repeat):
+    # Every run needs a fresh board since the clear changes it
+    boards = [_make_board(board_class, height, seed) for seed in range(repeat)]
+    start = timeit.default_timer()
+    for board in boards:
+        clear(board)
+    return (timeit.default_timer() - start) / repeat * 1e6   # us per clear
+
+
+def run(heights=(20, 200, 1000), repeat=50):
+    results = {}
+    for height in heights:
+        # Every version has to agree before the timings mean anything
+        legacy = _make_board(Board, height, 0)
+        new = _make_board(Board, height, 0)
+        bits = _make_board(BitBoard, height, 0)
+        assert legacy_break_lines(legacy) == new.break_lines() == bits.break_lines()
+        assert legacy.field == new.field == [list(row) for row in bits.field]
+
+        results[height] = {
+            'legacy shifting': _time_clear(legacy_break_lines, Board, height, repeat),
+            'list board compact': _time_clear(Board.break_lines, Board, height, repeat),
+            'bitboard compact': _time_clear(BitBoard.break_lines, BitBoard, height, repeat),
+        }
+    return results
+
+
+def main():
+    for height, cases in run().items():
+        baseline = cases['legacy shifting']
+        print(f"board {height}x{BOARD_WIDTH}, Tetris clear")
+        for name, us in cases.items():
+            print(f"    {name:<20}{us:>10.1f} us{baseline / us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+run_game's frame pacing under load: clock.tick(fps) against the adaptive FramePacer (sleeping
+and busy waiting). The real game runs on the 'offscreen' backend for a few seconds per mode,
+with synthetic heavy frames in the middle: for a while every draw of the game state takes
+HEAVY_DRAW seconds longer, about what a rocket's particle burst costs on a slow machine.
+
+For each mode it prints the simulation ticks against what the time played should have had,
+the frames presented and dropped, the late frames, the spread (standard deviation) of the time
+between presented frames outside the heavy frames, and the worst time between two of them.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.pacing_bench
+"""
+
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+from ..main.game import start_game, run_frame, PACING_MODES
+from ..main.frame_pacer import FramePacer
+
+SECONDS = 3.0
+
+# Draws in (HEAVY_START, HEAVY_END) seconds take HEAVY_DRAW seconds longer
+HEAVY_START = 1.0
+HEAVY_END = 2.0
+HEAVY_DRAW = 0.06
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+# (ticks, expected ticks, presented, dropped, late, steady interval std ms, worst interval ms)
+def _run(pacing, seconds):
+    config, renderer, state_manager = start_game('offscreen')
+    config.replay_dir = None
+    config.play_sounds = False
+    config.profiler.enabled = True
+    state_manager._change_state('game')
+    game = state_manager.current_state
+
+    start = time.perf_counter()
+
+    draw = game.draw
+    def heavy_draw():
+        draw()
+        if HEAVY_START < time.perf_counter() - start < HEAVY_END:
+            _busy(HEAVY_DRAW)
+    game.draw = heavy_draw
+
+    presented = []
+    present = renderer.present
+    def timed_present():
+        present()
+        presented.append(time.perf_counter())
+    renderer.present = timed_present
+
+    clock = pygame.time.Clock()
+    pacer = None
+    if pacing != 'tick':
+        pacer = FramePacer(config.fps, busy_loop=(pacing == 'adaptive-busy'))
+
+    ticks = game.sim_clock.ticks
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        run_frame(config, renderer, state_manager, pacer)
+        if pacer is None:
+            clock.tick(config.fps)
+        else:
+            pacer.wait()
+    elapsed = time.perf_counter() - start
+    ticks = game.sim_clock.ticks - ticks
+
+    pygame.quit()
+    presented = np.array(presented) - start
+    intervals = np.diff(presented) * 1000
+    steady = intervals[(presented[1:] < HEAVY_START) | (presented[:-1] > HEAVY_END + 0.1)]
+    profiler = config.profiler
+    return (ticks, round(elapsed * config.fps), len(presented), profiler.dropped_frames,
+            profiler.late_frames, steady.std(), intervals.max())
+
+
+def run(seconds=SECONDS):
+    return {pacing: _run(pacing, seconds) for pacing in PACING_MODES}
+
+
+def main():
+    results = run()
+    print(f"{'pacing':<15}{'ticks':>12}{'presented':>11}{'dropped':>9}{'late':>6}{'steady std':>12}{'worst ms':>10}")
+    for pacing, (ticks, expected, presented, dropped, late, std, worst) in results.items():
+        print(f"{pacing:<15}{f'{ticks}/{expected}':>12}{presented:>11}{dropped:>9}{late:>6}"
+              f"{std:>12.2f}{worst:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+    Frame time against particle count, for the old particles (a list of dicts, updated one by
+    one and removed with list.remove) and the ParticleSystem (NumPy arrays). Every run emits a
+    burst of line clear particles and plays frames (update + draw) until the last one expires,
+    the burst expiring is where the old list removal hurt most.
+
+    Then back to back rocket clears (line clears and column flames every few frames) through
+    the Renderer, held at full detail and with the particle LOD fed the frame times the way
+    run_game does. The 2 ms budget stands in for a machine about 8 times slower than this one
+    reaching its 16.7 ms budget. Reports frame times and the most particles alive at once.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.particle_bench
+"""
+
+import math
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+from ..ui.particle_system import ParticleSystem
+from ..ui.renderer import Renderer, LINE_CLEAR_COLORS
+
+COUNTS = (100, 500, 1000, 2000, 5000)
+
+# Stacked rocket clears: frames played, a rocket every ROCKET_EVERY frames
+STACKED_FRAMES = 300
+ROCKET_EVERY = 4
+
+# LOD frame budgets in seconds, None is full detail
+STACKED_BUDGETS = {'full detail': None, 'budget 16.7 ms': 1 / 60, 'budget 2 ms': 0.002}
+WINDOW_SIZE = (400, 500)
+
+
+# The line clear particles as the Renderer kept them before the ParticleSystem
+class LegacyParticles:
+    def __init__(self):
+        self.particles = []
+
+    def emit(self, count, rng):
+        colors = [tuple(color) for color in LINE_CLEAR_COLORS.tolist()]
+        for _ in range(count):
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 5)
+            self.particles.append({
+                'x': rng.uniform(100, 300),
+                'y': rng.uniform(60, 460),
+                'vx': math.cos(angle) * speed,
+                'vy': math.sin(angle) * speed,
+                'color': rng.choice(colors),
+                'lifetime': rng.randint(25, 45),
+                'age': 0,
+                'size': rng.randint(3, 5)
+            })
+
+    def update(self):
+        for particle in self.particles[:]:
+            particle['x'] += particle['vx']
+            particle['y'] += particle['vy']
+            particle['vy'] += 0.2  # Gravity
+            particle['age'] += 1
+
+            if particle['age'] >= particle['lifetime']:
+                self.particles.remove(particle)
+
+    def draw(self, surface):
+        for particle in self.particles:
+            color = tuple(min(255, max(0, int(c * (1 - particle['age'] / particle['lifetime'])))) for c in particle['color'])
+            pygame.draw.circle(surface, color, (int(particle['x']), int(particle['y'])), particle['size'])
+
+    def __len__(self):
+        return len(self.particles)
+
+
+class ArrayParticles:
+    def __init__(self):
+        self.system = ParticleSystem(gravity=0.2, capacity=max(COUNTS))
+
+    def emit(self, count, rng):
+        rng = np.random.default_rng(rng.getrandbits(32))
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(2, 5, count)
+        self.system.emit(
+            rng.uniform(100, 300, count),
+            rng.uniform(60, 460, count),
+            np.cos(angle) * speed,
+            np.sin(angle) * speed,
+            LINE_CLEAR_COLORS[rng.integers(len(LINE_CLEAR_COLORS), size=count)],
+            rng.integers(25, 46, count),
+            rng.integers(3, 6, count)
+        )
+
+    def update(self):
+        self.system.update()
+
+    def draw(self, surface):
+        self.system.draw(surface)
+
+    def __len__(self):
+        return len(self.system)
+
+
+# (mean ms per frame, worst frame ms) over the life of a burst of count particles
+def _burst(particles, count, surface, seed):
+    particles.emit(count, random.Random(seed))
+
+    frame_times = []
+    while len(particles):
+        start = time.perf_counter()
+        particles.update()
+        particles.draw(surface)
+        frame_times.append(time.perf_counter() - start)
+
+    return sum(frame_times) / len(frame_times) * 1000, max(frame_times) * 1000
+
+
+# (mean ms, 95th percentile ms, most particles alive) for stacked rocket clears
+def _stacked(surface, budget, frames=STACKED_FRAMES):
+    renderer = Renderer(screen=surface)
+    if budget is not None:
+        renderer.particle_lod.budget = budget
+    systems = (renderer.particles, renderer.flame_particles, renderer.column_flame_particles)
+
+    frame_times = []
+    most = 0
+    for frame in range(frames):
+        start = time.perf_counter()
+        if frame % ROCKET_EVERY == 0:
+            column = frame // ROCKET_EVERY % 8
+            for row in range(4):
+                renderer.create_line_clear_particles(16 - row, 10)
+            for offset in range(3):
+                renderer.create_column_flame_effect(column + offset, 20)
+            renderer.create_flame_particles(column, 3, 3)
+        for system in systems:
+            system.update()
+            system.draw(surface)
+        elapsed = time.perf_counter() - start
+
+        if budget is not None:
+            renderer.particle_lod.frame(elapsed)
+        frame_times.append(elapsed)
+        most = max(most, sum(len(system) for system in systems))
+
+    frame_times.sort()
+    return (sum(frame_times) / len(frame_times) * 1000,
+            frame_times[int(len(frame_times) * 0.95)] * 1000, most)
+
+
+def run(counts=COUNTS, seed=0):
+    pygame.init()
+    surface = pygame.display.set_mode(WINDOW_SIZE)
+
+    results = {}
+    for count in counts:
+        results[count] = {
+            'dicts': _burst(LegacyParticles(), count, surface, seed),
+            'arrays': _burst(ArrayParticles(), count, surface, seed),
+        }
+
+    results['stacked'] = {name: _stacked(surface, budget) for name, budget in STACKED_BUDGETS.items()}
+
+    pygame.quit()
+    return results
+
+
+def main():
+    print(f"{'particles':>10}{'dicts ms':>12}{'worst':>10}{'arrays ms':>12}{'worst':>10}")
+    results = run()
+    stacked = results.pop('stacked')
+    for count, result in results.items():
+        (dict_ms, dict_worst), (array_ms, array_worst) = result['dicts'], result['arrays']
+        print(f"{count:>10}{dict_ms:>12.3f}{dict_worst:>10.3f}{array_ms:>12.3f}{array_worst:>10.3f}")
+
+    print()
+    print(f"{'stacked rockets':<16}{'ms':>10}{'p95 ms':>10}{'most alive':>12}")
+    for name, (mean_ms, p95_ms, most) in stacked.items():
+        print(f"{name:<16}{mean_ms:>10.3f}{p95_ms:>10.3f}{most:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+    Memory and allocation benchmark for pieces. Compares the old Piece (a __dict__ per piece and
+    a fresh figures dict of seven lists, kept here as LegacyPiece) against the __slots__ Piece
+    that shares the FIGURES flyweight.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.piece_memory_bench
+"""
+
+import random
+import timeit
+import tracemalloc
+
+from ..main.constants import COLORS
+from ..game.piece.piece import Piece
+from ..game.piece.special_pieces.rocket_piece import RocketPiece
+
+
+# The way Piece was built before the flyweight, only here to compare against
+class LegacyPiece:
+    def __init__(self, x, y, piece_type=None, piece_color=None):
+        self.xShift = x
+        self.yShift = y
+        self.rotation = 0
+        self.is_special = False
+        self.figures = {
+            'I': [[1, 5, 9, 13], [4, 5, 6, 7]],
+            'Z': [[4, 5, 9, 10], [2, 6, 5, 9]],
+            'S': [[6, 7, 9, 10], [1, 5, 6, 10]],
+            'L': [[1, 2, 5, 9], [0, 4, 5, 6], [1, 5, 9, 8], [4, 5, 6, 10]],
+            'J': [[1, 2, 6, 10], [5, 6, 7, 9], [2, 6, 10, 11], [3, 5, 6, 7]],
+            'T': [[1, 4, 5, 6], [1, 4, 5, 9], [4, 5, 6, 9], [1, 5, 6, 9]],
+            'O': [[1, 2, 5, 6]],
+        }
+        if piece_type is None:
+            self.type = random.choice(list(self.figures.keys()))
+        else:
+            self.type = piece_type
+        if piece_color is None:
+            self.color = random.randint(1, len(COLORS) - 1)
+        else:
+            self.color = piece_color
+
+
+# Bytes and allocations still alive per piece after creating count of them
+def _footprint(piece_class, count):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    snapshot_before = tracemalloc.take_snapshot()
+
+    pieces = [piece_class(3, 0) for _ in range(count)]
+
+    after, _ = tracemalloc.get_traced_memory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    del pieces
+    return (after - before) / count, blocks / count
+
+
+def run(count=20000):
+    results = {}
+    for name, piece_class in (('legacy Piece', LegacyPiece), ('slots Piece', Piece), ('slots RocketPiece', RocketPiece)):
+        bytes_per_piece, blocks_per_piece = _footprint(piece_class, count)
+        create_ns = min(timeit.repeat(lambda: piece_class(3, 0), number=count, repeat=5)) / count * 1e9
+        results[name] = (bytes_per_piece, blocks_per_piece, create_ns)
+    return results
+
+
+def main():
+    print(f"{'piece':<20}{'bytes/piece':>12}{'allocs/piece':>14}{'ns/create':>11}")
+    for name, (size, blocks, ns) in run().items():
+        print(f"{name:<20}{size:>12.0f}{blocks:>14.1f}{ns:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+    Frame time of the Renderer drawing a game, repainting the whole screen every frame (what it
+    did before dirty regions) against drawing only what changed. Also reports how much of the
+    window is handed to the display per frame. Runs on the dummy SDL driver, so the display
+    update itself costs next to nothing here; on a real screen the smaller area counts too.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.render_bench
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+from ..game.piece.piece_action import PieceAction
+from ..simulation.headless_engine import HeadlessEngine
+from ..ui.renderer import Renderer
+
+WINDOW_SIZE = (400, 500)
+
+# Roughly how often a player presses something
+ACTIONS = [
+    PieceAction.MOVE_LEFT,
+    PieceAction.MOVE_RIGHT,
+    PieceAction.ROTATE_CLOCKWISE,
+    PieceAction.HARD_DROP,
+] + [None] * 16
+
+
+def _play(renderer, frames, seed, full_redraw):
+    engine = HeadlessEngine({'mode': 'special', 'special_pieces': ['rocket'], 'include_classic': True})
+    engine.reset(seed)
+    rng = random.Random(seed)
+    actions = [rng.choice(ACTIONS) for _ in range(frames)]
+
+    updated = []
+    original_update = pygame.display.update
+    pygame.display.update = lambda rects: updated.append(
+        sum(rect.w * rect.h for rect in rects) if isinstance(rects, list) else rects.w * rects.h)
+
+    window_area = WINDOW_SIZE[0] * WINDOW_SIZE[1]
+    area = 0
+    games = 0
+    try:
+        start = time.perf_counter()
+        for action in actions:
+            lines = engine.gamemode.total_lines_broken
+            engine.step(action)
+            if engine.done:
+                games += 1
+                engine.reset(seed + games)
+            gamemode = engine.gamemode
+
+            # The engine drops the vfx pool, a line clear still gets its burst
+            if gamemode.total_lines_broken > lines:
+                renderer.create_line_clear_particles(gamemode.board.height - 1, gamemode.board.width)
+
+            if full_redraw:
+                renderer._repaint = True
+            renderer.render_board(gamemode.board)
+            renderer.draw_piece(gamemode.piece)
+            renderer.draw_score(gamemode.points)
+            renderer.draw_level(gamemode.display_level)
+            renderer.draw_next_piece(gamemode.next_piece)
+            renderer.update_vfx()
+            renderer.draw_vfx()
+
+            area += window_area if renderer._flip_all else 0
+            renderer.present()
+        elapsed = time.perf_counter() - start
+    finally:
+        pygame.display.update = original_update
+
+    area += sum(updated)
+    return elapsed / frames * 1000, area / frames / window_area
+
+
+def run(frames=3000, seed=0):
+    pygame.init()
+    screen = pygame.display.set_mode(WINDOW_SIZE)
+
+    results = {}
+    for name, full_redraw in (('full redraw', True), ('dirty regions', False)):
+        results[name] = _play(Renderer(screen=screen), frames, seed, full_redraw)
+
+    pygame.quit()
+    return results
+
+
+def main():
+    print(f"{'renderer':<16}{'ms/frame':>10}{'screen updated':>16}")
+    for name, (ms, updated) in run().items():
+        print(f"{name:<16}{ms:>10.3f}{updated:>15.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+    Replay verification speed. Records a set of greedy games (the policy acts every few frames
+    so there are idle frames like in a real game), then plays every recording back and checks
+    it, once frame by frame and once at full speed with the idle frames skipped.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.replay_bench
+"""
+
+import io
+import time
+
+from ..replay.replay_format import Replay
+from ..replay.replay_recorder import ReplayRecorder
+from ..replay.replay_player import ReplayPlayer
+from ..simulation.headless_engine import HeadlessEngine
+from ..simulation.policies import GreedyPolicy
+
+GAMEMODE = {'mode': 'classic', 'special_pieces': [], 'include_classic': True}
+
+
+def record(seed, pace=3, max_frames=50000):
+    engine = HeadlessEngine(GAMEMODE, seed=seed)
+    policy = GreedyPolicy(seed)
+    stream = io.BytesIO()
+    engine.gamemode.attach_recorder(ReplayRecorder(stream))
+    while not engine.done and engine.frames < max_frames:
+        engine.step(policy.next_action(engine) if engine.frames % pace == 0 else None)
+    engine.gamemode.detach_recorder(engine.done)
+    return Replay.from_bytes(stream.getvalue())
+
+
+def _frame_by_frame(replay):
+    player = ReplayPlayer(replay)
+    while not player.done:
+        player.play(player.tick + 1)
+    return player.result() == replay.result
+
+
+def _full_speed(replay):
+    return ReplayPlayer(replay).verify()
+
+
+def run(games=20, seed=0):
+    replays = [record(seed + game) for game in range(games)]
+    frames = sum(replay.ticks for replay in replays)
+
+    results = {}
+    for name, play in (('frame by frame', _frame_by_frame), ('full speed', _full_speed)):
+        start = time.perf_counter()
+        assert all(play(replay) for replay in replays)
+        elapsed = time.perf_counter() - start
+        results[name] = (frames, frames / (elapsed * 1000), games / elapsed)
+    return results
+
+
+def main():
+    print(f"{'case':<16}{'frames':>10}{'frames/ms':>11}{'games/s':>9}")
+    for name, (frames, per_ms, per_second) in run().items():
+        print(f"{name:<16}{frames:>10,}{per_ms:>11.1f}{per_second:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
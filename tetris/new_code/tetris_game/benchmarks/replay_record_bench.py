@@ -0,0 +1,70 @@
+"""
+    Recording cost of a marathon session. Plays an hour of frames (at 25 fps) with the greedy
+    policy taking an action every other frame, once without and once with every game recorded,
+    and reports the total replay size and the frame time distribution of both runs.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.replay_record_bench
+"""
+
+import io
+import time
+
+from ..replay.replay_recorder import ReplayRecorder
+from ..simulation.headless_engine import HeadlessEngine
+from ..simulation.policies import GreedyPolicy
+
+GAMEMODE = {'mode': 'classic', 'special_pieces': [], 'include_classic': True}
+
+
+# Plays frames frames, the policy only gets to act every pace-th frame like a person would.
+# A lost game is followed by a new one (with its own recording) until the hour is up
+def _play(frames, seed, pace, record=False):
+    engine = HeadlessEngine(GAMEMODE, seed=seed)
+    policy = GreedyPolicy(seed)
+    recorders = []
+
+    times = []
+    for frame in range(frames):
+        if engine.done:
+            engine.gamemode.detach_recorder()
+            engine.reset(seed + frame)
+            policy.reset(seed + frame)
+        if record and engine.gamemode.recorder is None:
+            recorders.append(ReplayRecorder(io.BytesIO()))
+            engine.gamemode.attach_recorder(recorders[-1])
+
+        action = policy.next_action(engine) if frame % pace == 0 else None
+        start = time.perf_counter_ns()
+        engine.step(action)
+        times.append(time.perf_counter_ns() - start)
+
+    engine.gamemode.detach_recorder(engine.done)
+    return sorted(times), recorders
+
+
+def _percentile(times, p):
+    return times[min(len(times) - 1, int(len(times) * p))] / 1000
+
+
+def run(frames=25 * 3600, seed=0, pace=2):
+    results = {}
+    times, _ = _play(frames, seed, pace)
+    results['no recorder'] = (times, None, None)
+
+    times, recorders = _play(frames, seed, pace, record=True)
+    results['recorder'] = (times, sum(recorder.size() for recorder in recorders), len(recorders))
+    return results
+
+
+def main():
+    print(f"{'case':<14}{'frames':>8}{'p50 us':>9}{'p99 us':>9}{'max us':>9}{'bytes':>9}{'games':>7}")
+    for name, (times, size, games) in run().items():
+        size = f"{size:,}" if size is not None else '-'
+        games = games if games is not None else '-'
+        print(f"{name:<14}{len(times):>8}{_percentile(times, 0.5):>9.1f}{_percentile(times, 0.99):>9.1f}"
+              f"{times[-1] / 1000:>9.1f}{size:>9}{games:>7}")
+
+
+if __name__ == "__main__":
+    main()
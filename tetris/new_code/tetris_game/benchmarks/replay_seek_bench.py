@@ -0,0 +1,84 @@
+"""
+    Seek latency on an hour-long replay. Records a marathon (an hour of frames at 25 fps, Special
+    with the 7-bag so the greedy policy survives it, placing a piece every third frame), then
+    seeks to random frames: once by playing from the first frame every time, once through the
+    keyframes with ReplayPlayer.seek.
+
+    Run from tetris/new_code:
+        python -m tetris_game.benchmarks.replay_seek_bench
+"""
+
+import io
+import random
+import time
+
+from ..replay.replay_format import Replay
+from ..replay.replay_recorder import ReplayRecorder
+from ..replay.replay_player import ReplayPlayer
+from ..simulation.headless_engine import HeadlessEngine
+from ..simulation.policies import GreedyPolicy
+
+GAMEMODE = {'mode': 'special', 'special_pieces': ['rocket'], 'include_classic': True, 'randomizer': 'bag'}
+
+
+def record_marathon(frames=25 * 3600, seed=0, pace=3, keyframe_interval=250):
+    engine = HeadlessEngine(GAMEMODE, seed=seed)
+    policy = GreedyPolicy(seed)
+    stream = io.BytesIO()
+    engine.gamemode.attach_recorder(ReplayRecorder(stream, keyframe_interval=keyframe_interval))
+
+    # The whole placement in one frame (several keys at once), then a couple of idle frames
+    while not engine.done and engine.frames < frames:
+        gamemode = engine.gamemode
+        engine.step(policy._plan(gamemode.board, gamemode.piece) if engine.frames % pace == 0 else None)
+
+    engine.gamemode.detach_recorder(engine.done)
+    return stream.getvalue()
+
+
+def _milliseconds(times):
+    times = sorted(times)
+    return times[len(times) // 2] * 1000, times[-1] * 1000
+
+
+def run(seeks_from_start=10, seeks=200, seed=0):
+    data = record_marathon(seed=seed)
+    replay = Replay.from_bytes(data)
+    rng = random.Random(seed)
+
+    results = {'ticks': replay.ticks, 'bytes': len(data), 'keyframe_count': len(replay.keyframe_ticks)}
+
+    from_start = []
+    for _ in range(seeks_from_start):
+        tick = rng.randrange(replay.ticks)
+        start = time.perf_counter()
+        ReplayPlayer(replay).play(tick)
+        from_start.append(time.perf_counter() - start)
+    results['from start'] = _milliseconds(from_start)
+
+    player = ReplayPlayer(replay)
+    with_keyframes = []
+    for _ in range(seeks):
+        tick = rng.randrange(replay.ticks)
+        start = time.perf_counter()
+        player.seek(tick)
+        with_keyframes.append(time.perf_counter() - start)
+    results['keyframes'] = _milliseconds(with_keyframes)
+
+    # Seeking must land on the same game as playing there
+    tick = rng.randrange(replay.ticks)
+    assert player.seek(tick) == ReplayPlayer(replay).play(tick)
+    return results
+
+
+def main():
+    results = run()
+    print(f"replay: {results['ticks']:,} frames, {results['bytes']:,} bytes, {results['keyframe_count']} keyframes")
+    print(f"{'seek':<12}{'p50 ms':>10}{'max ms':>10}")
+    for name in ('from start', 'keyframes'):
+        p50, worst = results[name]
+        print(f"{name:<12}{p50:>10.2f}{worst:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ import shutil
 import os
 
 from ..gamemodes.abstract_gamemode import AbstractGamemode
+from ..profiling.frame_profiler import FrameProfiler
 
 class Config:
     def __init__(self):
@@ -30,6 +31,10 @@ class Config:
 
         self.counter = 0
 
+        # Games are only recorded (see replay/) when TETRIS_REPLAY_DIR=<folder> says where to,
+        # None turns recording off
+        self.replay_dir = os.environ.get('TETRIS_REPLAY_DIR') or None
+
         self.load_sounds()
 
         # Get sound setting, default to True if not set
@@ -43,6 +48,13 @@ class Config:
         # Create default gamemode
         self.pending_gamemode = None
 
+        # Times the phases of every frame while it is on (F3 in game, see profiling/)
+        self.profiler = FrameProfiler()
+
+        # Whether the game state draws this frame, the adaptive frame pacing skips drawing
+        # (never the simulation) to catch up when it is behind
+        self.render_frame = True
+
     # On creation of the config object it wi
     def _check_for_config(self):
         os.makedirs("config", exist_ok=True)
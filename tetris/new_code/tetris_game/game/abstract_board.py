@@ -0,0 +1,95 @@
+"""
+    This is the abstract board class, every board backend (Board, BitBoard) has to overwrite it.
+
+    It also keeps the skyline: column_tops[x] is the row of the highest block in column x
+    (height when the column is empty). The backends update it in freeze_piece, break_lines and
+    clear_column so a hard drop can find its landing row without stepping down one row at a time
+"""
+from abc import ABC, abstractmethod
+
+from .piece.piece_masks import get_collision_mask
+
+class AbstractBoard(ABC):
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.state = "play" # state will be either play or pause (if we add a pause)
+        self.blockPixelSize = 20 # Was Tzoom
+
+        # Skyline, the row of the top block in each column
+        self.column_tops = [self.height] * self.width
+
+    @abstractmethod
+    def intersects(self, piece):
+        pass
+
+    @abstractmethod
+    def freeze_piece(self, piece):
+        pass
+
+    @abstractmethod
+    def break_lines(self):
+        pass
+
+    @abstractmethod
+    def clear_column(self, col_x):
+        pass
+
+    # Puts back the cells from snapshot()
+    @abstractmethod
+    def restore(self, cells):
+        pass
+
+    # Every cell as one byte, row by row. Small enough to keep many of them (replay keyframes)
+    def snapshot(self):
+        return b''.join(bytes(row) for row in self.field)
+
+    # Works the skyline out from the cells, for when the whole field was replaced
+    def _rebuild_column_tops(self):
+        field = self.field
+        for x in range(self.width):
+            top = self.height
+            for y in range(self.height):
+                if field[y][x]:
+                    top = y
+                    break
+            self.column_tops[x] = top
+
+    # Stack height of every column (0 for an empty column), used by the AI and scoring helpers
+    def get_column_heights(self):
+        return [self.height - top for top in self.column_tops]
+
+    # The yShift the piece would land on with a hard drop, the piece itself is not moved
+    def drop_y(self, piece):
+        mask = get_collision_mask(piece)
+        x = piece.xShift
+        y = piece.yShift
+
+        # Outside the walls, let the normal collision check deal with it
+        if x + mask.min_x < 0 or x + mask.max_x >= self.width:
+            return self._step_drop_y(piece)
+
+        # Lowest spot the floor allows, then every column the piece covers can only raise it
+        landing = self.height - 1 - mask.max_y
+        tops = self.column_tops
+        for j, bottom in mask.bottoms:
+            top = tops[x + j]
+
+            # The piece is already below the top block of this column (tucked under an
+            # overhang), the skyline can't see what is under it
+            if y + bottom >= top:
+                return self._step_drop_y(piece)
+
+            if top - 1 - bottom < landing:
+                landing = top - 1 - bottom
+
+        return landing
+
+    # The old way of finding the landing row, one collision check per row
+    def _step_drop_y(self, piece):
+        old_y = piece.yShift
+        while not self.intersects(piece):
+            piece.yShift += 1
+        landing = piece.yShift - 1
+        piece.yShift = old_y
+        return landing
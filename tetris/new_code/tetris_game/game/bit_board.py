@@ -0,0 +1,116 @@
+"""
+    Bitboard version of the board. Every row is stored as one integer where bit j is set when
+    column j holds a block, so full row checks and collision tests are single integer operations.
+
+    The colors are kept in a separate plane (one bytearray per row) that has the same layout as
+    Board.field, this way the renderer can keep reading board.field[i][j] without knowing which
+    board it was given.
+
+    NOTE: Do not write into field directly, the occupancy bits would not be updated. Use
+    freeze_piece / clear_column instead
+"""
+
+from .abstract_board import AbstractBoard
+from .piece.piece_masks import get_collision_mask, get_figure_mask
+
+class BitBoard(AbstractBoard):
+    def __init__(self, height, width):
+        super().__init__(height, width)
+
+        # Value of a row that has every column filled
+        self.full_row = (1 << width) - 1
+
+        # Occupancy plane, one int per row
+        self.rows = [0] * self.height
+
+        # Color plane, one bytearray per row
+        self.field = [bytearray(self.width) for _ in range(self.height)]
+
+    def intersects(self, piece):
+        mask = get_collision_mask(piece)
+        x = piece.xShift
+        y = piece.yShift
+
+        # Check bounds first, the mask knows the piece's bounding box
+        if (y + mask.max_y >= self.height or y + mask.min_y < 0 or
+            x + mask.max_x >= self.width or x + mask.min_x < 0):
+            return True
+
+        # One AND per row the piece covers
+        shift = x + mask.min_x
+        rows = self.rows
+        for i, bits in mask.rows:
+            if rows[y + i] & (bits << shift):
+                return True
+
+        return False
+
+    # This will stop the piece from moving (called after it intersects with another piece)
+    def freeze_piece(self, piece):
+
+        for i, j in get_figure_mask(piece).cells:
+            board_y = i + piece.yShift
+            board_x = j + piece.xShift
+
+            if (0 <= board_y < self.height and 0 <= board_x < self.width):
+                self.rows[board_y] |= 1 << board_x
+                self.field[board_y][board_x] = piece.color
+                if board_y < self.column_tops[board_x]:
+                    self.column_tops[board_x] = board_y
+
+        broken_lines, cleared_indices = self.break_lines()
+
+        return broken_lines, cleared_indices
+
+    def break_lines(self):
+        full_row = self.full_row
+
+        # Full rows from the bottom up
+        full_rows = [i for i in range(self.height - 1, -1, -1) if self.rows[i] == full_row]
+        if not full_rows:
+            return 0, []
+
+        lines = len(full_rows)
+        kept = [i for i in range(self.height) if self.rows[i] != full_row]
+
+        # Drop the full rows and put fresh empty rows on top. Slice assignment keeps the same
+        # list objects alive for anyone holding on to board.field
+        self.rows[:] = [0] * lines + [self.rows[i] for i in kept]
+        self.field[:] = [bytearray(self.width) for _ in range(lines)] + [self.field[i] for i in kept]
+
+        # Report the indices the same way Board does. Every line cleared below a row moves that
+        # row down by one before it is cleared itself
+        cleared_indicies = [row + k for k, row in enumerate(full_rows)]
+
+        # Blocks only move down, so each column's new top is at or below its old one
+        rows = self.rows
+        for j in range(self.width):
+            i = self.column_tops[j]
+            while i < self.height and not rows[i] >> j & 1:
+                i += 1
+            self.column_tops[j] = i
+
+        return lines, cleared_indicies
+
+    # Removes every block in the column (used by the rocket)
+    def clear_column(self, col_x):
+        bit = 1 << col_x
+        keep = ~bit
+        for i in range(self.height):
+            if self.rows[i] & bit:
+                self.rows[i] &= keep
+                self.field[i][col_x] = 0
+        self.column_tops[col_x] = self.height
+
+    def restore(self, cells):
+        width = self.width
+        for i in range(self.height):
+            row = self.field[i]
+            row[:] = cells[i * width:(i + 1) * width]
+
+            bits = 0
+            for j in range(width):
+                if row[j]:
+                    bits |= 1 << j
+            self.rows[i] = bits
+        self._rebuild_column_tops()
@@ -4,112 +4,87 @@
     All board management is handled here, and will save the current state of the board
 """
 
+from .abstract_board import AbstractBoard
+from .piece.piece_masks import get_collision_mask, get_figure_mask
+
 # This initalizes the board - will be called everytime the game starts
-class Board:
+class Board(AbstractBoard):
     def __init__(self, height, width):
-        self.height = height
-        self.width = width
+        super().__init__(height, width)
         self.field = []
-        self.state = "play" # state will be either play or pause (if we add a pause)
-        self.blockPixelSize = 20 # Was Tzoom
 
         for i in range(self.height):
             new_line = [0] * self.width # polymorphism using * 
             self.field.append(new_line)
 
     def intersects(self, piece):
-        intersection = False
-
-        # Special handling for special pieces with custom dimensions
-        if piece.is_special and hasattr(piece, 'width') and hasattr(piece, 'height'):
-            # Check if any part of the special piece overlaps with the board or existing pieces
-            for i in range(piece.height):
-                for j in range(piece.width):
-                    board_y = piece.yShift + i
-                    board_x = piece.xShift + j
-                    
-                    # Check bounds
-                    if (board_y >= self.height or board_y < 0 or 
-                        board_x >= self.width or board_x < 0):
-                        intersection = True
-                        break
-                    
-                    # Check if there's already a piece at this position
-                    if board_y >= 0 and board_x >= 0 and self.field[board_y][board_x] > 0:
-                        intersection = True
-                        break
-                
-                if intersection:
-                    break
-            
-            return intersection
-
-        # Check each block of the 4x4 piece grid (for normal pieces)
-        # I is the height(Y)
-        for i in range(4):
-            # J is the width(X)
-            for j in range(4):
-                if i * 4 + j in piece.get_figure():
-                    # Calculate the actual board position
-                    board_y = i + piece.yShift
-                    board_x = j + piece.xShift
-                    
-                    # Check bounds first to avoid index errors
-                    if (board_y >= self.height or board_y < 0 or 
-                        board_x >= self.width or board_x < 0):
-                        intersection = True
-                        break
-                    
-                    # Check if there's already a piece at this position
-                    if self.field[board_y][board_x] > 0:
-                        intersection = True
-                        break
-            
-            if intersection:
-                break
-                
-        return intersection
+        mask = get_collision_mask(piece)
+        x = piece.xShift
+        y = piece.yShift
+
+        # Check bounds first to avoid index errors, the mask knows the piece's bounding box
+        if (y + mask.max_y >= self.height or y + mask.min_y < 0 or
+            x + mask.max_x >= self.width or x + mask.min_x < 0):
+            return True
+
+        # Check if there's already a piece at any of the cells
+        field = self.field
+        for i, j in mask.cells:
+            if field[y + i][x + j] > 0:
+                return True
+
+        return False
     
     # This will stop the piece from moving (called after it intersects with another piece)
     def freeze_piece(self, piece):
         
-        for i in range(4):
-            for j in range(4):
-                if i * 4 + j in piece.get_figure():
-                    board_y = i + piece.yShift
-                    board_x = j + piece.xShift
+        for i, j in get_figure_mask(piece).cells:
+            board_y = i + piece.yShift
+            board_x = j + piece.xShift
 
-                    if (0 <= board_y < self.height and 0 <= board_x < self.width):
-                        self.field[board_y][board_x] = piece.color
+            if (0 <= board_y < self.height and 0 <= board_x < self.width):
+                self.field[board_y][board_x] = piece.color
+                if board_y < self.column_tops[board_x]:
+                    self.column_tops[board_x] = board_y
 
         broken_lines, cleared_indices = self.break_lines()
         
         return broken_lines, cleared_indices
     
     def break_lines(self):
-        lines = 0
-        cleared_indicies = [] # Which lines where broken
-        i = self.height - 1  # Start from bottom
-        while i >= 0:
-            zeros = 0
-            for j in range(self.width):
-                if self.field[i][j] == 0:
-                    zeros += 1
-            
-            # this row is full
-            if zeros == 0:
-                lines += 1
-                cleared_indicies.append(i)
-                # Remove the full line by moving all rows above it down
-                for k in range(i, 1, -1):
-                    for j in range(self.width):
-                        self.field[k][j] = self.field[k - 1][j]
-                # Clear the top row
-                for j in range(self.width):
-                    self.field[0][j] = 0
-                # Don't increment i since we need to check this row again
-                # (a new row has moved down to this position)
-            else:
-                i -= 1  # Only move up if no line was cleared
+        # Find every full row in one scan (bottom up)
+        full_rows = [i for i in range(self.height - 1, -1, -1) if 0 not in self.field[i]]
+        if not full_rows:
+            return 0, []
+
+        lines = len(full_rows)
+
+        # Compact in one pass: keep the rows that are not full and put fresh empty rows on top.
+        # Slice assignment keeps the same list for anyone holding on to board.field
+        self.field[:] = [[0] * self.width for _ in range(lines)] + [row for row in self.field if 0 in row]
+
+        # Which lines where broken. Every line cleared below a row moves that row down by one
+        # before it is cleared itself, so the index is where the line was when it broke
+        cleared_indicies = [row + k for k, row in enumerate(full_rows)]
+
+        # Blocks only move down, so each column's new top is at or below its old one
+        for j in range(self.width):
+            i = self.column_tops[j]
+            while i < self.height and self.field[i][j] == 0:
+                i += 1
+            self.column_tops[j] = i
 
         return lines, cleared_indicies
+
+    # Removes every block in the column (used by the rocket)
+    def clear_column(self, col_x):
+        for i in range(self.height):
+            if self.field[i][col_x] > 0:
+                self.field[i][col_x] = 0
+        self.column_tops[col_x] = self.height
+
+    def restore(self, cells):
+        width = self.width
+        for i in range(self.height):
+            self.field[i][:] = cells[i * width:(i + 1) * width]
+        self._rebuild_column_tops()
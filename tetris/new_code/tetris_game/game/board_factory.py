@@ -0,0 +1,25 @@
+"""
+    Will act as a factory for the board backends. The gamemode config can choose which one is
+    used with the 'board' key, the list based Board is used when nothing is given
+"""
+
+from .board import Board
+from .bit_board import BitBoard
+
+class BoardFactory:
+
+    # Registry for all the board backends
+    _board_reg = {
+        'list': Board,
+        'bitboard': BitBoard,
+    }
+
+    def __init__(self, gamemode_config):
+        self.board_type = gamemode_config.get('board', 'list')
+
+        if self.board_type not in self._board_reg:
+            raise ValueError(f"Unknown board type: {self.board_type}")
+
+    def create_board(self, height, width):
+        board_class = self._board_reg[self.board_type]
+        return board_class(height, width)
@@ -7,57 +7,52 @@
 
 from abc import abstractmethod
 
+from .piece.piece_action import PieceAction
+
 class Command:
+    __slots__ = ()
 
     @abstractmethod
     def execute(self):
         pass
 
 
+# Commands hold no state of their own (the piece and board come in through execute), so one
+# instance of each is shared by every game and reused for every input
+
 class MoveCommand(Command):     
+    __slots__ = ('direction', 'distance')
+
     def __init__(self, direction, distance=1):  # distance, in case we want to add extra ability
         super().__init__()
         self.direction = direction
         self.distance = distance # -1 for left +1 for right
     
     def execute(self, piece, board):
-        self.piece = piece
-        self.board = board
-
-        piece.go_side(self.direction * self.distance, self.board)
+        piece.go_side(self.direction * self.distance, board)
         return False
 
 class RotateCommand(Command):
+    __slots__ = ('direction',)
+
     def __init__(self, clockwise=True):
         super().__init__()
-        self.clockwise = clockwise
+        self.direction = 1 if clockwise else -1
 
     def execute(self, piece, board):
-        self.piece = piece
-        self.board = board
-
         # Special blocks cannot rotate
         if piece.is_special:
             return False
 
-        # Store old rotation
-        old_rotation = piece.rotation
-        if self.clockwise:
-            piece.rotation = (piece.rotation + 1) % len(piece.figures[piece.type])
-        else:
-            piece.rotation = (piece.rotation - 1) % len(piece.figures[piece.type])
-
-        can_rotate = not board.intersects(piece)
-        piece.rotation = old_rotation
-        
-        #Success
-        if can_rotate:
-            piece.rotate(board)
+        # The piece rotates and puts itself back if it does not fit, one intersects check
+        piece.rotate(board, self.direction)
 
         #Todo: something when failed
         return False
     
 class SoftDropCommand(Command):
+    __slots__ = ()
+
     def execute(self, piece, board):
         old_y = piece.yShift
         piece.yShift += 1
@@ -66,27 +61,30 @@ class SoftDropCommand(Command):
         return False
     
 class HardDropCommand(Command):
+    __slots__ = ()
+
     def execute(self, piece, board):
         result = piece.instant_drop(board)
         # Return tuple (lines_broken, cleared_indices) if available, otherwise just lines_broken
         return result
+
+
+# The shared command for every PieceAction that moves the piece
+COMMANDS = {
+    PieceAction.MOVE_LEFT: MoveCommand(-1),
+    PieceAction.MOVE_RIGHT: MoveCommand(+1),
+    PieceAction.ROTATE_CLOCKWISE: RotateCommand(True),
+    PieceAction.ROTATE_COUNTERCLOCKWISE: RotateCommand(False),
+    PieceAction.SOFT_DROP: SoftDropCommand(),
+    PieceAction.HARD_DROP: HardDropCommand(),
+}
     
-# Creates a command map based on the enum commands listed in piece_action.py
+# Looks up the command for the enum commands listed in piece_action.py
 class CommandFactory:
     def __init__(self):
+        self._command_map = COMMANDS
 
-        from .piece.piece_action import PieceAction
-
-        self._command_map = {
-            PieceAction.MOVE_LEFT: lambda: MoveCommand(-1),
-            PieceAction.MOVE_RIGHT: lambda: MoveCommand(+1),
-            PieceAction.ROTATE_CLOCKWISE: lambda: RotateCommand(True),
-            PieceAction.ROTATE_COUNTERCLOCKWISE: lambda: RotateCommand(False),
-            PieceAction.SOFT_DROP: lambda: SoftDropCommand(),
-            PieceAction.HARD_DROP: lambda: HardDropCommand()
-        }
-
-    # Gets a PieceAction enum passed by the input handler which then tells the piece what to do
+    # Gets a PieceAction enum passed by the input handler which then tells the piece what to do.
+    # Nothing is created, the same command object comes back for the same action every time
     def create_command(self, action):
-        command_constructor = self._command_map.get(action)
-        return command_constructor() if command_constructor else None
+        return self._command_map.get(action)
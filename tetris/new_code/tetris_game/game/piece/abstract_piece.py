@@ -6,6 +6,9 @@
 from abc import ABC, abstractmethod
 
 class AbstractPiece(ABC):
+    # Pieces are created for every spawn (and many more by the AI search), so no __dict__
+    __slots__ = ('xShift', 'yShift', 'rotation')
+
     def __init__(self, x, y, piece_type=None, piece_color=None):
         self.xShift = x
         self.yShift = y
@@ -16,7 +19,7 @@ class AbstractPiece(ABC):
         pass
         
     @abstractmethod
-    def rotate(self, board):
+    def rotate(self, board, direction=1):
         pass
 
     @abstractmethod
@@ -36,9 +39,7 @@ class AbstractPiece(ABC):
 
     # When pressing instant drop key
     def instant_drop(self, board):
-        while not board.intersects(self):
-            self.yShift += 1 
-        self.yShift -= 1
+        self.yShift = board.drop_y(self)
         result = board.freeze_piece(self)
         print(result)
         # Return tuple (lines_broken, cleared_indices)
@@ -5,28 +5,39 @@
 """
 
 import random
+from types import MappingProxyType
+
 from ...main.constants import COLORS
 
 from ..piece.abstract_piece import AbstractPiece
 
+# Every shape and rotation, each number is a cell index in the 4x4 grid (i * 4 + j).
+# This is the flyweight every piece shares, it is read only so no piece can change a shape
+FIGURES = MappingProxyType({
+    'I' : ((1, 5, 9, 13), (4, 5, 6, 7)),  # I piece
+    'Z' : ((4, 5, 9, 10), (2, 6, 5, 9)),  # Z Piece
+    'S' : ((6, 7, 9, 10), (1, 5, 6, 10)), # S Piece
+    'L' : ((1, 2, 5, 9), (0, 4, 5, 6), (1, 5, 9, 8), (4, 5, 6, 10)),      # L Piece
+    'J' : ((1, 2, 6, 10), (5, 6, 7, 9), (2, 6, 10, 11), (3, 5, 6, 7)),    # J Piece   
+    'T' : ((1, 4, 5, 6), (1, 4, 5, 9), (4, 5, 6, 9), (1, 5, 6, 9)),       # T Piece
+    'O' : ((1, 2, 5, 6),) # O (square) piece
+})
+
+PIECE_TYPES = tuple(FIGURES)
+
 class Piece(AbstractPiece):
+    # A piece only holds its own state (position from AbstractPiece, type and color),
+    # the shapes are looked up in FIGURES
+    __slots__ = ('type', 'color')
+
+    is_special = False
+    figures = FIGURES
+
     def __init__(self, x, y, piece_type=None, piece_color=None):
-        self.xShift = x
-        self.yShift = y
-        self.rotation = 0   
-        self.is_special = False
-        self.figures = {
-        'I' : [[1, 5, 9, 13], [4, 5, 6, 7]],  # I piece
-        'Z' : [[4, 5, 9, 10], [2, 6, 5, 9]],  # Z Piece
-        'S' : [[6, 7, 9, 10], [1, 5, 6, 10]], # S Piece
-        'L' : [[1, 2, 5, 9], [0, 4, 5, 6], [1, 5, 9, 8], [4, 5, 6, 10]],      # L Piece
-        'J' : [[1, 2, 6, 10], [5, 6, 7, 9], [2, 6, 10, 11], [3, 5, 6, 7]],    # J Piece   
-        'T' : [[1, 4, 5, 6], [1, 4, 5, 9], [4, 5, 6, 9], [1, 5, 6, 9]],       # T Piece
-        'O' : [[1, 2, 5, 6]] # O (square) piece
-        }
+        super().__init__(x, y, piece_type, piece_color)
 
         if piece_type is None:
-            self.type = random.choice(list(self.figures.keys()))
+            self.type = random.choice(PIECE_TYPES)
         else:
             self.type = piece_type
 
@@ -45,21 +56,17 @@ class Piece(AbstractPiece):
 
     # When pressing instant drop key
     def instant_drop(self, board):
-        while not board.intersects(self):
-            self.yShift += 1 
-        self.yShift -= 1
+        self.yShift = board.drop_y(self)
         result = self._freeze(board)
         # Return tuple (lines_broken, cleared_indices)
         return result
 
-    def rotate(self, board):   
-        def rotate_figure():
-            self.rotation = (self.rotation + 1) % len(self.figures[self.type])
-
-        oldRotation = self.rotation
-        rotate_figure()
+    # direction is +1 for clockwise and -1 for counterclockwise, the rotation is undone if it does not fit
+    def rotate(self, board, direction=1):
+        old_rotation = self.rotation
+        self.rotation = (old_rotation + direction) % len(self.figures[self.type])
         if board.intersects(self):
-            self.rotation = oldRotation
+            self.rotation = old_rotation
 
     # this gets called automatically - will get called faster when the down button is pressed
     def go_down(self, board):
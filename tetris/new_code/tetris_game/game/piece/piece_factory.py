@@ -8,11 +8,17 @@
 from .abstract_piece import AbstractPiece
 from .special_pieces.abstract_special import AbstractSpecialPiece
 
-from .piece import Piece
+from .piece import Piece, PIECE_TYPES
 from .special_pieces.rocket_piece import RocketPiece 
+from .randomizer import RANDOMIZERS
+from .piece_queue import PieceQueue
 
 import random
 
+from ...main.constants import COLORS
+
+CLASSIC_PIECES = PIECE_TYPES
+
 class PieceFactory:
 
     # Registry for all current pieces in the game, makes dynamically creating the pieces easier
@@ -28,26 +34,87 @@ class PieceFactory:
         'rocket': RocketPiece,
     } 
 
-    def __init__(self, gamemode_config):
+    def __init__(self, gamemode_config, rng=None):
         self.gamemode_config = gamemode_config # a map that holds all the pieces the gamemode allows for
 
-        # Pool for the factory to select from
+        # Every piece and color choice is drawn from this stream, the gamemode owns it so each
+        # game can be seeded and replayed on its own
+        self.rng = rng if rng is not None else random.Random()
+
+        # Pool for the randomizer to select from
         self.piece_pool = []
 
         if self.gamemode_config['mode'] == 'classic' or gamemode_config.get('include_classic', True):
-            self.piece_pool.extend(['I', 'Z', 'S', 'L', 'J', 'T', 'O'])
+            self.piece_pool.extend(CLASSIC_PIECES)
+
+        # Special pieces are not part of the pool, they spawn on their own schedule
+        # (every interval-th piece). Without classic pieces the randomizer picks between them
+        self.special_pieces = list(gamemode_config.get('special_pieces', []))
+        if not self.piece_pool:
+            self.piece_pool.extend(self.special_pieces)
+            self.special_pieces = []
+
+        self.randomizer_type = gamemode_config.get('randomizer', 'uniform')
+        if self.randomizer_type not in RANDOMIZERS:
+            raise ValueError(f"Unknown randomizer: {self.randomizer_type}")
+
+        self.reset()
+
+    # Starts the piece sequence over, called by the gamemode when the game (re)starts. skip
+    # jumps past the first pieces, a saved game is put back with the pieces it had made
+    def reset(self, skip=0):
+        self.randomizer = RANDOMIZERS[self.randomizer_type](self.piece_pool, self.rng)
+        self.queue = PieceQueue(self._piece_stream())
+
+        # Pieces handed out so far this game
+        self.created = skip
+        for _ in range(skip):
+            self.queue.pop()
+
+    # Carries on from stream, a (piece_type, color) iterator that is created pieces into this
+    # game's sequence (a replay seeking to the middle of a game already knows it)
+    def resume(self, stream, created):
+        self.queue = PieceQueue(stream)
+        self.created = created
+
+    # Endless (piece_type, color) stream. Colors are drawn with the type so a lookahead shows
+    # exactly what will spawn
+    def _piece_stream(self):
+        piece_types = iter(self.randomizer)
+        spawned = 0
+        while True:
+            spawned += 1
+
+            special = self._scheduled_special(spawned)
+            if special is not None:
+                yield special, None
+                continue
+
+            piece_type = next(piece_types)
+            if piece_type in CLASSIC_PIECES:
+                yield piece_type, self.rng.randint(1, len(COLORS) - 1)
+            else:
+                yield piece_type, None
+
+    def _scheduled_special(self, spawned):
+        for piece_type in self.special_pieces:
+            if spawned % self._piece_reg[piece_type].interval == 0:
+                return piece_type
+        return None
 
-        # Add the special pieces
-        self.piece_pool.extend(gamemode_config.get('special_pieces', []))
+    # The next count pieces as (piece_type, color), without spawning them
+    def peek(self, count=1):
+        return self.queue.peek(count)
 
     def create_random_piece(self, x, y):
-        piece_type = random.choice(self.piece_pool)
+        piece_type, piece_color = self.queue.pop()
+        self.created += 1
         piece_class = self._piece_reg[piece_type]
 
         # For classic pieces, pass the piece_type so it knows which shape
         # For special pieces, they handle their own shape
-        if piece_type in ['I', 'Z', 'S', 'L', 'J', 'T', 'O']:
-            return piece_class(x, y, piece_type=piece_type)
+        if piece_type in CLASSIC_PIECES:
+            return piece_class(x, y, piece_type=piece_type, piece_color=piece_color)
         else:
             # Special pieces
             return piece_class(x, y)
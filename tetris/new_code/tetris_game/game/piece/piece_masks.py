@@ -0,0 +1,76 @@
+"""
+    Precomputed collision masks for the pieces. Every shape and rotation in FIGURES is turned
+    into a PieceMask once at import, so the boards never have to walk the 4x4 grid.
+
+    A mask holds the occupied cells as (row, column) offsets for the list board, the same cells
+    as one bitmask per row for the bit board, the bounding box of the cells so the wall
+    checks are four comparisons, and the lowest cell of every column for hard drops.
+"""
+
+from .piece import FIGURES
+
+class PieceMask:
+    def __init__(self, cells):
+        # (row, column) offsets from the piece's yShift/xShift, sorted top to bottom
+        self.cells = tuple(sorted(cells))
+
+        self.min_y = min(i for i, j in self.cells)
+        self.max_y = max(i for i, j in self.cells)
+        self.min_x = min(j for i, j in self.cells)
+        self.max_x = max(j for i, j in self.cells)
+
+        # (row, bits) pairs, bit 0 is column min_x. Shift by xShift + min_x to line up with a row
+        row_bits = {}
+        for i, j in self.cells:
+            row_bits[i] = row_bits.get(i, 0) | 1 << (j - self.min_x)
+        self.rows = tuple(sorted(row_bits.items()))
+
+        # (column, lowest row) pairs, the bottom profile used to find where a hard drop lands
+        bottoms = {}
+        for i, j in self.cells:
+            bottoms[j] = max(bottoms.get(j, i), i)
+        self.bottoms = tuple(sorted(bottoms.items()))
+
+
+def figure_mask(figure):
+    # Works for any figure written as 4x4 grid indices
+    return PieceMask((p // 4, p % 4) for p in figure)
+
+
+def rect_mask(width, height):
+    # Special pieces such as the rocket are solid rectangles
+    key = (width, height)
+    if key not in _rect_masks:
+        _rect_masks[key] = PieceMask((i, j) for i in range(height) for j in range(width))
+    return _rect_masks[key]
+
+
+# Every classic shape and rotation, keyed by (type, rotation)
+FIGURE_MASKS = {
+    (piece_type, rotation): figure_mask(figure)
+    for piece_type, rotations in FIGURES.items()
+    for rotation, figure in enumerate(rotations)
+}
+
+_rect_masks = {}
+
+# Figures that are not in FIGURES (e.g. special pieces), built the first time they are seen
+_extra_masks = {}
+
+
+# The cells a piece occupies in its 4x4 grid, this is what gets frozen onto the board
+def get_figure_mask(piece):
+    mask = FIGURE_MASKS.get((piece.type, piece.rotation))
+    if mask is None:
+        figure = tuple(piece.get_figure())
+        mask = _extra_masks.get(figure)
+        if mask is None:
+            mask = _extra_masks[figure] = figure_mask(figure)
+    return mask
+
+
+# The cells a piece collides with, special pieces use their whole rectangle
+def get_collision_mask(piece):
+    if piece.is_special and hasattr(piece, 'width') and hasattr(piece, 'height'):
+        return rect_mask(piece.width, piece.height)
+    return get_figure_mask(piece)
@@ -0,0 +1,24 @@
+"""
+    Lazy lookahead queue over an endless piece stream. Only the pieces that have been peeked
+    at are kept, so looking N pieces ahead never builds more than N entries of the sequence
+"""
+
+from collections import deque
+from itertools import islice
+
+class PieceQueue:
+    def __init__(self, stream):
+        self._stream = iter(stream)
+        self._buffer = deque()
+
+    # The next count entries, without taking them off the queue
+    def peek(self, count=1):
+        while len(self._buffer) < count:
+            self._buffer.append(next(self._stream))
+        return list(islice(self._buffer, count))
+
+    # Takes the next entry off the queue
+    def pop(self):
+        if self._buffer:
+            return self._buffer.popleft()
+        return next(self._stream)
@@ -0,0 +1,61 @@
+"""
+    Randomizers decide the order the pieces come in. Each one is an endless generator of piece
+    types that draws from the gamemode's random stream, so a seed always gives the same order.
+
+    uniform - every piece is an independent pick from the pool (the original behaviour)
+    bag     - the whole pool is shuffled and dealt out before it is refilled (7-bag)
+    history - rerolls a pick that is in the last few pieces (TGM style), fewer repeats
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+
+class AbstractRandomizer(ABC):
+    def __init__(self, pool, rng):
+        self.pool = list(pool)
+        self.rng = rng
+
+    # Endless stream of piece types
+    @abstractmethod
+    def __iter__(self):
+        pass
+
+
+class UniformRandomizer(AbstractRandomizer):
+    def __iter__(self):
+        while True:
+            yield self.rng.choice(self.pool)
+
+
+class BagRandomizer(AbstractRandomizer):
+    def __iter__(self):
+        while True:
+            bag = list(self.pool)
+            self.rng.shuffle(bag)
+            yield from bag
+
+
+class HistoryRandomizer(AbstractRandomizer):
+    def __init__(self, pool, rng, history_size=4, rolls=4):
+        super().__init__(pool, rng)
+        self.history_size = history_size
+        self.rolls = rolls
+
+    def __iter__(self):
+        history = deque(maxlen=self.history_size)
+        while True:
+            # Take the first roll that is not in the history, or the last roll if they all are
+            for _ in range(self.rolls):
+                piece_type = self.rng.choice(self.pool)
+                if piece_type not in history:
+                    break
+            history.append(piece_type)
+            yield piece_type
+
+
+# Registry for the randomizers, picked with the 'randomizer' key of the gamemode config
+RANDOMIZERS = {
+    'uniform': UniformRandomizer,
+    'bag': BagRandomizer,
+    'history': HistoryRandomizer,
+}
@@ -3,18 +3,20 @@ from abc import abstractmethod
 from ..abstract_piece import AbstractPiece
 
 class AbstractSpecialPiece(AbstractPiece):
+    __slots__ = ()
+
+    is_special = True
+
     def __init__(self, x, y, piece_type=None, piece_color=None):
         super().__init__(x, y, piece_type, piece_color)
 
-        self.is_special = True
-        
 
     @abstractmethod
     def go_side(self, newXShift, board):
         pass
         
     @abstractmethod
-    def rotate(self, board):
+    def rotate(self, board, direction=1):
         pass
 
     @abstractmethod
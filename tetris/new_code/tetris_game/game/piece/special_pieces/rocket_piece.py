@@ -1,17 +1,20 @@
 from .abstract_special import AbstractSpecialPiece
 
 class RocketPiece(AbstractSpecialPiece):
+    __slots__ = ('type', 'color')
+
+    # Same for every rocket
+    width = 3
+    height = 6
+
+    # How often this block spawns, every X block is this block
+    interval = 15
+
     def __init__(self, x, y, piece_type=None, piece_color=None):
         super().__init__(x, y, piece_type, piece_color)
 
         self.type = -1
         self.color = -1
-
-        self.width = 3
-        self.height = 6
-
-        # How often this block spawns, every X block is this block
-        self.interval = 15
     
     # When pressing left or right, move x amount
     def go_side(self, newXShift, board):
@@ -21,7 +24,7 @@ class RocketPiece(AbstractSpecialPiece):
             self.xShift = old_x
         return
         
-    def rotate(self, board):
+    def rotate(self, board, direction=1):
         # Cannot rotate
         return
     
@@ -35,9 +38,7 @@ class RocketPiece(AbstractSpecialPiece):
         # When pressing instant drop key
     def instant_drop(self, board):
         # Drop to the bottom
-        while not board.intersects(self):
-            self.yShift += 1 
-        self.yShift -= 1
+        self.yShift = board.drop_y(self)
         
         # Execute special ability (clear columns)
         self.special_ability(board)
@@ -50,7 +51,7 @@ class RocketPiece(AbstractSpecialPiece):
         # Rocket is 6 blocks tall (0-5), so we want collision at the bottom (row 5)
         # But since we're in a 4x4 grid system, we use row 3 and adjust yShift
         # This creates invisible collision blocks 5 rows down from yShift
-        return [12, 13, 14]  # Bottom row: positions (3,0), (3,1), (3,2)
+        return (12, 13, 14)  # Bottom row: positions (3,0), (3,1), (3,2)
     
     def special_ability(self, board):
         # Rocket clears all blocks in the 3 columns where it lands
@@ -59,6 +60,4 @@ class RocketPiece(AbstractSpecialPiece):
             col_x = self.xShift + j
             if 0 <= col_x < board.width:
                 # Clear entire column
-                for i in range(board.height):
-                    if board.field[i][col_x] > 0:
-                        board.field[i][col_x] = 0
\ No newline at end of file
+                board.clear_column(col_x)
\ No newline at end of file
@@ -1,13 +1,29 @@
 from abc import ABC, abstractmethod
 
+import random
+
 from ..game.piece.piece_factory import PieceFactory
+from ..game.board_factory import BoardFactory
 
 class AbstractGamemode(ABC):
-    def __init__(self, gamemode_config, config):
+    def __init__(self, gamemode_config, config, seed=None):
 
         self.config = config
+        self.gamemode_config = gamemode_config
+
+        # Every random choice in the game comes from this stream. The same seed gives the same
+        # game, None picks a fresh seed every time the game starts
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # The seed the current game runs on (seed, or the fresh one picked for it)
+        self.game_seed = seed
+
+        # Gets every frame and action while a game is being recorded (replay/replay_recorder.py)
+        self.recorder = None
 
-        self.piece_factory = PieceFactory(gamemode_config)
+        self.piece_factory = PieceFactory(gamemode_config, self.rng)
+        self.board_factory = BoardFactory(gamemode_config)
 
         self.SCORING = [
             40,     # Single Line 
@@ -17,6 +33,32 @@ class AbstractGamemode(ABC):
         ]
 
 
+    # Picks the seed for a new game and starts the random stream on it
+    def _seed_game(self):
+        if self.seed is not None:
+            self.game_seed = self.seed
+        else:
+            # A fresh seed every game, drawn outside the random module so it is left alone
+            self.game_seed = random.SystemRandom().getrandbits(32)
+        self.rng.seed(self.game_seed)
+
+    # How far the counter has to move on before handle_downkey drops the piece a row
+    def gravity_interval(self, pressing_down):
+        if pressing_down:
+            return 5    # Move every 5 frames when holding down
+        return self.config.fps // 2     # Normal speed
+
+    # Records the game from here on, it has to be called before the first frame
+    def attach_recorder(self, recorder):
+        self.recorder = recorder
+        recorder.start(self)
+
+    # Ends the recording with the result of the game
+    def detach_recorder(self, gameover=True):
+        if self.recorder is not None:
+            self.recorder.finish(self, gameover)
+            self.recorder = None
+
     @abstractmethod
     def update(self, game_state):
         # Update the game logic for this mode
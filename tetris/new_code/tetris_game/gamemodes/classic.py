@@ -6,13 +6,11 @@
 
 from .abstract_gamemode import AbstractGamemode
 
-from ..game.board import Board
-
 from ..game.game_command import CommandFactory
 
 class Classic(AbstractGamemode):
-    def __init__(self, gamemode_config, config):
-        super().__init__(gamemode_config, config)
+    def __init__(self, gamemode_config, config, seed=None):
+        super().__init__(gamemode_config, config, seed)
 
         # State specific objects
         self.command_factory = CommandFactory()
@@ -36,12 +34,18 @@ class Classic(AbstractGamemode):
         
         self._start_up()
 
-    def restart(self):
+    def restart(self, seed=None):
+        if seed is not None:
+            self.seed = seed
         self._start_up()
 
     def _start_up(self):
         self.piece = None
 
+        # Start the piece stream over (a new random one when there is no seed)
+        self._seed_game()
+        self.piece_factory.reset()
+
         # Reset lines to 0
         self.total_lines_broken = 0
 
@@ -49,7 +53,7 @@ class Classic(AbstractGamemode):
         self.config.level = 1
         self.display_level = 1
 
-        self.board = Board(self.board_height, self.board_width)
+        self.board = self.board_factory.create_board(self.board_height, self.board_width)
         self.blocks_placed = 0
         self.points = 0
 
@@ -68,13 +72,11 @@ class Classic(AbstractGamemode):
         self.points += self.SCORING[lines_cleared - 1]
 
     def handle_downkey(self, pressing_down, counter, fps):
+        if self.recorder is not None:
+            self.recorder.frame(self.config.counter, self.config.level, pressing_down)
+
         # Handle automatic downward movement
-        should_move_down = False
-        
-        if pressing_down:
-            should_move_down = (self.config.counter - self.last_move_counter) >= 5   # Move every 5 frames when holding down
-        else:
-            should_move_down = (self.config.counter - self.last_move_counter) >= (self.config.fps // 2) # Normal speed
+        should_move_down = (self.config.counter - self.last_move_counter) >= self.gravity_interval(pressing_down)
         
         if should_move_down:
             # Try to move piece down
@@ -90,6 +92,8 @@ class Classic(AbstractGamemode):
 
                 lines_broken, cleared_indices = result
 
+                self.total_lines_broken += lines_broken
+
                 # Play block sound when normal block is placed
                 self.config.play_block_sound()
 
@@ -126,6 +130,9 @@ class Classic(AbstractGamemode):
 
         need_new_piece = False
 
+        if self.recorder is not None:
+            self.recorder.action(action)
+
         command = self.command_factory.create_command(action)
         if command:
             result = command.execute(self.piece, self.board)
@@ -7,6 +7,9 @@ import pygame # type: ignore (ignores the "could not resolve" error)
  
 from ..game.piece.piece_action import PieceAction
 
+# Cycles the frame profiler: off, on, on with its overlay
+PROFILER_KEY = pygame.K_F3
+
 class Input:
     def __init__(self, config):
         self.config = config
@@ -27,6 +30,9 @@ class Input:
             if event.type == pygame.QUIT:
                 actions.append(PieceAction.QUIT)
             elif event.type == pygame.KEYDOWN:
+                if event.key == PROFILER_KEY:
+                    self.config.profiler.toggle()
+                    continue
                 action = self.key_to_action.get(event.key)
                 if action:
                     actions.append(action)
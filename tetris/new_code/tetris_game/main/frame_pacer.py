@@ -0,0 +1,89 @@
+"""
+    Adaptive frame pacing for run_game. Frames are due on a fixed schedule (one every 1 / fps
+    seconds from the first one) instead of clock.tick's "at least 1 / fps after the last
+    frame", so a long frame (a rocket going off with a burst of particles) can be caught up on.
+
+    A frame that starts more than a whole frame behind schedule isn't drawn: its input and
+    simulation ticks still run, only the drawing and the present are skipped, which makes it
+    short and brings the loop back on schedule. At most max_skip frames in a row are skipped,
+    and when the loop is further behind than that the schedule starts over from now.
+
+    Waiting for the next frame sleeps (pygame.time.wait), or with busy_loop uses
+    pygame.time.delay and spins the last bit, the busy wait Clock.tick_busy_loop does, for less
+    jitter at the cost of a busy CPU.
+
+    Usage:
+        pacer = FramePacer(config.fps)
+        while running:
+            render = pacer.begin_frame()
+            ... the frame, drawn only when render ...
+            pacer.wait()
+"""
+
+import time
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+# A frame starting later than this (seconds) after it was due counts as late
+LATE_TOLERANCE = 0.002
+
+class FramePacer:
+    def __init__(self, fps, busy_loop=False, max_skip=4, time_source=time.perf_counter):
+        self.period = 1 / fps
+        self.busy_loop = busy_loop
+        self.max_skip = max_skip
+        self._time = time_source
+
+        # When the next frame is due, None before the first one
+        self.next_frame = None
+        self._skipped = 0   # frames skipped in a row
+
+        # This frame: seconds it started after it was due (0 when on time) and if it is drawn
+        self.behind = 0.0
+        self.render = True
+
+        self.frames = 0
+        self.dropped_frames = 0
+        self.late_frames = 0
+
+    @property
+    def late(self):
+        return self.behind > LATE_TOLERANCE
+
+    # Starts a frame, returns whether it should be drawn
+    def begin_frame(self):
+        now = self._time()
+        if self.next_frame is None:
+            self.next_frame = now
+
+        self.behind = max(0.0, now - self.next_frame)
+        self.render = not (self.behind > self.period and self._skipped < self.max_skip)
+
+        if self.render:
+            self._skipped = 0
+        else:
+            self._skipped += 1
+            self.dropped_frames += 1
+        if self.late:
+            self.late_frames += 1
+        self.frames += 1
+
+        if self.behind > self.period * (self.max_skip + 1):
+            # Too far behind to catch up, the schedule starts over from this frame
+            self.next_frame = now
+        self.next_frame += self.period
+        return self.render
+
+    # Waits until the next frame is due, straight back when it already is
+    def wait(self):
+        remaining = self.next_frame - self._time()
+        if remaining <= 0:
+            return
+
+        if not self.busy_loop:
+            pygame.time.wait(int(remaining * 1000))
+            return
+
+        pygame.time.delay(int(remaining * 1000))
+        while self._time() < self.next_frame:
+            pass
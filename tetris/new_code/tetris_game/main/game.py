@@ -3,9 +3,13 @@
 
     The main game run loop, inits all things for the game to begin properly
 """
+import os
+import time
+
 import pygame # type: ignore (ignores the "could not resolve" error)
 
 from ..ui.renderer import Renderer
+from ..ui.null_renderer import NullRenderer
 
 from ..input.input import Input
 
@@ -13,12 +17,30 @@ from ..config.config import Config
 
 from ..state.enhanced_state_manager import EnhancedStateManager
 
-def run_game():
+from .frame_pacer import FramePacer
+
+# Renderer backends the game can start with (TETRIS_RENDERER picks one when run_game isn't told).
+# 'window' is the game, 'offscreen' draws everything into memory on SDL's dummy video driver and
+# 'null' draws nothing. The last two have no window, for CI and profiling the whole state machine
+RENDERER_BACKENDS = ('window', 'offscreen', 'null')
+
+# How run_game waits for the next frame (TETRIS_PACING picks one when run_game isn't told).
+# 'tick' is clock.tick(fps), 'adaptive' keeps frames on a fixed schedule and skips drawing to
+# catch up when behind (see FramePacer), 'adaptive-busy' does that with a busy wait
+PACING_MODES = ('tick', 'adaptive', 'adaptive-busy')
+
+# Sets up pygame, the renderer backend and the states, returns (config, renderer, state_manager)
+def start_game(backend=None):
+    backend = backend or os.environ.get('TETRIS_RENDERER', 'window')
+    if backend not in RENDERER_BACKENDS:
+        raise ValueError(f"Unknown renderer backend: {backend}")
+
+    # Without a window SDL has to be told before it starts. These run on machines with no
+    # display or sound card, Config starts the mixer so audio gets the dummy driver too
+    if backend != 'window':
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
 
-    def quit_game():
-        nonlocal running
-        running = False
-    
     # Begin the config process 
     config = Config()
 
@@ -26,11 +48,12 @@ def run_game():
     pygame.init()
     screen = pygame.display.set_mode((config.window_width, config.window_height))
     pygame.display.set_caption("Code^3 Tetris")
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont('Comic Sans', 25, True, False)
 
-    # What creates the screen
-    renderer = Renderer(screen = screen)
+    # What creates the screen, it also holds the fonts every state draws with (renderer.text)
+    if backend == 'null':
+        renderer = NullRenderer(screen = screen)
+    else:
+        renderer = Renderer(screen = screen)
 
     # Create input
     input = Input(config)
@@ -38,23 +61,71 @@ def run_game():
     # Create the abstract state class to be handled throughout the loop
     state_manager = EnhancedStateManager(config, input, renderer)
 
-    # Main run Bool
-    running = True
+    # TETRIS_PROFILE=<file> profiles from the first frame and logs every frame to the file
+    profile_path = os.environ.get('TETRIS_PROFILE')
+    if profile_path:
+        config.profiler.enabled = True
+        config.profiler.log_to(profile_path)
 
-    # Main Run loop
-    while running:
+    return config, renderer, state_manager
 
-        config.counter += config.level
-        if config.counter > 100000:
-            config.counter = 0
+# One frame of the game, returns False once it should quit. With a pacer the frame is only
+# drawn and presented when the pacer says so, the states' updates always run
+def run_frame(config, renderer, state_manager, pacer=None):
+    profiler = config.profiler
+    profiler.begin_frame()
+    frame_start = time.perf_counter()
 
-        # Update the current state to update the screen. IF returns false then the game will quit
-        running = state_manager.update()
+    render = True
+    if pacer is not None:
+        render = pacer.begin_frame()
+        profiler.pacing(not render, int(pacer.behind * 1e9) if pacer.late else 0)
+    config.render_frame = render
+
+    # Update the current state to update the screen. IF returns false then the game will quit.
+    # The game state runs its simulation ticks (counter, gravity) in here, see SimulationClock
+    running = state_manager.update()
+
+    # A frame the pacer drops isn't drawn, so there is nothing to present
+    if render:
+        # Called with no lines too, so a menu (drawn only once) loses the box when it is turned off
+        renderer.draw_overlay(profiler.summary_lines() if profiler.enabled and profiler.overlay else [])
 
         # refresh the screen
-        pygame.display.flip()
-        clock.tick(config.fps)
+        profiler.start('present')
+        renderer.present()
+        profiler.stop('present')
+    profiler.end_frame()
+
+    # How long the frame's work took (without the wait in tick), the effects cut down on particles
+    # when it runs long. Dropped frames count too, they are part of the frame time the LOD smooths
+    renderer.particle_lod.frame(time.perf_counter() - frame_start)
+    return running
+
+def run_game(backend=None, pacing=None):
+    pacing = pacing or os.environ.get('TETRIS_PACING', 'tick')
+    if pacing not in PACING_MODES:
+        raise ValueError(f"Unknown frame pacing: {pacing}")
+
+    config, renderer, state_manager = start_game(backend)
+    clock = pygame.time.Clock()
+
+    pacer = None
+    if pacing != 'tick':
+        pacer = FramePacer(config.fps, busy_loop=(pacing == 'adaptive-busy'))
+
+    # Main run Bool
+    running = True
+
+    # Main Run loop
+    while running:
+        running = run_frame(config, renderer, state_manager, pacer)
+        if pacer is None:
+            clock.tick(config.fps)
+        else:
+            pacer.wait()
     
+    config.profiler.close()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+"""
+    Fixed timestep for the game's simulation. Every frame advance() adds the time since the last
+    frame to an accumulator and says how many ticks of 1 / tick_rate seconds it holds, the game
+    runs that many simulation ticks (counter, gravity, keys) before it draws. The simulation
+    then keeps the same speed whether frames are drawn faster or slower than the tick rate.
+
+    After a long frame at most max_ticks are run, the rest of the time is dropped (counted in
+    dropped_ticks) so a slow frame can't snowball into slower and slower catch-up frames.
+
+    alpha is how far the accumulator is between the last tick and the next one (0 to 1), drawing
+    uses it to put the effects part way to where the next tick moves them.
+
+    Usage:
+        clock = SimulationClock(config.fps)
+        for _ in range(clock.advance()):
+            tick()
+        draw(clock.alpha)
+"""
+
+import time
+
+class SimulationClock:
+    def __init__(self, tick_rate, max_ticks=5, time_source=time.perf_counter):
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+
+        # Most ticks a single frame may run
+        self.max_ticks = max_ticks
+        self._time = time_source
+
+        # Seconds not yet simulated, and when the last frame was
+        self.accumulator = 0.0
+        self._last = None
+
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    # Starts again from now, the time since the last frame isn't simulated (after a pause)
+    def reset(self):
+        self._last = None
+        self.accumulator = 0.0
+
+    # How many ticks to run this frame
+    def advance(self):
+        now = self._time()
+        if self._last is None:
+            # The first frame runs a tick straight away
+            self.accumulator = self.dt
+        else:
+            self.accumulator += now - self._last
+        self._last = now
+
+        # The small margin keeps float error from pushing a whole tick to the next frame
+        ticks = int((self.accumulator + 1e-9) / self.dt)
+        if ticks > self.max_ticks:
+            self.dropped_ticks += ticks - self.max_ticks
+            ticks = self.max_ticks
+            self.accumulator = self.dt * ticks
+
+        self.accumulator = max(0.0, self.accumulator - self.dt * ticks)
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.dt)
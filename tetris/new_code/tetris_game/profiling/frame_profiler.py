@@ -0,0 +1,177 @@
+"""
+    Where a frame's time goes. run_game and the game state time each phase of a frame with
+    perf_counter_ns:
+
+        input       Input.get_actions
+        simulation  the gamemode's handle_downkey and update
+        render      drawing the board, piece, HUD and effects
+        present     putting the frame on the display (flip / dirty rect update)
+        frame       the whole frame, without the wait for the next one
+
+    With the adaptive frame pacing (main/frame_pacer.py) it also counts the frames that weren't
+    drawn (dropped) and the ones that started late, and how late they were.
+
+    A phase can be timed more than once in a frame, the times add up. The last window frames
+    are kept for the rolling percentiles (p50/p95/p99), and every frame can be written to a
+    .csv or .jsonl log. F3 in game cycles it off -> on -> on with the overlay -> off, and
+    TETRIS_PROFILE=<log file> turns it on from the start.
+
+    It does nothing (start/stop return straight away) while it is off.
+
+    Usage:
+        profiler.begin_frame()
+        profiler.start('input')
+        actions = input.get_actions()
+        profiler.stop('input')
+        ...
+        profiler.end_frame()
+        profiler.percentiles('render')     # (p50, p95, p99) in ms
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+
+import numpy as np
+
+PHASES = ('input', 'simulation', 'render', 'present')
+
+PERCENTILES = (50, 95, 99)
+
+class FrameProfiler:
+    def __init__(self, window=300, enabled=False):
+        self.enabled = enabled
+
+        # The percentiles are drawn over the game when set (and enabled)
+        self.overlay = False
+
+        # phase -> ns of the last window frames, 'frame' is the whole frame
+        self.window = window
+        self.history = {phase: deque(maxlen=window) for phase in PHASES + ('frame',)}
+
+        # Frames timed since it was created, and how many of them were dropped or late
+        self.frames = 0
+        self.dropped_frames = 0
+        self.late_frames = 0
+
+        # ns per phase so far in this frame, and when each running phase started
+        self._frame = dict.fromkeys(PHASES, 0)
+        self._started = {}
+        self._frame_start = None
+        self._dropped = False
+        self._late_ns = 0
+
+        # Open log: (file, csv writer or None for jsonl)
+        self._log = None
+
+    # Off -> on -> on with the overlay -> off
+    def toggle(self):
+        if not self.enabled:
+            self.enabled = True
+        elif not self.overlay:
+            self.overlay = True
+        else:
+            self.enabled = False
+            self.overlay = False
+        self._frame_start = None
+
+    """
+        Timing
+    """
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        for phase in PHASES:
+            self._frame[phase] = 0
+        self._dropped = False
+        self._late_ns = 0
+        self._frame_start = time.perf_counter_ns()
+
+    # From the frame pacer: this frame isn't drawn (dropped) and/or started late_ns after it was due
+    def pacing(self, dropped, late_ns):
+        if not self.enabled:
+            return
+        self._dropped = dropped
+        self._late_ns = late_ns
+
+    def start(self, phase):
+        if self.enabled:
+            self._started[phase] = time.perf_counter_ns()
+
+    def stop(self, phase):
+        if self.enabled and phase in self._started:
+            self._frame[phase] += time.perf_counter_ns() - self._started.pop(phase)
+
+    def end_frame(self):
+        # A frame it was turned on in the middle of isn't counted
+        if not self.enabled or self._frame_start is None:
+            return
+        frame_ns = time.perf_counter_ns() - self._frame_start
+
+        for phase in PHASES:
+            self.history[phase].append(self._frame[phase])
+        self.history['frame'].append(frame_ns)
+        self.frames += 1
+        self.dropped_frames += self._dropped
+        self.late_frames += self._late_ns > 0
+
+        if self._log is not None:
+            self._write(frame_ns)
+
+    """
+        Results
+    """
+
+    # (p50, p95, p99) in ms over the last window frames, None before the first frame
+    def percentiles(self, phase):
+        times = self.history[phase]
+        if not times:
+            return None
+        return tuple(np.percentile(np.fromiter(times, dtype=np.int64, count=len(times)), PERCENTILES) / 1e6)
+
+    # One line per phase for the overlay
+    def summary_lines(self):
+        lines = [f"{'ms':<10}{'p50':>6}{'p95':>6}{'p99':>6}"]
+        for phase in PHASES + ('frame',):
+            result = self.percentiles(phase)
+            if result is not None:
+                lines.append(f"{phase:<10}" + ''.join(f"{value:>6.2f}" for value in result))
+        if self.dropped_frames or self.late_frames:
+            lines.append(f"dropped {self.dropped_frames}  late {self.late_frames}")
+        return lines
+
+    """
+        Log file
+    """
+
+    # Writes every frame from now on to path, csv or (for a .jsonl path) one JSON object a line
+    def log_to(self, path):
+        self.close()
+        log_file = open(path, 'w', newline='')
+        if os.path.splitext(path)[1] == '.jsonl':
+            self._log = (log_file, None)
+        else:
+            writer = csv.writer(log_file)
+            writer.writerow(('frame',) + tuple(f'{phase}_ns' for phase in PHASES) + ('frame_ns', 'dropped', 'late_ns'))
+            self._log = (log_file, writer)
+
+    def _write(self, frame_ns):
+        log_file, writer = self._log
+        if writer is not None:
+            writer.writerow((self.frames,) + tuple(self._frame[phase] for phase in PHASES)
+                            + (frame_ns, int(self._dropped), self._late_ns))
+        else:
+            row = {'frame': self.frames}
+            row.update((f'{phase}_ns', self._frame[phase]) for phase in PHASES)
+            row['frame_ns'] = frame_ns
+            row['dropped'] = self._dropped
+            row['late_ns'] = self._late_ns
+            log_file.write(json.dumps(row) + '\n')
+
+    def close(self):
+        if self._log is not None:
+            self._log[0].close()
+            self._log = None
@@ -0,0 +1,112 @@
+"""
+    Keyframes are snapshots of a game between two frames, taken by the recorder every few
+    hundred frames. A player seeks by putting the nearest keyframe back and playing on from it
+    instead of playing the whole game from the start.
+
+    The board is stored as its compressed cells. The pieces are not stored at all: the piece
+    stream only depends on the seed, so it is started over (or taken from a sequence the player
+    already has) past the pieces already handed out, then the current piece is moved to where
+    it was.
+"""
+
+import zlib
+
+from . import replay_format as fmt
+
+class Keyframe:
+    __slots__ = ('tick', 'counter', 'level', 'last_move_counter', 'pressing_down', 'points',
+                 'lines', 'blocks_placed', 'display_level', 'pieces_created', 'piece_x',
+                 'piece_y', 'piece_rotation', 'cells')
+
+    # The state of gamemode after frame tick was played
+    @classmethod
+    def capture(cls, gamemode, tick, counter, pressing_down):
+        keyframe = cls()
+        keyframe.tick = tick
+        keyframe.counter = counter
+        keyframe.level = gamemode.config.level
+        keyframe.last_move_counter = gamemode.last_move_counter
+        keyframe.pressing_down = pressing_down
+        keyframe.points = gamemode.points
+        keyframe.lines = gamemode.total_lines_broken
+        keyframe.blocks_placed = gamemode.blocks_placed
+        keyframe.display_level = gamemode.display_level
+        keyframe.pieces_created = gamemode.piece_factory.created
+        keyframe.piece_x = gamemode.piece.xShift
+        keyframe.piece_y = gamemode.piece.yShift
+        keyframe.piece_rotation = gamemode.piece.rotation
+        keyframe.cells = gamemode.board.snapshot()
+        return keyframe
+
+    # Puts gamemode (started on the same seed and config) back into this state. piece_stream
+    # is the game's (piece_type, color) sequence from pieces_created - 2 on, when it is not
+    # given the sequence is drawn again from the seed
+    def restore(self, gamemode, piece_stream=None):
+        config = gamemode.config
+        config.counter = self.counter
+        config.level = self.level
+
+        gamemode.last_move_counter = self.last_move_counter
+        gamemode.points = self.points
+        gamemode.total_lines_broken = self.lines
+        gamemode.blocks_placed = self.blocks_placed
+        gamemode.display_level = self.display_level
+
+        # The current and next piece are the last two the stream handed out
+        factory = gamemode.piece_factory
+        if piece_stream is not None:
+            factory.resume(piece_stream, self.pieces_created - 2)
+        else:
+            gamemode.rng.seed(gamemode.game_seed)
+            factory.reset(skip=self.pieces_created - 2)
+        gamemode.piece = factory.create_random_piece(gamemode.piece_start_xPos, gamemode.piece_start_yPos)
+        gamemode.next_piece = factory.create_random_piece(gamemode.piece_start_xPos, gamemode.piece_start_yPos)
+        gamemode.piece.xShift = self.piece_x
+        gamemode.piece.yShift = self.piece_y
+        gamemode.piece.rotation = self.piece_rotation
+
+        gamemode.board.restore(self.cells)
+        gamemode.vfx_pool.clear()
+
+    def to_bytes(self):
+        out = bytearray()
+        for value in (self.counter, self.level, self.last_move_counter):
+            fmt.write_varint(out, round(value * fmt.COUNTER_SCALE))
+        for value in (int(self.pressing_down), self.points, self.lines, self.blocks_placed,
+                      self.display_level, self.pieces_created, self.piece_rotation):
+            fmt.write_varint(out, value)
+
+        # The piece can hang over the left wall, so its position is zigzag encoded
+        for value in (self.piece_x, self.piece_y):
+            fmt.write_varint(out, (value << 1) ^ (value >> 63))
+
+        out += zlib.compress(self.cells)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, tick, data):
+        keyframe = cls()
+        keyframe.tick = tick
+
+        pos = 0
+        values = []
+        for _ in range(12):
+            value, pos = fmt.read_varint(data, pos)
+            values.append(value)
+
+        counter, level, last_move, pressing_down, points, lines, blocks, display_level, created, rotation, x, y = values
+        keyframe.counter = counter / fmt.COUNTER_SCALE
+        keyframe.level = level / fmt.COUNTER_SCALE
+        keyframe.last_move_counter = last_move / fmt.COUNTER_SCALE
+        keyframe.pressing_down = bool(pressing_down)
+        keyframe.points = points
+        keyframe.lines = lines
+        keyframe.blocks_placed = blocks
+        keyframe.display_level = display_level
+        keyframe.pieces_created = created
+        keyframe.piece_rotation = rotation
+        keyframe.piece_x = (x >> 1) ^ -(x & 1)
+        keyframe.piece_y = (y >> 1) ^ -(y & 1)
+
+        keyframe.cells = zlib.decompress(data[pos:])
+        return keyframe
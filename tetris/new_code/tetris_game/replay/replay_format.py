@@ -0,0 +1,216 @@
+"""
+    Binary replay format. A replay is everything needed to play a game again: the gamemode
+    config, the seed, and the input, one frame (tick) at a time.
+
+    Layout (all integers are unsigned LEB128 varints):
+        header  MAGIC, VERSION byte, config length + gamemode config as JSON, seed, fps,
+                last_move_counter * 4
+        events  (tick delta << 4 | code), followed by a value for COUNTER and END
+        index   after END (version 2): keyframe count, (tick delta, length) per keyframe, then
+                the keyframes themselves (see keyframe.py)
+
+    Codes 0-7 are the PieceActions (in enum order), the rest are the frame events below. A
+    frame with no input writes nothing, so most events are a single byte.
+"""
+
+import bisect
+import json
+import zlib
+
+from ..game.piece.piece_action import PieceAction
+
+MAGIC = b'T3RP'
+VERSION = 2
+
+# Versions that can still be read (1 has no keyframes)
+READABLE_VERSIONS = (1, 2)
+
+# PieceAction <-> code
+ACTIONS = tuple(PieceAction)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+DOWN_PRESSED = 8    # the down key started being held
+DOWN_RELEASED = 9   # and was let go
+COUNTER = 10        # the frame counter did not just go up by the level (wrap, pause), value is counter * 4
+END = 11            # the game ended, value is the result (gameover, score, lines, blocks, board hash)
+
+CODE_BITS = 4
+CODE_MASK = (1 << CODE_BITS) - 1
+
+# Counter and level move in quarter steps, so they are stored as whole quarters
+COUNTER_SCALE = 4
+
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+# Returns (value, position after it)
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# Checksum of every cell on the board, the same for both board backends
+def board_hash(board):
+    return zlib.crc32(board.snapshot())
+
+
+def write_header(out, gamemode_config, seed, fps, last_move_counter):
+    out += MAGIC
+    out.append(VERSION)
+    config = json.dumps(gamemode_config, sort_keys=True).encode()
+    write_varint(out, len(config))
+    out += config
+    write_varint(out, seed)
+    write_varint(out, fps)
+    write_varint(out, round(last_move_counter * COUNTER_SCALE))
+
+
+class ReplayResult:
+    __slots__ = ('gameover', 'score', 'lines', 'blocks_placed', 'board_hash')
+
+    def __init__(self, gameover, score, lines, blocks_placed, board_hash):
+        self.gameover = gameover
+        self.score = score
+        self.lines = lines
+        self.blocks_placed = blocks_placed
+        self.board_hash = board_hash
+
+    @classmethod
+    def from_gamemode(cls, gamemode, gameover):
+        return cls(gameover, gamemode.points, gamemode.total_lines_broken,
+                   gamemode.blocks_placed, board_hash(gamemode.board))
+
+    def as_tuple(self):
+        return (self.gameover, self.score, self.lines, self.blocks_placed, self.board_hash)
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayResult) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self):
+        return (f"ReplayResult(gameover={self.gameover}, score={self.score}, lines={self.lines}, "
+                f"blocks_placed={self.blocks_placed}, board_hash={self.board_hash:#010x})")
+
+
+class Replay:
+    def __init__(self, gamemode_config, seed, fps, last_move_counter, events, ticks, result=None,
+                 keyframe_ticks=(), keyframe_spans=(), data=b''):
+        self.gamemode_config = gamemode_config
+        self.seed = seed
+        self.fps = fps
+        self.last_move_counter = last_move_counter
+
+        # (tick, code, value) in the order they happened, value is None for everything but
+        # COUNTER (the counter on that tick)
+        self.events = events
+
+        # Frames in the game, and how it ended (None if the recording was cut off)
+        self.ticks = ticks
+        self.result = result
+
+        # Tick of every event, to find where to carry on after a keyframe
+        self.event_ticks = [event[0] for event in events]
+
+        # Keyframes are only decoded when a seek needs one, (offset, length) into data
+        self.keyframe_ticks = list(keyframe_ticks)
+        self._keyframe_spans = list(keyframe_spans)
+        self._data = data
+
+    # The last keyframe at or before tick, None when there is none
+    def keyframe_before(self, tick):
+        from .keyframe import Keyframe
+
+        index = bisect.bisect_right(self.keyframe_ticks, tick) - 1
+        if index < 0:
+            return None
+        offset, length = self._keyframe_spans[index]
+        return Keyframe.from_bytes(self.keyframe_ticks[index], self._data[offset:offset + length])
+
+    # Index of the first event after tick
+    def event_index(self, tick):
+        return bisect.bisect_right(self.event_ticks, tick)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+    # Raises ValueError for anything that isn't a whole replay header and events
+    @classmethod
+    def from_bytes(cls, data):
+        try:
+            return cls._parse(data)
+        except IndexError:
+            # A varint ran past the end of the data
+            raise ValueError("Replay file is cut short") from None
+
+    @classmethod
+    def _parse(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a replay file")
+        if data[len(MAGIC)] not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported replay version: {data[len(MAGIC)]}")
+
+        pos = len(MAGIC) + 1
+        length, pos = read_varint(data, pos)
+        gamemode_config = json.loads(data[pos:pos + length])
+        pos += length
+        seed, pos = read_varint(data, pos)
+        fps, pos = read_varint(data, pos)
+        last_move_counter, pos = read_varint(data, pos)
+
+        events = []
+        tick = 0
+        result = None
+        end = len(data)
+        while pos < end:
+            packed, pos = read_varint(data, pos)
+            tick += packed >> CODE_BITS
+            code = packed & CODE_MASK
+
+            if code == END:
+                values = []
+                for _ in range(5):
+                    value, pos = read_varint(data, pos)
+                    values.append(value)
+                result = ReplayResult(bool(values[0]), *values[1:])
+                break
+
+            value = None
+            if code == COUNTER:
+                value, pos = read_varint(data, pos)
+                value /= COUNTER_SCALE
+            elif code > END:
+                raise ValueError(f"Unknown replay event: {code}")
+            events.append((tick, code, value))
+
+        # Keyframe index, then the keyframes one after the other
+        keyframe_ticks = []
+        keyframe_spans = []
+        if result is not None and pos < end:
+            count, pos = read_varint(data, pos)
+            keyframe_tick = 0
+            lengths = []
+            for _ in range(count):
+                delta, pos = read_varint(data, pos)
+                length, pos = read_varint(data, pos)
+                keyframe_tick += delta
+                keyframe_ticks.append(keyframe_tick)
+                lengths.append(length)
+            for length in lengths:
+                keyframe_spans.append((pos, length))
+                pos += length
+
+        return cls(gamemode_config, seed, fps, last_move_counter / COUNTER_SCALE, events, tick, result,
+                   keyframe_ticks, keyframe_spans, data)
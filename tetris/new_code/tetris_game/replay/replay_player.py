@@ -0,0 +1,251 @@
+"""
+    Plays a recorded game (replay_format.Replay) again through the real gamemode, board, pieces
+    and CommandFactory. The seed gives the same pieces and the events give the same input on
+    the same frames, so the final score, lines and board have to match the recording; if they
+    do not, the game logic changed behaviour since it was recorded.
+
+    There is no rendering by default and frames where nothing can happen (no input and no
+    gravity step due) only move the counter, so a replay runs as fast as the CPU allows.
+    seek() jumps to any frame through the keyframes in the recording.
+    watch() plays one back through the Renderer at the recorded fps instead.
+
+    Run from tetris/new_code:
+        python -m tetris_game.replay.replay_player replays/*.replay
+        python -m tetris_game.replay.replay_player --watch replays/some_game.replay
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from . import replay_format as fmt
+from .replay_format import Replay, ReplayResult
+
+from ..game.piece.piece_factory import PieceFactory
+from ..simulation.headless_config import HeadlessConfig
+from ..simulation.headless_engine import HeadlessEngine
+
+class ReplayPlayer:
+    def __init__(self, replay):
+        self.replay = replay
+
+        mode = replay.gamemode_config['mode']
+        if mode not in HeadlessEngine._gamemode_reg:
+            raise ValueError(f"Unknown gamemode: {mode}")
+
+        # Called with the gamemode's vfx_pool every frame, otherwise the effects are dropped
+        self.on_vfx = None
+
+        # The game's piece sequence, drawn once from the seed as far as seeking has needed it
+        self._pieces = []
+        self._piece_source = PieceFactory(replay.gamemode_config, random.Random(replay.seed))
+
+        self._start()
+
+    # Back to the first frame with a fresh gamemode
+    def _start(self):
+        replay = self.replay
+        self.config = HeadlessConfig(replay.fps)
+        gamemode_class = HeadlessEngine._gamemode_reg[replay.gamemode_config['mode']]
+        self.gamemode = gamemode_class(replay.gamemode_config, self.config, replay.seed)
+        self.gamemode.last_move_counter = replay.last_move_counter
+
+        # Last frame played, and the next event to apply
+        self.tick = 0
+        self._next_event = 0
+
+        self.pressing_down = False
+        self.gameover = False
+
+    @property
+    def done(self):
+        return self.gameover or self.tick >= self.replay.ticks
+
+    # Plays every frame up to and including target (the end of the replay by default)
+    def play(self, target=None):
+        if target is None:
+            target = self.replay.ticks
+        target = min(target, self.replay.ticks)
+
+        events = self.replay.events
+        while self.tick < target and not self.gameover:
+            # Nothing can happen before the next event or gravity step, only the counter moves
+            next_event_tick = events[self._next_event][0] if self._next_event < len(events) else self.replay.ticks + 1
+            self._skip_idle(min(target, next_event_tick - 1))
+
+            if self.tick < target:
+                self._frame()
+
+        return self.result()
+
+    # Goes to the state right after frame tick, forwards or backwards. The nearest keyframe is
+    # put back when it is closer than the current frame, so at most one keyframe interval of
+    # frames is played
+    def seek(self, tick):
+        tick = max(0, min(tick, self.replay.ticks))
+        keyframe = self.replay.keyframe_before(tick)
+
+        if tick < self.tick or self.gameover or (keyframe is not None and keyframe.tick > self.tick):
+            if keyframe is None:
+                self._start()
+            else:
+                keyframe.restore(self.gamemode, self._piece_stream(keyframe.pieces_created - 2))
+                self.tick = keyframe.tick
+                self.pressing_down = keyframe.pressing_down
+                self.gameover = False
+                self._next_event = self.replay.event_index(keyframe.tick)
+
+        return self.play(tick)
+
+    # The piece sequence from index on
+    def _piece_stream(self, index):
+        pieces = self._pieces
+        while True:
+            while index >= len(pieces):
+                pieces.append(self._piece_source.queue.pop())
+            yield pieces[index]
+            index += 1
+
+    def result(self):
+        return ReplayResult.from_gamemode(self.gamemode, self.gameover)
+
+    # Plays the whole replay, True when it ends the same way it was recorded
+    def verify(self):
+        return self.play() == self.replay.result
+
+    """
+        Frames
+    """
+
+    def _skip_idle(self, limit):
+        config = self.config
+        interval = self.gamemode.gravity_interval(self.pressing_down)
+        last_move = self.gamemode.last_move_counter
+        counter = config.counter
+        level = config.level
+
+        tick = self.tick
+        while tick < limit and (counter + level) - last_move < interval:
+            counter += level
+            tick += 1
+
+        config.counter = counter
+        self.tick = tick
+
+    # One simulation tick of the game state (Game.tick): counter, down key, gravity, then the
+    # actions of the tick. A recorded frame is one tick
+    def _frame(self):
+        self.tick += 1
+        events = self.replay.events
+        index = self._next_event
+
+        counter = None
+        while index < len(events) and events[index][0] == self.tick and events[index][1] >= fmt.DOWN_PRESSED:
+            _, code, value = events[index]
+            if code == fmt.COUNTER:
+                counter = value
+            elif code == fmt.DOWN_PRESSED:
+                self.pressing_down = True
+            elif code == fmt.DOWN_RELEASED:
+                self.pressing_down = False
+            index += 1
+
+        if counter is None:
+            counter = self.config.counter + self.config.level
+        self.config.counter = counter
+
+        gamemode = self.gamemode
+        if gamemode.handle_downkey(self.pressing_down, self.config.counter, self.config.fps) == 'gameover':
+            self.gameover = True
+
+        while index < len(events) and events[index][0] == self.tick:
+            if not self.gameover and gamemode.update(fmt.ACTIONS[events[index][1]]) == 'gameover':
+                self.gameover = True
+            index += 1
+
+        self._next_event = index
+
+        if gamemode.vfx_pool:
+            if self.on_vfx is not None:
+                self.on_vfx(gamemode.vfx_pool)
+            gamemode.vfx_pool.clear()
+
+
+# Plays a replay back on screen at the speed it was recorded
+def watch(replay, window_size=(400, 500)):
+    import pygame # type: ignore (ignores the "could not resolve" error)
+    from ..ui.renderer import Renderer
+
+    pygame.init()
+    screen = pygame.display.set_mode(window_size)
+    pygame.display.set_caption("Code^3 Tetris - Replay")
+    clock = pygame.time.Clock()
+    renderer = Renderer(screen=screen)
+
+    player = ReplayPlayer(replay)
+    player.on_vfx = renderer.handle_vfx_pool
+
+    running = True
+    while running and not player.done:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        player.play(player.tick + 1)
+
+        gamemode = player.gamemode
+        renderer.render_board(gamemode.board)
+        renderer.draw_piece(gamemode.piece)
+        renderer.draw_score(gamemode.points)
+        renderer.draw_level(gamemode.display_level)
+        renderer.draw_next_piece(gamemode.next_piece)
+        renderer.update_vfx()
+        renderer.draw_vfx()
+
+        renderer.present()
+        clock.tick(replay.fps)
+
+    pygame.quit()
+    return player.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded games and check they still end the same way")
+    parser.add_argument('replays', nargs='+', help="replay files")
+    parser.add_argument('--watch', action='store_true', help="play them on screen at normal speed instead")
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    for path in args.replays:
+        # One bad file is reported and counted, the rest are still checked
+        try:
+            replay = Replay.load(path)
+            player = ReplayPlayer(replay)
+        except (OSError, ValueError) as error:
+            print(f"CORRUPT    {path}: {error}")
+            mismatches += 1
+            continue
+
+        if args.watch:
+            watch(replay)
+            continue
+
+        start = time.perf_counter()
+        result = player.play()
+        elapsed = time.perf_counter() - start
+
+        if replay.result is None:
+            print(f"UNFINISHED {path}: recording has no result")
+            mismatches += 1
+        elif result == replay.result:
+            print(f"OK         {path}: {player.tick} frames in {elapsed * 1000:.1f} ms")
+        else:
+            print(f"MISMATCH   {path}: recorded {replay.result}, replayed {result}")
+            mismatches += 1
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+    Records a game into the binary replay format (see replay_format.py). The gamemode calls
+    frame() from handle_downkey and action() from update, the game state starts and finishes
+    the recording. Events are packed into a memory buffer and only written out when the buffer
+    is full or the game ends, so recording does no I/O on a normal frame. Every
+    keyframe_interval frames a keyframe is taken, they are written with an index after the end
+    of the game.
+
+    Usage:
+        recorder = ReplayRecorder(open('game.replay', 'wb'))
+        gamemode.attach_recorder(recorder)
+        ... play ...
+        gamemode.detach_recorder()
+"""
+
+import os
+import random
+import time
+
+from . import replay_format as fmt
+from .keyframe import Keyframe
+
+class ReplayRecorder:
+    def __init__(self, stream, buffer_size=64 * 1024, close_stream=False, keyframe_interval=250):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.close_stream = close_stream
+        self._buffer = bytearray()
+        self._written = 0
+
+        # Frame number and the frame of the last event (events store the difference)
+        self.tick = 0
+        self._last_event_tick = 0
+
+        self._counter = None
+        self._pressing_down = False
+        self.finished = False
+
+        # (tick, encoded keyframe), 0 for no keyframes
+        self.keyframe_interval = keyframe_interval
+        self._keyframes = []
+        self.gamemode = None
+
+    # A recorder writing to a new file in directory, named after the time the game started
+    @classmethod
+    def open(cls, directory):
+        os.makedirs(directory, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{random.SystemRandom().getrandbits(16):04x}.replay"
+        return cls(open(os.path.join(directory, name), 'wb'), close_stream=True)
+
+    # Writes the header, the gamemode has to be at the start of a game. The header goes out
+    # straight away so even a recording that is never finished can be read
+    def start(self, gamemode):
+        self.gamemode = gamemode
+        fmt.write_header(self._buffer, gamemode.gamemode_config, gamemode.game_seed,
+                         gamemode.config.fps, gamemode.last_move_counter)
+        self.flush()
+
+    """
+        Hooks (called by the gamemode)
+    """
+
+    # Start of a frame, before gravity runs
+    def frame(self, counter, level, pressing_down):
+        # The game as it was after the last frame
+        if self.keyframe_interval and self.tick and self.tick % self.keyframe_interval == 0:
+            keyframe = Keyframe.capture(self.gamemode, self.tick, self._counter, self._pressing_down)
+            self._keyframes.append((self.tick, keyframe.to_bytes()))
+
+        self.tick += 1
+
+        # The counter only needs storing when it did not just go up by the level
+        if self._counter is None or counter != self._counter + level:
+            self._write(fmt.COUNTER)
+            fmt.write_varint(self._buffer, round(counter * fmt.COUNTER_SCALE))
+        self._counter = counter
+
+        if pressing_down != self._pressing_down:
+            self._write(fmt.DOWN_PRESSED if pressing_down else fmt.DOWN_RELEASED)
+            self._pressing_down = pressing_down
+
+    # A PieceAction handed to the gamemode this frame
+    def action(self, action):
+        self._write(fmt.ACTION_CODES[action])
+
+    """
+        Finishing
+    """
+
+    # Writes the result and flushes, the stream is closed if the recorder opened it
+    def finish(self, gamemode, gameover=True):
+        if self.finished:
+            return
+        result = fmt.ReplayResult.from_gamemode(gamemode, gameover)
+        self._write(fmt.END)
+        for value in result.as_tuple():
+            fmt.write_varint(self._buffer, int(value))
+        self._write_keyframes()
+        self.finished = True
+        self.flush()
+        if self.close_stream:
+            self.stream.close()
+
+    def flush(self):
+        if self._buffer:
+            self.stream.write(self._buffer)
+            self._written += len(self._buffer)
+            self._buffer.clear()
+
+    # Bytes recorded so far (written and still buffered)
+    def size(self):
+        return self._written + len(self._buffer)
+
+    def _write_keyframes(self):
+        out = self._buffer
+        fmt.write_varint(out, len(self._keyframes))
+        last_tick = 0
+        for tick, data in self._keyframes:
+            fmt.write_varint(out, tick - last_tick)
+            fmt.write_varint(out, len(data))
+            last_tick = tick
+        for _, data in self._keyframes:
+            out += data
+
+    def _write(self, code):
+        fmt.write_varint(self._buffer, (self.tick - self._last_event_tick) << fmt.CODE_BITS | code)
+        self._last_event_tick = self.tick
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
@@ -0,0 +1,173 @@
+"""
+    Batch simulator. Spreads N seeded headless games over a process pool, every game is played
+    by a policy from PolicyFactory. Each finished game sends its summary back to the parent as
+    soon as it is done, the parent streams them out (optionally as JSON lines) and aggregates them.
+
+    Run from tetris/new_code:
+        python -m tetris_game.simulation.batch_runner --games 1000 --workers 8 --policy greedy
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from .headless_engine import HeadlessEngine
+from .policies import PolicyFactory
+from ..game.piece.randomizer import RANDOMIZERS
+
+GAMEMODES = {
+    'classic': {'mode': 'classic', 'special_pieces': [], 'include_classic': True},
+    'special': {'mode': 'special', 'special_pieces': ['rocket'], 'include_classic': True},
+}
+
+
+# Plays one game in a worker process, it has to be a module level function so it can be pickled
+def play_game(job):
+    seed, gamemode_config, policy_name, max_frames = job
+
+    start = time.perf_counter()
+    engine = HeadlessEngine(gamemode_config, seed=seed)
+    policy = PolicyFactory.create_policy(policy_name, seed)
+
+    while not engine.done and engine.frames < max_frames:
+        engine.step(policy.next_action(engine))
+
+    summary = engine.summary()
+    summary['worker'] = os.getpid()
+    summary['elapsed'] = time.perf_counter() - start
+    return summary
+
+
+class BatchRunner:
+    def __init__(self, games, workers=None, gamemode='classic', policy='greedy',
+                 seed=0, max_frames=20000, board='list', randomizer='uniform', chunksize=None):
+        if gamemode not in GAMEMODES:
+            raise ValueError(f"Unknown gamemode: {gamemode}")
+
+        self.games = games
+        self.workers = workers or os.cpu_count() or 1
+        self.gamemode_config = dict(GAMEMODES[gamemode], board=board, randomizer=randomizer)
+        self.policy = policy
+        self.seed = seed
+        self.max_frames = max_frames
+
+        # Enough jobs per chunk to keep the pickling overhead down, small enough to stay balanced
+        self.chunksize = chunksize or max(1, games // (self.workers * 8))
+
+        # Fail early (in the parent) on a bad policy name
+        PolicyFactory.create_policy(policy)
+
+    def _jobs(self):
+        for game in range(self.games):
+            yield (self.seed + game, self.gamemode_config, self.policy, self.max_frames)
+
+    # Yields every game's summary as soon as its worker finishes it
+    def stream(self):
+        with multiprocessing.Pool(self.workers) as pool:
+            for summary in pool.imap_unordered(play_game, self._jobs(), self.chunksize):
+                yield summary
+
+    # Runs the whole batch, on_game is called with each summary as it arrives
+    def run(self, on_game=None):
+        stats = BatchStats()
+        start = time.perf_counter()
+        for summary in self.stream():
+            stats.add(summary)
+            if on_game is not None:
+                on_game(summary)
+        stats.wall_time = time.perf_counter() - start
+        return stats
+
+
+class BatchStats:
+    def __init__(self):
+        self.games = 0
+        self.score = 0
+        self.lines = 0
+        self.blocks_placed = 0
+        self.frames = 0
+        self.best_score = 0
+        self.wall_time = 0.0
+
+        # pid -> [games, seconds spent playing]
+        self.workers = {}
+
+    def add(self, summary):
+        self.games += 1
+        self.score += summary['score']
+        self.lines += summary['lines']
+        self.blocks_placed += summary['blocks_placed']
+        self.frames += summary['frames']
+        self.best_score = max(self.best_score, summary['score'])
+
+        worker = self.workers.setdefault(summary['worker'], [0, 0.0])
+        worker[0] += 1
+        worker[1] += summary['elapsed']
+
+    def report(self):
+        games = max(self.games, 1)
+        lines = [
+            f"games:           {self.games}",
+            f"mean score:      {self.score / games:.1f} (best {self.best_score})",
+            f"mean lines:      {self.lines / games:.1f}",
+            f"mean blocks:     {self.blocks_placed / games:.1f}",
+            f"mean length:     {self.frames / games:.0f} frames",
+            f"wall time:       {self.wall_time:.2f}s",
+            f"games/sec:       {self.games / self.wall_time if self.wall_time else 0:.1f}",
+            f"frames/sec:      {self.frames / self.wall_time if self.wall_time else 0:,.0f}",
+            f"workers:         {len(self.workers)}",
+        ]
+        for pid, (worker_games, busy) in sorted(self.workers.items()):
+            rate = worker_games / busy if busy else 0
+            lines.append(f"    worker {pid}: {worker_games} games, {rate:.1f} games/sec")
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless Tetris games on a process pool")
+    parser.add_argument('--games', type=int, default=1000, help="number of games to play")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: cpu count)")
+    parser.add_argument('--mode', choices=list(GAMEMODES), default='classic', help="gamemode")
+    parser.add_argument('--policy', choices=PolicyFactory.names(), default='greedy', help="policy playing the games")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game, game i uses seed + i")
+    parser.add_argument('--max-frames', type=int, default=20000, help="frame limit per game")
+    parser.add_argument('--board', choices=['list', 'bitboard'], default='list', help="board backend")
+    parser.add_argument('--randomizer', choices=list(RANDOMIZERS), default='uniform', help="piece randomizer")
+    parser.add_argument('--jsonl', default=None, help="write every game summary to this file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    runner = BatchRunner(
+        games=args.games,
+        workers=args.workers,
+        gamemode=args.mode,
+        policy=args.policy,
+        seed=args.seed,
+        max_frames=args.max_frames,
+        board=args.board,
+        randomizer=args.randomizer,
+    )
+
+    out = None
+    if args.jsonl == '-':
+        out = sys.stdout
+    elif args.jsonl:
+        out = open(args.jsonl, 'w')
+
+    def on_game(summary):
+        if out is not None:
+            out.write(json.dumps(summary) + "\n")
+
+    try:
+        stats = runner.run(on_game)
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+
+    print(stats.report(), file=sys.stderr if out is sys.stdout else sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
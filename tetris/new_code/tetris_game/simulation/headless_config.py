@@ -0,0 +1,42 @@
+"""
+    Stand in for config.Config when there is no pygame display, mixer or clock. It only has what
+    the gamemodes read (counter, fps, level, pending_gamemode) and the sound calls do nothing,
+    so a gamemode can be driven as fast as the CPU allows
+"""
+
+class HeadlessConfig:
+    def __init__(self, fps=25):
+        # Same meaning as in Config, the frame counter drives gravity
+        self.fps = fps
+        self.counter = 0
+
+        # The amount the counter will increase
+        self.level = 1
+
+        self.pending_gamemode = None
+
+        # Nothing is drawn headless anyway, the game state reads it
+        self.render_frame = True
+
+        # Headless games are recorded by whoever drives them, not by the game state
+        self.replay_dir = None
+        self.play_sounds = False
+
+    """
+        Sound (there is no mixer, so these do nothing)
+    """
+
+    def play_click_sound(self):
+        return
+
+    def play_bgm(self):
+        return
+
+    def stop_bgm(self):
+        return
+
+    def play_block_sound(self):
+        return
+
+    def play_bomb_sound(self):
+        return
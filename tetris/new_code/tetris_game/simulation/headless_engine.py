@@ -0,0 +1,100 @@
+"""
+    Headless simulation engine. Drives the Classic and Special gamemodes with no display, mixer
+    or clock: every step() is one simulation tick of the game state (counter tick, gravity through
+    handle_downkey, then the action through update) and runs as fast as the CPU allows.
+
+    Usage:
+        engine = HeadlessEngine({'mode': 'classic'})
+        engine.reset(seed=42)
+        while not engine.done:
+            engine.step(PieceAction.HARD_DROP)
+        print(engine.summary())
+"""
+
+from .headless_config import HeadlessConfig
+
+from ..gamemodes.classic import Classic
+from ..gamemodes.special_gamemode import Special
+
+class HeadlessEngine:
+
+    # Registry for the gamemodes the engine can drive
+    _gamemode_reg = {
+        'classic': Classic,
+        'special': Special,
+    }
+
+    def __init__(self, gamemode_config=None, seed=None, fps=25):
+        if gamemode_config is None:
+            gamemode_config = {'mode': 'classic', 'special_pieces': [], 'include_classic': True}
+
+        # The board backend comes from the config ('board' key) like in the real game
+        self.gamemode_config = dict(gamemode_config)
+
+        if self.gamemode_config['mode'] not in self._gamemode_reg:
+            raise ValueError(f"Unknown gamemode: {self.gamemode_config['mode']}")
+
+        self.fps = fps
+        self.config = None
+        self.gamemode = None
+
+        self.reset(seed)
+
+    # Starts a new game, the same seed always gives the same piece sequence
+    def reset(self, seed=None):
+        self.seed = seed
+
+        self.config = HeadlessConfig(self.fps)
+        gamemode_class = self._gamemode_reg[self.gamemode_config['mode']]
+        self.gamemode = gamemode_class(self.gamemode_config, self.config, seed)
+
+        self.frames = 0
+        self.done = False
+
+        return self.gamemode
+
+    # One frame of the game loop. action is a PieceAction, a list of them (several keys in one
+    # frame, like Game.update gets them) or None for a frame with no input
+    def step(self, action=None, pressing_down=False):
+        if self.done:
+            return 'gameover'
+
+        self.config.counter += self.config.level
+        self.frames += 1
+
+        # Gravity first, then the input, the same order as the game state
+        result = self.gamemode.handle_downkey(pressing_down, self.config.counter, self.config.fps)
+        if isinstance(action, list):
+            for frame_action in action:
+                if result == 'gameover':
+                    break
+                result = self.gamemode.update(frame_action)
+        elif result != 'gameover' and action is not None:
+            result = self.gamemode.update(action)
+
+        # Nothing draws the effects, so don't let them pile up
+        self.gamemode.vfx_pool.clear()
+
+        if result == 'gameover':
+            self.done = True
+
+        return result
+
+    # Plays a whole stream of actions, stops early on game over
+    def run(self, actions, max_frames=None):
+        for action in actions:
+            if self.done or (max_frames is not None and self.frames >= max_frames):
+                break
+            self.step(action)
+        return self.summary()
+
+    def summary(self):
+        return {
+            'seed': self.seed,
+            'score': self.gamemode.points,
+            'lines': self.gamemode.total_lines_broken,
+            'blocks_placed': self.gamemode.blocks_placed,
+            'level': self.gamemode.display_level,
+            'frames': self.frames,
+            'gameover': self.done,
+        }
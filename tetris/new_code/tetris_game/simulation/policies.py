@@ -0,0 +1,170 @@
+"""
+    Policies that play the headless engine. A policy is asked for one action per frame and can
+    look at the engine's gamemode (board, piece, next_piece) to decide.
+
+    New policies are added to PolicyFactory._policy_reg so the batch runner can find them by name
+"""
+
+import random
+from abc import ABC, abstractmethod
+
+from ..game.piece.piece import Piece
+from ..game.piece.piece_action import PieceAction
+from ..game.piece.piece_masks import get_collision_mask
+
+class AbstractPolicy(ABC):
+    def __init__(self, seed=None):
+        self.reset(seed)
+
+    # Called at the start of every game
+    def reset(self, seed=None):
+        self.seed = seed
+
+    # The action for this frame (a PieceAction or None to do nothing)
+    @abstractmethod
+    def next_action(self, engine):
+        pass
+
+
+# Always hard drops where the piece spawns, the fastest way to end a game
+class HardDropPolicy(AbstractPolicy):
+    def next_action(self, engine):
+        return PieceAction.HARD_DROP
+
+
+# Mashes random keys, frames without input included
+class RandomPolicy(AbstractPolicy):
+    ACTIONS = [
+        PieceAction.MOVE_LEFT,
+        PieceAction.MOVE_RIGHT,
+        PieceAction.ROTATE_CLOCKWISE,
+        PieceAction.SOFT_DROP,
+        PieceAction.HARD_DROP,
+        None,
+        None,
+    ]
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.rng = random.Random(seed)
+
+    def next_action(self, engine):
+        return self.rng.choice(self.ACTIONS)
+
+
+# Looks at every rotation and column for the current piece, scores the board it would leave
+# behind and then walks the piece there (rotate, move, hard drop), one action per frame
+class GreedyPolicy(AbstractPolicy):
+
+    # Weights for the board evaluation
+    HEIGHT_WEIGHT = -0.51
+    LINES_WEIGHT = 0.76
+    HOLES_WEIGHT = -0.36
+    BUMPINESS_WEIGHT = -0.18
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.planned_piece = None
+        self.plan = []
+
+    def next_action(self, engine):
+        piece = engine.gamemode.piece
+
+        # New piece, work out where it should go
+        if piece is not self.planned_piece:
+            self.planned_piece = piece
+            self.plan = self._plan(engine.gamemode.board, piece)
+
+        if self.plan:
+            return self.plan.pop(0)
+        return PieceAction.HARD_DROP
+
+    def _plan(self, board, piece):
+        if piece.is_special:
+            target_x, rotations = self._best_special_column(board, piece), 0
+        else:
+            target_x, rotations = self._best_placement(board, piece)
+
+        plan = [PieceAction.ROTATE_CLOCKWISE] * rotations
+        step = PieceAction.MOVE_RIGHT if target_x > piece.xShift else PieceAction.MOVE_LEFT
+        plan.extend([step] * abs(target_x - piece.xShift))
+        plan.append(PieceAction.HARD_DROP)
+        return plan
+
+    # The rocket clears the columns it lands on, so aim it at the tallest three columns
+    def _best_special_column(self, board, piece):
+        heights = board.get_column_heights()
+        best_x = piece.xShift
+        best_total = -1
+        for x in range(board.width - piece.width + 1):
+            total = sum(heights[x:x + piece.width])
+            if total > best_total:
+                best_x, best_total = x, total
+        return best_x
+
+    def _best_placement(self, board, piece):
+        best = (piece.xShift, 0)
+        best_score = None
+
+        probe = Piece(piece.xShift, piece.yShift, piece_type=piece.type, piece_color=piece.color)
+        for rotation in range(len(piece.figures[piece.type])):
+            probe.rotation = rotation
+            for x in range(-3, board.width):
+                probe.xShift = x
+                probe.yShift = piece.yShift
+                if board.intersects(probe):
+                    continue
+
+                probe.yShift = board.drop_y(probe)
+                score = self._evaluate(board, probe)
+                if best_score is None or score > best_score:
+                    best, best_score = (x, rotation), score
+
+        return best
+
+    def _evaluate(self, board, probe):
+        mask = get_collision_mask(probe)
+        x = probe.xShift
+        y = probe.yShift
+
+        # Lines the piece would complete
+        lines = 0
+        for i, bits in mask.rows:
+            row = board.field[y + i]
+            if row.count(0) == bin(bits).count('1'):
+                lines += 1
+
+        # New column tops, and the gaps left under the piece
+        tops = list(board.column_tops)
+        holes = 0
+        for j, bottom in mask.bottoms:
+            holes += tops[x + j] - 1 - (y + bottom)
+        for i, j in mask.cells:
+            if y + i < tops[x + j]:
+                tops[x + j] = y + i
+
+        heights = [max(0, board.height - top - lines) for top in tops]
+        bumpiness = sum(abs(heights[j] - heights[j + 1]) for j in range(len(heights) - 1))
+
+        return (self.HEIGHT_WEIGHT * sum(heights) + self.LINES_WEIGHT * lines +
+                self.HOLES_WEIGHT * holes + self.BUMPINESS_WEIGHT * bumpiness)
+
+
+class PolicyFactory:
+
+    # Registry for all the policies the batch runner can use
+    _policy_reg = {
+        'hard_drop': HardDropPolicy,
+        'random': RandomPolicy,
+        'greedy': GreedyPolicy,
+    }
+
+    @classmethod
+    def names(cls):
+        return list(cls._policy_reg)
+
+    @classmethod
+    def create_policy(cls, name, seed=None):
+        if name not in cls._policy_reg:
+            raise ValueError(f"Unknown policy: {name}")
+        return cls._policy_reg[name](seed)
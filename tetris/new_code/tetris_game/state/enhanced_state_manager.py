@@ -38,3 +38,7 @@ class EnhancedStateManager(StateManager):
         if (new_state_string == 'pause') or (should_cleanup and hasattr(self.current_state, 'restart')):
             if hasattr(self.current_state, 'restart'):
                 self.current_state.restart()
+
+        # The game's simulation clock doesn't catch up on the time spent in other states
+        if hasattr(self.current_state, 'resume'):
+            self.current_state.resume()
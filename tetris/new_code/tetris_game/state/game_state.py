@@ -9,6 +9,10 @@ from .abstract_state import AbstractState
 
 from ..game.piece.piece_action import PieceAction
 
+from ..replay.replay_recorder import ReplayRecorder
+
+from ..main.simulation_clock import SimulationClock
+
 class Game(AbstractState):
 
     def __init__(self, config, input, renderer):
@@ -21,6 +25,12 @@ class Game(AbstractState):
         }
 
         self.gamemode = None
+
+        # The simulation ticks config.fps times a second however often frames are drawn, keys
+        # pressed in a frame that runs no tick wait for the next one
+        self.sim_clock = SimulationClock(config.fps)
+        self.pending_actions = []
+
         self.startup()
 
     def cleanup(self):
@@ -28,6 +38,9 @@ class Game(AbstractState):
         pass
 
     def restart(self):
+        # A game left from the pause menu was never finished, close its recording first
+        self.finish_recording()
+
         # Force recreation of gamemode for restart
         self.startup()
         if self.gamemode is not None:
@@ -38,6 +51,9 @@ class Game(AbstractState):
 
         self.drawn = False
 
+        self.sim_clock.reset()
+        self.pending_actions = []
+
         # If there's a pending gamemode, use it (overrides existing gamemode)
         if self.config.pending_gamemode is not None:
             self.gamemode = self.config.pending_gamemode
@@ -53,11 +69,37 @@ class Game(AbstractState):
         # Start background music when game starts
         self.config.play_bgm()
 
+    # Ends the recording of a game that never reached game over (restarted, or the game was
+    # quit from the pause menu)
+    def finish_recording(self):
+        if self.gamemode is not None:
+            self.gamemode.detach_recorder(gameover=False)
+
+    # Back from the pause menu (or any other state), the time spent there isn't simulated
+    def resume(self):
+        self.sim_clock.reset()
+
     def update(self):
+        # A new game starts recording on its first frame
+        if self.gamemode.recorder is None and self.config.replay_dir is not None:
+            self.gamemode.attach_recorder(ReplayRecorder.open(self.config.replay_dir))
+
+        gamestate = self._play_frame()
+
+        if gamestate in ('gameover', 'quit'):
+            self.gamemode.detach_recorder(gameover=(gamestate == 'gameover'))
+
+        return gamestate
+
+    def _play_frame(self):
         gamestate = 'game'
         
+        profiler = self.config.profiler
+
         # get user input
+        profiler.start('input')
         actions = self.input.get_actions()
+        profiler.stop('input')
 
         for action in actions:
             if action == PieceAction.QUIT:
@@ -66,19 +108,45 @@ class Game(AbstractState):
                 return self.game_actions[action]
 
 
+        self.pending_actions.extend(actions)
+
+        profiler.start('simulation')
         pressing_down = self.input.is_down_pressed()
-        if self.gamemode is not None:
-            down_result = self.gamemode.handle_downkey(pressing_down, self.config.counter, self.config.fps)
-            if down_result == "gameover":
+        for _ in range(self.sim_clock.advance()):
+            actions, self.pending_actions = self.pending_actions, []
+            gamestate = self.tick(pressing_down, actions)
+            if gamestate == "gameover":
+                profiler.stop('simulation')
                 return "gameover"
+        profiler.stop('simulation')
+        
+        # The frame pacing can skip drawing a frame, the next one draws everything that changed
+        if self.config.render_frame:
+            profiler.start('render')
+            self.draw()
+            profiler.stop('render')
+        return gamestate
+
+    # One step of the simulation: the counter, gravity, the keys, then the effects move on
+    def tick(self, pressing_down, actions):
+        gamestate = 'game'
+
+        self.config.counter += self.config.level
+        if self.config.counter > 100000:
+            self.config.counter = 0
+
+        down_result = self.gamemode.handle_downkey(pressing_down, self.config.counter, self.config.fps)
+        if down_result == "gameover":
+            return "gameover"
 
         for action in actions:
-            if action not in self.game_actions and action != PieceAction.QUIT:
-                gamestate = self.gamemode.update(action)
-                if gamestate == "gameover":
-                    return "gameover"
-        
-        self.draw()
+            gamestate = self.gamemode.update(action)
+            if gamestate == "gameover":
+                return "gameover"
+
+        self.renderer.handle_vfx_pool(self.gamemode.vfx_pool)
+        self.renderer.update_vfx()
+        self.gamemode.vfx_pool.clear()
         return gamestate
 
     def draw(self):
@@ -89,10 +157,8 @@ class Game(AbstractState):
         self.renderer.draw_level(self.gamemode.display_level)
         self.renderer.draw_next_piece(self.gamemode.next_piece)
 
-        self.renderer.handle_vfx_pool(self.gamemode.vfx_pool)
-        self.renderer.update_vfx()
-        self.renderer.draw_vfx()
-        self.gamemode.vfx_pool.clear()
+        # The blocks sit on the grid, the effects are drawn part way to the next tick
+        self.renderer.draw_vfx(self.sim_clock.alpha)
 
     def toggle_pause():
         return 'pause'
\ No newline at end of file
@@ -188,26 +188,24 @@ class GamemodeSelection(AbstractState):
             self._draw_mode_selection()
         elif self.current_phase == 2:
             self._draw_piece_selection()
-        
-        pygame.display.flip()
 
     def _draw_mode_selection(self):
         # Draw phase 1 - mode selection screen
         # Title
-        font_large = pygame.font.SysFont('Comic Sans', 35, True, False)
-        title = font_large.render("Select Game Mode", True, (0, 0, 0))
+        font_large = self.renderer.text.font('Comic Sans', 35, True, False)
+        title = self.renderer.text.render(font_large, "Select Game Mode", True, (0, 0, 0))
         title_rect = title.get_rect(center=(200, 80))  # Centered on 400px wide screen
         self.renderer.screen.blit(title, title_rect)
         
         # Draw buttons
-        font = pygame.font.SysFont('Comic Sans', 25, True, False)
+        font = self.renderer.text.font('Comic Sans', 25, True, False)
         for button in self.mode_buttons:
             # Button background
             pygame.draw.rect(self.renderer.screen, (101, 67, 33), button["rect"])
             pygame.draw.rect(self.renderer.screen, (0, 0, 0), button["rect"], 2)
             
             # Button text
-            text = font.render(button["label"], True, (255, 255, 255))
+            text = self.renderer.text.render(font, button["label"], True, (255, 255, 255))
             text_rect = text.get_rect(center=button["rect"].center)
             self.renderer.screen.blit(text, text_rect)
 
@@ -215,19 +213,19 @@ class GamemodeSelection(AbstractState):
         # Draw phase 2 - special piece selection screen
 
         # Title
-        font_large = pygame.font.SysFont('Comic Sans', 30, True, False)
-        title = font_large.render("Select Special Pieces", True, (0, 0, 0))
+        font_large = self.renderer.text.font('Comic Sans', 30, True, False)
+        title = self.renderer.text.render(font_large, "Select Special Pieces", True, (0, 0, 0))
         title_rect = title.get_rect(center=(200, 40))  # Centered on 400px wide screen
         self.renderer.screen.blit(title, title_rect)
         
         # Instructions
-        font_small = pygame.font.SysFont('Comic Sans', 18, False, False)
-        instruction = font_small.render("Click to toggle pieces", True, (100, 100, 100))
+        font_small = self.renderer.text.font('Comic Sans', 18, False, False)
+        instruction = self.renderer.text.render(font_small, "Click to toggle pieces", True, (100, 100, 100))
         instruction_rect = instruction.get_rect(center=(200, 70))  # Centered on 400px wide screen
         self.renderer.screen.blit(instruction, instruction_rect)
         
         # Draw piece selection buttons
-        font = pygame.font.SysFont('Comic Sans', 20, True, False)
+        font = self.renderer.text.font('Comic Sans', 20, True, False)
         for button in self.piece_selection_buttons:
             # Button color based on selection
             if button["selected"]:
@@ -240,13 +238,13 @@ class GamemodeSelection(AbstractState):
             pygame.draw.rect(self.renderer.screen, (0, 0, 0), button["rect"], 3)
             
             # Button text
-            text = font.render(button["label"], True, (255, 255, 255))
+            text = self.renderer.text.render(font, button["label"], True, (255, 255, 255))
             text_rect = text.get_rect(center=button["rect"].center)
             self.renderer.screen.blit(text, text_rect)
             
             # Selection indicator
             if button["selected"]:
-                checkmark = font.render("✓", True, (255, 255, 255))
+                checkmark = self.renderer.text.render(font, "✓", True, (255, 255, 255))
                 check_rect = checkmark.get_rect(topright=(button["rect"].right - 5, button["rect"].top + 5))
                 self.renderer.screen.blit(checkmark, check_rect)
         
@@ -258,19 +256,19 @@ class GamemodeSelection(AbstractState):
         
         pygame.draw.rect(self.renderer.screen, confirm_color, self.confirm_button["rect"])
         pygame.draw.rect(self.renderer.screen, (0, 0, 0), self.confirm_button["rect"], 2)
-        text = font.render(self.confirm_button["label"], True, (255, 255, 255))
+        text = self.renderer.text.render(font, self.confirm_button["label"], True, (255, 255, 255))
         text_rect = text.get_rect(center=self.confirm_button["rect"].center)
         self.renderer.screen.blit(text, text_rect)
         
         # Draw back button
         pygame.draw.rect(self.renderer.screen, (200, 100, 100), self.back_button["rect"])
         pygame.draw.rect(self.renderer.screen, (0, 0, 0), self.back_button["rect"], 2)
-        text = font.render(self.back_button["label"], True, (255, 255, 255))
+        text = self.renderer.text.render(font, self.back_button["label"], True, (255, 255, 255))
         text_rect = text.get_rect(center=self.back_button["rect"].center)
         self.renderer.screen.blit(text, text_rect)
         
         # Show count of selected pieces (centered)
-        count_text = font_small.render(f"Selected: {len(self.selected_special_pieces)}", True, (0, 0, 0))
+        count_text = self.renderer.text.render(font_small, f"Selected: {len(self.selected_special_pieces)}", True, (0, 0, 0))
         count_rect = count_text.get_rect(center=(200, 365))  # Centered above buttons
         self.renderer.screen.blit(count_text, count_rect)
     
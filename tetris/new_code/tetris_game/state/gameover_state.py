@@ -49,8 +49,8 @@ class GameOver(AbstractState):
         self.renderer.clear()
 
         # Create a simple "GAME OVER" text overlay
-        font = pygame.font.SysFont('Arial', 72, True)  # Large, bold font
-        text_surface = font.render('GAME OVER', True, (255, 0, 0))  # Red text
+        font = self.renderer.text.font('Arial', 72, True)  # Large, bold font
+        text_surface = self.renderer.text.render(font, 'GAME OVER', True, (255, 0, 0))  # Red text
         
         # Center the text on the screen
         screen_rect = self.renderer.screen.get_rect()
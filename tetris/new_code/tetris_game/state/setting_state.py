@@ -152,13 +152,13 @@ class Setting(AbstractState):
         self.renderer.clear()
         
         # Draw title
-        font_large = pygame.font.Font(None, 48)
-        title_surface = font_large.render("Controls", True, (0, 0, 0))
+        font_large = self.renderer.text.font(None, 48)
+        title_surface = self.renderer.text.render(font_large, "Controls", True, (0, 0, 0))
         title_rect = title_surface.get_rect(center=(self.config.window_width // 2, 30))
         self.renderer.screen.blit(title_surface, title_rect)
         
         # Draw control mappings in two columns
-        font = pygame.font.Font(None, 28)
+        font = self.renderer.text.font(None, 28)
         
         for control_btn in self.control_buttons:
             action = control_btn['action']
@@ -166,7 +166,7 @@ class Setting(AbstractState):
             rect = control_btn['rect']
             
             # Draw action name (left column)
-            action_surface = font.render(display_name + ":", True, (0, 0, 0))
+            action_surface = self.renderer.text.render(font, display_name + ":", True, (0, 0, 0))
             action_rect = action_surface.get_rect(right=rect.left - 10, centery=rect.centery)
             self.renderer.screen.blit(action_surface, action_rect)
             
@@ -183,13 +183,13 @@ class Setting(AbstractState):
                 key_text = self._get_key_name(self.controls[action])
                 text_color = (255, 255, 255)
             
-            key_surface = font.render(key_text, True, text_color)
+            key_surface = self.renderer.text.render(font, key_text, True, text_color)
             key_rect = key_surface.get_rect(center=rect.center)
             self.renderer.screen.blit(key_surface, key_rect)
         
         # Draw sound settings section
         sound_y = 370
-        sound_label = font.render("Enable Sound:", True, (0, 0, 0))
+        sound_label = self.renderer.text.render(font, "Enable Sound:", True, (0, 0, 0))
         sound_label_rect = sound_label.get_rect(left=50, centery=sound_y + 12)
         self.renderer.screen.blit(sound_label, sound_label_rect)
         
@@ -216,9 +216,6 @@ class Setting(AbstractState):
             pygame.draw.rect(self.renderer.screen, (70, 70, 70), button["rect"])
             pygame.draw.rect(self.renderer.screen, (255, 255, 255), button["rect"], 2)
             
-            label_surface = font.render(button["label"], True, (255, 255, 255))
+            label_surface = self.renderer.text.render(font, button["label"], True, (255, 255, 255))
             label_rect = label_surface.get_rect(center=button["rect"].center)
             self.renderer.screen.blit(label_surface, label_rect)
-        
-        pygame.display.flip()
-
@@ -46,7 +46,8 @@ class StateManager():
             # Same state
             return True
         elif result is False or result == 'quit':
-            # Game should end!
+            # Game should end! A game still going (quit from the pause menu) keeps its recording
+            self.states['game'].finish_recording()
             return False
         
         # Change state
@@ -0,0 +1,77 @@
+"""
+    This is the abstract renderer class, every renderer backend (Renderer, NullRenderer) has to
+    overwrite it. The states and run_game only go through these methods, plus three attributes:
+
+        screen          the surface the states draw their own text and shapes on
+        text            the TextCache the states get their fonts and rendered text from
+        particle_lod    the ParticleLOD run_game reports frame times to
+
+    run_game picks the backend at startup (see RENDERER_BACKENDS in main/game.py)
+"""
+from abc import ABC, abstractmethod
+
+class AbstractRenderer(ABC):
+
+    # Game frame
+    @abstractmethod
+    def render_board(self, board):
+        pass
+
+    @abstractmethod
+    def draw_piece(self, piece):
+        pass
+
+    @abstractmethod
+    def draw_score(self, score):
+        pass
+
+    @abstractmethod
+    def draw_level(self, level):
+        pass
+
+    @abstractmethod
+    def draw_next_piece(self, next_piece):
+        pass
+
+    # Effects the gamemode queued this frame (its vfx_pool)
+    @abstractmethod
+    def handle_vfx_pool(self, vfx_pool):
+        pass
+
+    @abstractmethod
+    def update_vfx(self):
+        pass
+
+    # alpha: how far the simulation is towards its next tick, 0 to 1
+    @abstractmethod
+    def draw_vfx(self, alpha=0.0):
+        pass
+
+    # Menu screens
+    @abstractmethod
+    def render_menu(self, buttons):
+        pass
+
+    @abstractmethod
+    def render_gameover(self, buttons):
+        pass
+
+    @abstractmethod
+    def render_pause(self, buttons):
+        pass
+
+    # Lines of text over everything this frame (the frame profiler's numbers), called every
+    # frame, no lines takes down what the last call drew
+    @abstractmethod
+    def draw_overlay(self, lines):
+        pass
+
+    # Wipes the screen, the next frame draws everything
+    @abstractmethod
+    def clear(self):
+        pass
+
+    # Puts the frame on the display
+    @abstractmethod
+    def present(self):
+        pass
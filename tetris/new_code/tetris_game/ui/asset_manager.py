@@ -0,0 +1,127 @@
+"""
+    Loads the game's images once and keeps them in the display's pixel format, so a blit is a
+    plain copy instead of a pixel format conversion every time.
+
+    The block tiles are scaled to the size they are drawn at and packed next to each other
+    into one atlas surface. A tile is drawn by blitting the atlas with the tile's rect, or
+    through tile(), a subsurface that shares the atlas pixels.
+
+    Images drawn at other sizes (the next piece preview) are scaled once per size and kept
+    until the block size or the theme (the image directory) changes.
+"""
+
+import os
+import time
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+# tetris/new_code/img, next to the package
+IMG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'img')
+
+# block1.png to block6.png, one per color index
+BLOCK_IMAGES = {i: f'block{i}.png' for i in range(1, 7)}
+SPECIAL_BLOCK_IMAGE = 'bombBlock.png'
+
+
+# Same pixels in the display's format, images can be loaded before there is a display
+def convert(surface):
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class BlockAtlas:
+    def __init__(self, tiles):
+        # tiles: key -> scaled surface, laid out left to right
+        width = sum(tile.get_width() for tile in tiles.values())
+        height = max((tile.get_height() for tile in tiles.values()), default=0)
+
+        surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        self.rects = {}
+        x = 0
+        for key, tile in tiles.items():
+            self.rects[key] = surface.blit(tile, (x, 0))
+            x += tile.get_width()
+
+        self.surface = convert(surface)
+        self._tiles = {}
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def blit(self, target, key, position):
+        return target.blit(self.surface, position, self.rects[key])
+
+    # The tile as its own surface (a view into the atlas, nothing is copied)
+    def tile(self, key):
+        if key not in self._tiles:
+            self._tiles[key] = self.surface.subsurface(self.rects[key])
+        return self._tiles[key]
+
+
+class AssetManager:
+    def __init__(self, img_dir=IMG_DIR):
+        self.img_dir = img_dir
+
+        # name -> converted surface, None when the file is missing
+        self._images = {}
+        self._atlases = {}
+
+        # (name, size) -> scaled surface
+        self._scaled = {}
+
+        # Seconds spent loading, converting and packing
+        self.load_time = 0.0
+
+    # The image in img_dir, loaded the first time it is asked for
+    def image(self, name):
+        if name not in self._images:
+            start = time.perf_counter()
+            path = os.path.join(self.img_dir, name)
+            self._images[name] = convert(pygame.image.load(path)) if os.path.exists(path) else None
+            self.load_time += time.perf_counter() - start
+        return self._images[name]
+
+    # Every block image scaled to block_size (the special block to 3x6 blocks) in one atlas.
+    # Keys are the color indexes and 'special', missing images are left out
+    def block_atlas(self, block_size):
+        if block_size not in self._atlases:
+            images = {color_index: self.image(name) for color_index, name in BLOCK_IMAGES.items()}
+            images['special'] = self.image(SPECIAL_BLOCK_IMAGE)
+
+            start = time.perf_counter()
+            tiles = {}
+            for key, image in images.items():
+                if image is None:
+                    continue
+                if key == 'special':
+                    tiles[key] = pygame.transform.scale(image, (block_size * 3 - 2, block_size * 6 - 2))
+                else:
+                    tiles[key] = pygame.transform.scale(image, (block_size - 2, block_size - 2))
+
+            self._atlases[block_size] = BlockAtlas(tiles)
+            self.load_time += time.perf_counter() - start
+        return self._atlases[block_size]
+
+    # The image scaled to size, None when it is missing
+    def scaled(self, name, size):
+        key = (name, size)
+        if key not in self._scaled:
+            image = self.image(name)
+            self._scaled[key] = pygame.transform.scale(image, size) if image is not None else None
+        return self._scaled[key]
+
+    # Drops the scaled images, their sizes follow the block size
+    def evict_scaled(self):
+        self._scaled.clear()
+
+    # Takes the images from another directory from now on
+    def set_theme(self, img_dir):
+        if img_dir == self.img_dir:
+            return
+        self.img_dir = img_dir
+        self._images.clear()
+        self._atlases.clear()
+        self.evict_scaled()
@@ -0,0 +1,85 @@
+"""
+    Renderer backend that draws nothing. The state machine, input and gamemodes run as they do
+    in the game, so run_game can go under CI or a profiler and only the game logic is measured.
+
+    The states still draw their own text and shapes on screen (the surface it was given, never
+    presented); their text comes from NullText, which hands out one empty surface instead of
+    rendering anything.
+"""
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+from .abstract_renderer import AbstractRenderer
+from .particle_system import ParticleLOD
+from .renderer import PARTICLE_FRAME_BUDGET
+
+# Stands in for the TextCache, there are no fonts to load
+class NullText:
+    def __init__(self):
+        self._surface = pygame.Surface((1, 1), pygame.SRCALPHA)
+
+    def font(self, name, size, bold=False, italic=False):
+        return None
+
+    def render(self, font, text, antialias, color):
+        return self._surface
+
+    def __len__(self):
+        return 0
+
+    def clear(self):
+        pass
+
+
+class NullRenderer(AbstractRenderer):
+    def __init__(self, screen):
+        self.screen = screen
+        self.text = NullText()
+
+        # Frame times are still reported, nothing emits particles
+        self.particle_lod = ParticleLOD(PARTICLE_FRAME_BUDGET)
+
+        # How many frames were presented, for the benchmarks
+        self.frames = 0
+
+    def render_board(self, board):
+        pass
+
+    def draw_piece(self, piece):
+        pass
+
+    def draw_score(self, score):
+        pass
+
+    def draw_level(self, level):
+        pass
+
+    def draw_next_piece(self, next_piece):
+        pass
+
+    def handle_vfx_pool(self, vfx_pool):
+        pass
+
+    def update_vfx(self):
+        pass
+
+    def draw_vfx(self, alpha=0.0):
+        pass
+
+    def render_menu(self, buttons):
+        pass
+
+    def render_gameover(self, buttons):
+        pass
+
+    def render_pause(self, buttons):
+        pass
+
+    def draw_overlay(self, lines):
+        pass
+
+    def clear(self):
+        pass
+
+    def present(self):
+        self.frames += 1
@@ -0,0 +1,49 @@
+"""
+    Reusable full window surfaces for the effects and screens drawn over everything else (the
+    screen flash, the menu, pause and game over buttons). Each one is created and drawn once
+    per window size and blitted from then on, instead of a new Surface every frame.
+
+    Usage:
+        flash = overlays.solid('flash', screen.get_size(), (255, 0, 0))
+        flash.set_alpha(alpha)
+        screen.blit(flash, (0, 0))
+"""
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+class OverlayCompositor:
+    def __init__(self):
+        # key -> Surface, all the size of the window
+        self._layers = {}
+        self._size = None
+
+        # How many layers were drawn (not reused), for the tests
+        self.builds = 0
+
+    # The layer for key at size, draw(surface) fills it in the first time it is asked for.
+    # Keys only need to be hashable, screens with different contents need different keys
+    def layer(self, key, size, draw, alpha=False):
+        if size != self._size:
+            # The window changed size, none of the layers fit anymore
+            self._layers.clear()
+            self._size = size
+
+        surface = self._layers.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+            draw(surface)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            self._layers[key] = surface
+            self.builds += 1
+        return surface
+
+    # A layer filled with color, its alpha can be changed with set_alpha before every blit
+    def solid(self, key, size, color):
+        return self.layer(key, size, lambda surface: surface.fill(color))
+
+    def __len__(self):
+        return len(self._layers)
+
+    def clear(self):
+        self._layers.clear()
@@ -0,0 +1,163 @@
+"""
+    Particles stored as a struct of arrays: one NumPy array per field (position, velocity,
+    color, age, lifetime, size) instead of a dict per particle. A frame moves, ages and fades
+    every particle with a handful of array operations, and expired particles are dropped by
+    compacting the live ones to the front, so a burst expiring at once costs the same as one.
+
+    Particles with a negative age are waiting to start (the column flame falls row by row),
+    they don't move and aren't drawn until their age reaches 0.
+
+    A system is a fixed size pool: the arrays are allocated once and slots are reused, a burst
+    that doesn't fit is cut short. ParticleLOD lowers how many particles the effects emit, and
+    how big they are, while frames take longer than the budget.
+"""
+
+import numpy as np
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+# The first n rows of an emit() argument, a single value goes to every particle
+def _head(values, n):
+    values = np.asarray(values)
+    return values if values.ndim == 0 else values[:n]
+
+class ParticleSystem:
+    def __init__(self, gravity, fade_size=False, capacity=1024):
+        # Added to the y velocity every frame
+        self.gravity = gravity
+
+        # Particles shrink as they fade when set, otherwise only their color fades
+        self.fade_size = fade_size
+
+        self.count = 0
+
+        # Particles that didn't fit
+        self.dropped = 0
+
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.color = np.zeros((capacity, 3))
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity)
+
+    @property
+    def capacity(self):
+        return len(self.age)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    # Adds len(x) particles, every argument has one row per particle (age can be one value for
+    # all of them). Only as many as there are free slots are added, returns how many
+    def emit(self, x, y, vx, vy, color, lifetime, size, age=0):
+        n = len(x)
+        start = self.count
+        end = min(start + n, self.capacity)
+        fits = end - start
+        self.dropped += n - fits
+        if fits == 0:
+            return 0
+
+        self.position[start:end, 0] = _head(x, fits)
+        self.position[start:end, 1] = _head(y, fits)
+        self.velocity[start:end, 0] = _head(vx, fits)
+        self.velocity[start:end, 1] = _head(vy, fits)
+        self.color[start:end] = _head(color, fits)
+        self.age[start:end] = _head(age, fits)
+        self.lifetime[start:end] = _head(lifetime, fits)
+        self.size[start:end] = _head(size, fits)
+        self.count = end
+        return fits
+
+    # One frame: move the started particles, age all of them, drop the expired ones
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+
+        started = self.age[:n] >= 0
+        if started.all():
+            self.position[:n] += self.velocity[:n]
+            self.velocity[:n, 1] += self.gravity
+        else:
+            self.position[:n][started] += self.velocity[:n][started]
+            self.velocity[:n, 1][started] += self.gravity
+        self.age[:n] += 1
+
+        alive = self.age[:n] < self.lifetime[:n]
+        if not alive.all():
+            self._compact(np.flatnonzero(alive))
+
+    # Moves the particles at keep to the front, in order
+    def _compact(self, keep):
+        count = len(keep)
+        for field in (self.position, self.velocity, self.color, self.age, self.lifetime, self.size):
+            field[:count] = field[keep]
+        self.count = count
+
+    # Draws the started particles onto surface, returns the rects that were drawn to. alpha (0 to
+    # 1) draws them that far towards where the next update() moves them
+    def draw(self, surface, alpha=0.0):
+        n = self.count
+        if n == 0:
+            return []
+
+        started = np.flatnonzero(self.age[:n] >= 0)
+        if len(started) == 0:
+            return []
+
+        fade = 1 - self.age[started] / self.lifetime[started]
+        colors = np.clip((self.color[started] * fade[:, None]).astype(np.int32), 0, 255)
+        if alpha:
+            centers = (self.position[started] + self.velocity[started] * alpha).astype(np.int32)
+        else:
+            centers = self.position[started].astype(np.int32)
+        if self.fade_size:
+            radii = (self.size[started] * fade).astype(np.int32)
+        else:
+            radii = self.size[started].astype(np.int32)
+
+        draw_circle = pygame.draw.circle
+        return [
+            draw_circle(surface, color, center, radius)
+            for color, center, radius in zip(colors.tolist(), centers.tolist(), radii.tolist())
+        ]
+
+
+# Level of detail for the effects. frame() is given how long each frame took; while they take
+# longer than budget the level drops, and it climbs back slowly once there is time to spare.
+# Effects emit count() particles instead of their full amount and scale them by size_scale
+class ParticleLOD:
+    def __init__(self, budget, min_level=0.25, drop=0.8, recover=0.02, smoothing=0.2):
+        self.budget = budget            # seconds a frame may take
+        self.min_level = min_level
+        self.drop = drop                # level is multiplied by this on a slow frame
+        self.recover = recover          # and goes up by this on a fast one
+        self.smoothing = smoothing      # weight of the newest frame in frame_time
+
+        self.level = 1.0
+        self.frame_time = None          # smoothed frame time
+
+    def frame(self, seconds):
+        if self.frame_time is None:
+            self.frame_time = seconds
+        else:
+            self.frame_time += (seconds - self.frame_time) * self.smoothing
+
+        if self.frame_time > self.budget:
+            self.level = max(self.min_level, self.level * self.drop)
+        elif self.frame_time < self.budget * 0.75:
+            self.level = min(1.0, self.level + self.recover)
+
+    # How many of count particles to emit, at least one when any were asked for
+    def count(self, count):
+        if count == 0:
+            return 0
+        return max(1, round(count * self.level))
+
+    @property
+    def size_scale(self):
+        return 0.5 + 0.5 * self.level
@@ -10,7 +10,12 @@ import pygame # type: ignore (ignores the "could not resolve" error)
 import os
 
 from ..main.constants import COLORS, BLACK, WHITE, GRAY, LIGHT_BROWN, DARK_BROWN
-import random
+from .abstract_renderer import AbstractRenderer
+from .asset_manager import AssetManager, BLOCK_IMAGES, SPECIAL_BLOCK_IMAGE
+from .text_cache import TextCache
+from .particle_system import ParticleSystem, ParticleLOD
+from .overlay import OverlayCompositor
+import numpy as np
 import os
 import math
 
@@ -21,94 +26,107 @@ yStart = 60
 # Block pixel size
 block_pixel_size = 20
 
-class Renderer:
-    def __init__(self, screen):
+# More dirty rects than this in a frame are updated as their bounding rect
+MAX_DIRTY_RECTS = 64
+
+# Most particles alive at once per effect, past that new ones are not emitted
+LINE_CLEAR_PARTICLES = 1024
+FLAME_PARTICLES = 256
+COLUMN_FLAME_PARTICLES = 1024
+
+# Frame time (seconds) above which the particle effects are cut down
+PARTICLE_FRAME_BUDGET = 1 / 60
+
+# Random bright and colorful colors
+LINE_CLEAR_COLORS = np.array([
+    (255, 50, 50),    # Bright Red
+    (50, 255, 50),    # Bright Green
+    (50, 50, 255),    # Bright Blue
+    (255, 255, 50),   # Bright Yellow
+    (255, 50, 255),   # Bright Magenta
+    (50, 255, 255),   # Bright Cyan
+    (255, 150, 50),   # Bright Orange
+    (150, 50, 255),   # Bright Purple
+    (50, 255, 150),   # Bright Mint
+    (255, 200, 50),   # Bright Gold
+    (200, 50, 255),   # Bright Pink
+    (50, 200, 255),   # Bright Sky Blue
+])
+
+# Flame color
+FLAME_COLORS = np.array([
+    (255, 50, 0),
+    (255, 100, 0),
+    (255, 150, 0),
+    (255, 200, 50),
+])
+
+class Renderer(AbstractRenderer):
+    def __init__(self, screen, assets=None, text=None):
         self.screen = screen
         self.xStart = xStart
         self.yStart = yStart
         self.block_pixel_size = block_pixel_size
-        self.font = pygame.font.SysFont('Comic Sans', 25, True, False)
-        
-        # Load block images
-        img_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'img')
-        self.block_images = {}
-        for i in range(1, 7):  # block1.png to block6.png
-            img_path = os.path.join(img_dir, f'block{i}.png')
-            if os.path.exists(img_path):
-                img = pygame.image.load(img_path)
-                # Scale image to block size
-                self.block_images[i] = pygame.transform.scale(img, (block_pixel_size - 2, block_pixel_size - 2))
-            else:
-                # Fallback to color if image not found
-                self.block_images[i] = None
 
+        # Fonts and rendered strings, shared with the states through renderer.text
+        self.text = text if text is not None else TextCache()
+        self.font = self.text.font('Comic Sans', 25, True, False)
         
-        # Load special block image
-        bomb_block_path = os.path.join(img_dir, 'bombBlock.png')
-        if os.path.exists(bomb_block_path):
-            bomb_img = pygame.image.load(bomb_block_path)
-            # Scale to 3x6 block size
-            special_width = block_pixel_size * 3 - 2
-            special_height = block_pixel_size * 6 - 2
-            self.special_block_image = pygame.transform.scale(bomb_img, (special_width, special_height))
-        else:
-            self.special_block_image = None
+        # Block images come from one atlas in the display's pixel format
+        self.assets = assets if assets is not None else AssetManager()
+        self._asset_key = None
+        self._load_block_images()
         
         # Particle system for line clearing effects
-        self.particles = []
-        
-        # Special block effects
-        self.screen_flash_alpha = 0  # Screen flash effect (0-255)
-        self.screen_flash_duration = 0  # Frames remaining for flash
-        self.flame_particles = []  # Flame particles above special block
-        self.column_flame_particles = []  # Flame particles falling down cleared columns
-    
-        """Draw column flame particles"""
-        for particle in self.column_flame_particles:
-            if particle['age'] >= 0:
-                fade = 1 - (particle['age'] / particle['lifetime'])
-                color = tuple(min(255, max(0, int(c * fade))) for c in particle['color'])
-                
-                pygame.draw.circle(
-                    self.screen,
-                    color,
-                    (int(particle['x']), int(particle['y'])),
-                    int(particle['size'] * fade)
-                )
+        self.particles = ParticleSystem(gravity=0.2, capacity=LINE_CLEAR_PARTICLES)
+        self._vfx_rng = np.random.default_rng()
 
+        # Fewer, smaller particles while frames run over budget (run_game reports frame times)
+        self.particle_lod = ParticleLOD(PARTICLE_FRAME_BUDGET)
         
-        # Load block images
-        img_dir = "assets/img"
-        self.block_images = {}
-        for i in range(1, 7):  # block1.png to block6.png
-            img_path = os.path.join(img_dir, f'block{i}.png')
-            if os.path.exists(img_path):
-                img = pygame.image.load(img_path)
-                # Scale image to block size
-                self.block_images[i] = pygame.transform.scale(img, (block_pixel_size - 2, block_pixel_size - 2))
-            else:
-                # Fallback to color if image not found
-                self.block_images[i] = None
-        
-        # Load special block image
-        bomb_block_path = os.path.join(img_dir, 'bombBlock.png')
-        if os.path.exists(bomb_block_path):
-            bomb_img = pygame.image.load(bomb_block_path)
-            # Scale to 3x6 block size
-            special_width = block_pixel_size * 3 - 2
-            special_height = block_pixel_size * 6 - 2
-            self.special_block_image = pygame.transform.scale(bomb_img, (special_width, special_height))
-        else:
-            self.special_block_image = None
-        
-        # Particle system for line clearing effects
-        self.particles = []
-        
+        # The screen flash and the menu screens are drawn once per window size and reused
+        self.overlays = OverlayCompositor()
+
         # Special block effects
         self.screen_flash_alpha = 0  # Screen flash effect (0-255)
         self.screen_flash_duration = 0  # Frames remaining for flash
-        self.flame_particles = []  # Flame particles above special block
-        self.column_flame_particles = []  # Flame particles falling down cleared columns
+        self.flame_particles = ParticleSystem(gravity=0.1, fade_size=True, capacity=FLAME_PARTICLES)  # Flame particles above special block
+        self.column_flame_particles = ParticleSystem(gravity=0.15, fade_size=True, capacity=COLUMN_FLAME_PARTICLES)  # Flame particles falling down cleared columns
+
+        # Dirty regions: a game frame only draws what changed since the last one and present()
+        # hands just those rects to the display. Menus and overlays repaint everything
+        self._repaint = True            # the next render_board draws the whole screen
+        self._flip_all = True           # present() updates the whole display
+        self._dirty = []                # rects drawn this frame
+        self._drawn_cells = None        # board.snapshot() as it is on screen
+        self._board_size = (0, 0)
+        self._restored_cells = set()    # cells drawn again this frame
+        self._piece_cells = {}          # cells of the piece on screen -> color
+        self._hud = {}                  # HUD field -> value on screen
+        self._hud_areas = self._hud_rects()
+        self._vfx_rects = []            # rects the particles were drawn to
+        self._overlay_rect = None       # the profiler overlay's box on screen
+        self._under_overlay = None      # what the box covers, put back when it isn't drawn over
+
+        # Everything that stays put during a game (fill, grid, HUD labels), drawn once
+        self._background = None
+        self._background_key = None     # (board size, block size, window size) it was built for
+
+    # (Re)builds the block images for the current block size and theme, the scaled copies
+    # made for the old ones are dropped
+    def _load_block_images(self):
+        asset_key = (self.block_pixel_size, self.assets.img_dir)
+        if asset_key == self._asset_key:
+            return False
+
+        if self._asset_key is not None:
+            self.assets.evict_scaled()
+        self._asset_key = asset_key
+
+        self.block_atlas = self.assets.block_atlas(self.block_pixel_size)
+        self.block_images = {i: self.block_atlas.tile(i) if i in self.block_atlas else None for i in range(1, 7)}
+        self.special_block_image = self.block_atlas.tile('special') if 'special' in self.block_atlas else None
+        return True
 
     """
         VFX
@@ -140,10 +158,12 @@ class Renderer:
         self.update_column_flame_particles()
         self.update_screen_flash()
 
-    def draw_vfx(self):
-        self.draw_particles()
-        self.draw_flame_particles()
-        self.draw_column_flame_particles()
+    # alpha is how far the simulation is towards its next tick (0 to 1), the particles are drawn
+    # that far along their way
+    def draw_vfx(self, alpha=0.0):
+        self.draw_particles(alpha)
+        self.draw_flame_particles(alpha)
+        self.draw_column_flame_particles(alpha)
         self.draw_screen_flash()
 
     def create_line_clear_particles(self, line_y, board_width):
@@ -151,70 +171,42 @@ class Renderer:
         # Calculate screen position of the cleared line
         screen_y = self.yStart + self.block_pixel_size * line_y + self.block_pixel_size // 2
         
-        # Create particles for each block in the line
-        for j in range(board_width):
-            screen_x = self.xStart + self.block_pixel_size * j + self.block_pixel_size // 2
-            
-            # Create multiple particles per block
-            for _ in range(5):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(2, 5)
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
-                
-                # Random bright and colorful colors
-                color = random.choice([
-                    (255, 50, 50),    # Bright Red
-                    (50, 255, 50),    # Bright Green
-                    (50, 50, 255),    # Bright Blue
-                    (255, 255, 50),   # Bright Yellow
-                    (255, 50, 255),   # Bright Magenta
-                    (50, 255, 255),   # Bright Cyan
-                    (255, 150, 50),   # Bright Orange
-                    (150, 50, 255),   # Bright Purple
-                    (50, 255, 150),   # Bright Mint
-                    (255, 200, 50),   # Bright Gold
-                    (200, 50, 255),   # Bright Pink
-                    (50, 200, 255),   # Bright Sky Blue
-                ])
-                
-                lifetime = random.randint(25, 45)
-                
-                self.particles.append({
-                    'x': screen_x,
-                    'y': screen_y,
-                    'vx': vx,
-                    'vy': vy,
-                    'color': color,
-                    'lifetime': lifetime,
-                    'age': 0,
-                    'size': random.randint(3, 5)  # Slightly larger particles
-                })
+        # Multiple particles per block in the line, spread over fewer of them under load
+        rng = self._vfx_rng
+        columns = self._lod_sample(np.repeat(np.arange(board_width), 5))
+        count = len(columns)
+        screen_x = self.xStart + self.block_pixel_size * columns + self.block_pixel_size // 2
+
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(2, 5, count)
+
+        self.particles.emit(
+            screen_x,
+            np.full(count, screen_y),
+            np.cos(angle) * speed,
+            np.sin(angle) * speed,
+            LINE_CLEAR_COLORS[rng.integers(len(LINE_CLEAR_COLORS), size=count)],
+            rng.integers(25, 46, count),
+            rng.integers(3, 6, count) * self.particle_lod.size_scale  # Slightly larger particles
+        )
     
+    # The share of slots (the block or row each particle starts from) the LOD level allows,
+    # picked at random so the effect thins out evenly
+    def _lod_sample(self, slots):
+        count = self.particle_lod.count(len(slots))
+        if count == len(slots):
+            return slots
+        return np.sort(self._vfx_rng.choice(slots, count, replace=False))
+
     def update_particles(self):
         """Update all particles"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['age'] += 1
-            
-            if particle['age'] >= particle['lifetime']:
-                self.particles.remove(particle)
+        self.particles.update()
     
-    def draw_particles(self):
+    def draw_particles(self, alpha=0.0):
         """Draw all particles"""
-        for particle in self.particles:
-            # Fade out as particle ages
-            alpha = 255 * (1 - particle['age'] / particle['lifetime'])
-            color = tuple(min(255, max(0, int(c * (1 - particle['age'] / particle['lifetime'])))) for c in particle['color'])
-            
-            pygame.draw.circle(
-                self.screen,
-                color,
-                (int(particle['x']), int(particle['y'])),
-                particle['size']
-            )
+        # Fade out as particle ages
+        for rect in self.particles.draw(self.screen, alpha):
+            self._add_vfx_rect(rect)
     
     def trigger_screen_flash(self):
         """Trigger red screen flash effect"""
@@ -234,136 +226,155 @@ class Renderer:
     def draw_screen_flash(self):
         """Draw red screen flash overlay"""
         if self.screen_flash_alpha > 0:
-            flash_surface = pygame.Surface(self.screen.get_size())
+            flash_surface = self.overlays.solid('flash', self.screen.get_size(), (255, 0, 0))
             flash_surface.set_alpha(self.screen_flash_alpha)
-            flash_surface.fill((255, 0, 0))
             self.screen.blit(flash_surface, (0, 0))
+
+            # The overlay covers everything, so the next frame starts from scratch
+            self._flip_all = True
+            self._repaint = True
+
+    # Particles are drawn straight over the scene, the next frame puts back what they covered
+    def _add_vfx_rect(self, rect):
+        self._vfx_rects.append(rect)
+        self._dirty.append(rect)
     
     def create_flame_particles(self, x, y, width):
         """Create flame particles above special block"""
         # Create flame particles on the special block
-        for _ in range(3):
-            offset_x = random.uniform(0, width)
-            flame_x = x + offset_x
-            flame_y = y - random.randint(5, 15)  # Above the block
-            
-            # Flame color
-            color_choice = random.choice([
-                (255, 50, 0),
-                (255, 100, 0),
-                (255, 150, 0),
-                (255, 200, 50),
-            ])
-            
-            vx = random.uniform(-0.5, 0.5)
-            vy = random.uniform(-2, -0.5)
-            
-            self.flame_particles.append({
-                'x': flame_x,
-                'y': flame_y,
-                'vx': vx,
-                'vy': vy,
-                'color': color_choice,
-                'lifetime': random.randint(15, 25),
-                'age': 0,
-                'size': random.randint(3, 6)
-            })
+        rng = self._vfx_rng
+        count = self.particle_lod.count(3)
+        self.flame_particles.emit(
+            x + rng.uniform(0, width, count),
+            y - rng.integers(5, 16, count),  # Above the block
+            rng.uniform(-0.5, 0.5, count),
+            rng.uniform(-2, -0.5, count),
+            FLAME_COLORS[rng.integers(len(FLAME_COLORS), size=count)],
+            rng.integers(15, 26, count),
+            rng.integers(3, 7, count) * self.particle_lod.size_scale
+        )
     
     def update_flame_particles(self):
         """Update flame particles"""
-        for particle in self.flame_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.1
-            particle['age'] += 1
-            
-            if particle['age'] >= particle['lifetime']:
-                self.flame_particles.remove(particle)
+        self.flame_particles.update()
     
-    def draw_flame_particles(self):
+    def draw_flame_particles(self, alpha=0.0):
         """Draw flame particles"""
-        for particle in self.flame_particles:
-            fade = 1 - (particle['age'] / particle['lifetime'])
-            color = tuple(min(255, max(0, int(c * fade))) for c in particle['color'])
-            
-            pygame.draw.circle(
-                self.screen,
-                color,
-                (int(particle['x']), int(particle['y'])),
-                int(particle['size'] * fade)
-            )
+        for rect in self.flame_particles.draw(self.screen, alpha):
+            self._add_vfx_rect(rect)
     
     def create_column_flame_effect(self, column_x, board_height):
         """Create flame effect falling down a cleared column"""
         screen_x = self.xStart + self.block_pixel_size * column_x + self.block_pixel_size // 2
-        
-        for i in range(board_height):
-            screen_y = self.yStart + self.block_pixel_size * i + self.block_pixel_size // 2
-            
-            for _ in range(2):
-                flame_x = screen_x + random.uniform(-5, 5)
-                flame_y = screen_y + random.uniform(-3, 3)
-                
-                color_choice = random.choice([
-                    (255, 50, 0),
-                    (255, 100, 0),
-                    (255, 150, 0),
-                    (255, 200, 50),
-                ])
-                
-                vx = random.uniform(-0.3, 0.3)
-                vy = random.uniform(1, 3)
-                
-                delay = i * 2
-                
-                self.column_flame_particles.append({
-                    'x': flame_x,
-                    'y': flame_y,
-                    'vx': vx,
-                    'vy': vy,
-                    'color': color_choice,
-                    'lifetime': random.randint(20, 35),
-                    'age': -delay,
-                    'size': random.randint(4, 7)
-                })
+
+        # Two particles per row, each row starts 2 frames after the one above it
+        rows = self._lod_sample(np.repeat(np.arange(board_height), 2))
+        count = len(rows)
+        screen_y = self.yStart + self.block_pixel_size * rows + self.block_pixel_size // 2
+
+        rng = self._vfx_rng
+        self.column_flame_particles.emit(
+            screen_x + rng.uniform(-5, 5, count),
+            screen_y + rng.uniform(-3, 3, count),
+            rng.uniform(-0.3, 0.3, count),
+            rng.uniform(1, 3, count),
+            FLAME_COLORS[rng.integers(len(FLAME_COLORS), size=count)],
+            rng.integers(20, 36, count),
+            rng.integers(4, 8, count) * self.particle_lod.size_scale,
+            age=-2 * rows
+        )
     
     def update_column_flame_particles(self):
         """Update column flame particles"""
-        for particle in self.column_flame_particles[:]:
-            if particle['age'] >= 0:
-                particle['x'] += particle['vx']
-                particle['y'] += particle['vy']
-                particle['vy'] += 0.15
-            particle['age'] += 1
-            
-            if particle['age'] >= particle['lifetime']:
-                self.column_flame_particles.remove(particle)
+        self.column_flame_particles.update()
     
-    def draw_column_flame_particles(self):
+    def draw_column_flame_particles(self, alpha=0.0):
         """Draw column flame particles"""
-        for particle in self.column_flame_particles:
-            if particle['age'] >= 0:
-                fade = 1 - (particle['age'] / particle['lifetime'])
-                color = tuple(min(255, max(0, int(c * fade))) for c in particle['color'])
-                
-                pygame.draw.circle(
-                    self.screen,
-                    color,
-                    (int(particle['x']), int(particle['y'])),
-                    int(particle['size'] * fade)
-                )
+        for rect in self.column_flame_particles.draw(self.screen, alpha):
+            self._add_vfx_rect(rect)
 
     """
         Rendering
     """
 
     def render_board(self, board):
-        self.screen.fill(LIGHT_BROWN)
+        cells = board.snapshot()
+        width = board.width
+
+        if self._load_block_images():
+            self._repaint = True
+
+        background_key = (board.width, board.height, self.block_pixel_size, self.screen.get_size())
+        if background_key != self._background_key:
+            self._build_background(board)
+            self._background_key = background_key
+            self._repaint = True
+
+        if self._repaint or self._drawn_cells is None or len(cells) != len(self._drawn_cells):
+            self._repaint_board(board, cells)
+            return
+
+        # Cells that changed since they were last drawn
+        drawn = self._drawn_cells
+        restore = set()
+        if cells != drawn:
+            for k in range(len(cells)):
+                if cells[k] != drawn[k]:
+                    restore.add(divmod(k, width))
+
+        # Whatever the particles and the overlay covered last frame goes back to how it was
+        if self._overlay_rect is not None:
+            self._vfx_rects.append(self._overlay_rect)
+            self._overlay_rect = None
+        self._under_overlay = None
+        for rect in self._vfx_rects:
+            self.screen.blit(self._background, rect, rect)
+            restore.update(self._cells_in(rect, board))
+            self._invalidate_hud(rect)
+            self._dirty.append(rect)
+        self._vfx_rects = []
+
+        self._drawn_cells = cells
+        for i, j in restore:
+            self._draw_cell(i, j)
+        self._restored_cells = restore
+
+    # Draws every cell and forgets what was on screen, after a menu or an overlay
+    def _repaint_board(self, board, cells):
+        self.screen.blit(self._background, (0, 0))
+        self._flip_all = True
+        self._repaint = False
+
+        self._drawn_cells = cells
+        self._board_size = (board.width, board.height)
+        self._piece_cells = {}
+        self._hud = {}
+        self._hud_areas = self._hud_rects()
+        self._vfx_rects = []
+        self._overlay_rect = None
+        self._under_overlay = None
+
+        self._restored_cells = set()
+        for i in range(board.height):
+            for j in range(board.width):
+                self._restored_cells.add((i, j))
+                if cells[i * board.width + j] > 0:
+                    self._draw_block(
+                        cells[i * board.width + j],
+                        self.xStart + self.block_pixel_size * j + 1,
+                        self.yStart + self.block_pixel_size * i + 1,
+                        self.block_pixel_size - 1
+                    )
+
+    # The static layer: background color, the board grid and the HUD labels and preview box
+    def _build_background(self, board):
+        background = pygame.Surface(self.screen.get_size(), 0, self.screen)
+        background.fill(LIGHT_BROWN)
 
         for i in range(board.height):
             for j in range(board.width):
                 pygame.draw.rect(
-                    self.screen, 
+                    background, 
                     GRAY, 
                     [
                         self.xStart + self.block_pixel_size * j, 
@@ -373,31 +384,85 @@ class Renderer:
                     ], 
                     1
                 )
-                if board.field[i][j] > 0:
-                    color_index = board.field[i][j]
-                    if color_index in self.block_images and self.block_images[color_index] is not None:
-                        # Use image
-                        self.screen.blit(
-                            self.block_images[color_index],
-                            (
-                                self.xStart + self.block_pixel_size * j + 1,
-                                self.yStart + self.block_pixel_size * i + 1
-                            )
-                        )
-                    else:
-                        # Fallback to color
-                        pygame.draw.rect(
-                            self.screen, 
-                            COLORS[color_index],
-                            [
-                                self.xStart + self.block_pixel_size * j + 1, 
-                                self.yStart + self.block_pixel_size * i + 1, 
-                                self.block_pixel_size - 2, 
-                                self.block_pixel_size - 1
-                            ]
-                        )
+
+        # Labels sit at the top left of their HUD field
+        areas = self._hud_rects()
+        background.blit(self.text.render(self.font, 'SCORE', True, BLACK), areas['score'].topleft)
+        background.blit(self.text.render(self.font, 'NEXT', True, BLACK), areas['next'].topleft)
+        background.blit(self.text.render(self.font, 'LEVEL', True, BLACK), areas['level'].topleft)
+
+        # Next piece preview box
+        preview_box_size = int(self.block_pixel_size * 0.75) * 4 + 4
+        pygame.draw.rect(
+            background,
+            GRAY,
+            [areas['next'].x, areas['next'].y + 30, preview_box_size, preview_box_size],
+            2
+        )
+
+        self._background = background
+
+    # Board cell (i, j) as it was last rendered, grid outline included
+    def _draw_cell(self, i, j):
+        rect = pygame.Rect(
+            self.xStart + self.block_pixel_size * j,
+            self.yStart + self.block_pixel_size * i,
+            self.block_pixel_size,
+            self.block_pixel_size
+        )
+        self.screen.blit(self._background, rect, rect)
+
+        color_index = self._drawn_cells[i * self._board_size[0] + j]
+        if color_index > 0:
+            self._draw_block(color_index, rect.x + 1, rect.y + 1, self.block_pixel_size - 1)
+        self._dirty.append(rect)
+
+    def _draw_block(self, color_index, x, y, height):
+        if color_index in self.block_atlas:
+            # Use image
+            self.block_atlas.blit(self.screen, color_index, (x, y))
+        else:
+            # Fallback to color
+            pygame.draw.rect(self.screen, COLORS[color_index], [x, y, self.block_pixel_size - 2, height])
+
+    # Board cells that overlap rect
+    def _cells_in(self, rect, board):
+        size = self.block_pixel_size
+        first_j = max(0, (rect.left - self.xStart) // size)
+        last_j = min(board.width - 1, (rect.right - 1 - self.xStart) // size)
+        first_i = max(0, (rect.top - self.yStart) // size)
+        last_i = min(board.height - 1, (rect.bottom - 1 - self.yStart) // size)
+        return [(i, j) for i in range(first_i, last_i + 1) for j in range(first_j, last_j + 1)]
+
+    # Board cells covered by piece, mapped to the color drawn there (-1 for the special block)
+    def _cells_of(self, piece):
+        if piece.is_special:
+            return {
+                (i + piece.yShift, j + piece.xShift): -1
+                for i in range(piece.height)
+                for j in range(piece.width)
+            }
+
+        return {
+            (p // 4 + piece.yShift, p % 4 + piece.xShift): piece.color
+            for p in piece.get_figure()
+        }
 
     def draw_piece(self, piece):
+        cells = self._cells_of(piece)
+
+        # Nothing to do when it did not move and nothing was drawn over it
+        if cells == self._piece_cells and self._restored_cells.isdisjoint(cells):
+            return
+
+        # Cells the piece moved off show the board again, the ones under it are put back too so
+        # the see-through parts of the block images are not blended over themselves
+        if self._drawn_cells is not None:
+            width, height = self._board_size
+            for i, j in self._piece_cells.keys() | cells.keys():
+                if 0 <= i < height and 0 <= j < width:
+                    self._draw_cell(i, j)
+        self._piece_cells = cells
 
         # Special block render
         if piece.is_special:
@@ -426,100 +491,109 @@ class Renderer:
             # Don't draw the collision blocks for special pieces
             return
 
-        figure = piece.get_figure()
+        for i, j in cells:
+            self._draw_block(
+                piece.color,
+                self.xStart + self.block_pixel_size * j + 1,
+                self.yStart + self.block_pixel_size * i + 1,
+                self.block_pixel_size - 2
+            )
+
+    """
+        HUD
+    """
+
+    # Screen area of each HUD field, nothing else is drawn inside them
+    def _hud_rects(self):
+        line_height = self.font.get_linesize()
+        side_x = self.xStart + (self.block_pixel_size * 10) + 20  # 10 = board width, 20 = padding
+        side_width = max(0, self.screen.get_width() - side_x)
+        preview_block_size = int(self.block_pixel_size * 0.75)
+        preview_box_size = preview_block_size * 4 + 4
+
+        # The rocket's preview is taller than the box and sticks out of it at the bottom
+        _, rocket_height = self._special_preview_size(preview_block_size)
+        preview_bottom = max(preview_box_size, (preview_box_size - rocket_height) // 2 + rocket_height)
+
+        return {
+            'score': pygame.Rect(side_x, self.yStart, side_width, 30 + line_height),
+            'next': pygame.Rect(side_x, self.yStart + 90, side_width, 30 + preview_bottom),
+            'level': pygame.Rect(10, 10, self.xStart - 10, 35 + line_height),
+        }
+
+    # Puts field back to its background (label included) for drawing, when value is not what
+    # is already on screen
+    def _begin_hud_field(self, field, value):
+        if field in self._hud and self._hud[field] == value:
+            return False
+
+        rect = self._hud_areas[field]
+        self.screen.blit(self._background, rect, rect)
+        self._dirty.append(rect)
+        self._hud[field] = value
+        return True
+
+    # Fields overlapping rect are drawn again next time
+    def _invalidate_hud(self, rect):
+        for field, field_rect in self._hud_areas.items():
+            if field_rect.colliderect(rect):
+                self._hud.pop(field, None)
 
-        for i in range(4):
-            for j in range(4):
-                p = i * 4 + j
-                if p in figure:
-                    color_index = piece.color
-                    if color_index in self.block_images and self.block_images[color_index] is not None:
-                        # Use image
-                        self.screen.blit(
-                            self.block_images[color_index],
-                            (
-                                self.xStart + self.block_pixel_size * (j + piece.xShift) + 1,
-                                self.yStart + self.block_pixel_size * (i + piece.yShift) + 1
-                            )
-                        )
-                    else:
-                        # Fallback to color
-                        pygame.draw.rect(
-                            self.screen,
-                            COLORS[color_index],
-                            [
-                                self.xStart + self.block_pixel_size * (j + piece.xShift) + 1,
-                                self.yStart + self.block_pixel_size * (i + piece.yShift) + 1,
-                                self.block_pixel_size - 2, 
-                                self.block_pixel_size - 2
-                            ]
-                        )
-    
     def draw_score(self, score):
+        if not self._begin_hud_field('score', score):
+            return
+
         # Calculate position to the right of the board
         score_x = self.xStart + (self.block_pixel_size * 10) + 20  # 10 = board width, 20 = padding
         score_y = self.yStart
         
-        label_text = self.font.render('SCORE', True, BLACK)
-        self.screen.blit(label_text, (score_x, score_y))
-        
         # Render the actual score value below the label (right aligned)
-        score_text = self.font.render(str(score), True, BLACK)
+        score_text = self.text.render(self.font, str(score), True, BLACK)
         self.screen.blit(score_text, (score_x, score_y + 30))
 
     def draw_next_piece(self, next_piece):
+        shown = (True,) if next_piece.is_special else (next_piece.color, tuple(next_piece.get_figure()))
+        if not self._begin_hud_field('next', shown):
+            return
+
         preview_block_size = int(self.block_pixel_size * 0.75)  # 75% of block size
-        preview_box_size = preview_block_size * 4 + 4
         # Position next piece below the score
         next_x = self.xStart + (self.block_pixel_size * 10) + 20  # Same x as score
         preview_y = self.yStart + 90  # Below score (60 for label/value + 30 spacing)
-        
-        preview_x = next_x
-        
-        # NEXT text
-        label_text = self.font.render('NEXT', True, BLACK)
-        self.screen.blit(label_text, (next_x, preview_y))
-        
-        # Draw preview background
-        pygame.draw.rect(
-            self.screen,
-            GRAY,
-            [
-                preview_x,
-                preview_y + 30,
-                preview_box_size,
-                preview_box_size
-            ],
-            2
-        )
+
+        self.draw_piece_preview(next_piece, next_x, preview_y + 30, preview_block_size)
+
+    # (width, height) of a special piece's preview: 3 by 6 blocks, scaled down
+    def _special_preview_size(self, preview_block_size):
+        return int(preview_block_size * 3 * 0.75), int(preview_block_size * 6 * 0.75)
+
+    # Draws piece centered in a 4x4 box of preview_block_size blocks with its top left at
+    # (box_x, box_y). The scaled images are cached, so any number of boxes (next queue, hold)
+    # cost a blit per block
+    def draw_piece_preview(self, piece, box_x, box_y, preview_block_size):
+        preview_box_size = preview_block_size * 4 + 4
         
         # Special handling for special pieces
-        if next_piece.is_special:
-            if self.special_block_image is not None:
-                # Scale the rocket image to fit in the preview box
-                preview_width = int(preview_block_size * 3 * 0.75)  # 3 blocks wide, scaled down
-                preview_height = int(preview_block_size * 6 * 0.75)  # 6 blocks tall, scaled down
-                scaled_rocket = pygame.transform.scale(self.special_block_image, (preview_width, preview_height))
-                
-                # Center the rocket in the preview box
-                rocket_x = preview_x + (preview_box_size - preview_width) // 2
-                rocket_y = preview_y + 30 + (preview_box_size - preview_height) // 2
+        if piece.is_special:
+            preview_width, preview_height = self._special_preview_size(preview_block_size)
+
+            # Center the rocket in the preview box
+            rocket_x = box_x + (preview_box_size - preview_width) // 2
+            rocket_y = box_y + (preview_box_size - preview_height) // 2
+
+            scaled_rocket = self.assets.scaled(SPECIAL_BLOCK_IMAGE, (preview_width, preview_height))
+            if scaled_rocket is not None:
                 self.screen.blit(scaled_rocket, (rocket_x, rocket_y))
             else:
                 # Fallback: draw red rectangle for special piece preview
-                special_width = int(preview_block_size * 3 * 0.75)
-                special_height = int(preview_block_size * 6 * 0.75)
-                special_x = preview_x + (preview_box_size - special_width) // 2
-                special_y = preview_y + 30 + (preview_box_size - special_height) // 2
-                
                 pygame.draw.rect(
                     self.screen,
                     (255, 0, 0),
-                    [special_x, special_y, special_width, special_height]
+                    [rocket_x, rocket_y, preview_width, preview_height]
                 )
             return
         
-        figure = next_piece.get_figure()
+        figure = piece.get_figure()
         if not figure:
             return
 
@@ -542,21 +616,20 @@ class Renderer:
         
         offset_x = (4 - piece_width) // 2 - min_j
         offset_y = (4 - piece_height) // 2 - min_i
+
+        color_index = piece.color
+        preview_img = None
+        if color_index in BLOCK_IMAGES:
+            preview_img = self.assets.scaled(BLOCK_IMAGES[color_index], (preview_block_size - 2, preview_block_size - 2))
         
-        # next piece
+        # preview piece
         for i in range(4):
             for j in range(4):
                 p = i * 4 + j
                 if p in figure:
-                    block_x = preview_x + 2 + preview_block_size * (j + offset_x)
-                    block_y = preview_y + 32 + preview_block_size * (i + offset_y)
-                    color_index = next_piece.color
-                    if color_index in self.block_images and self.block_images[color_index] is not None:
-                        # Scale image for preview size
-                        preview_img = pygame.transform.scale(
-                            self.block_images[color_index],
-                            (preview_block_size - 2, preview_block_size - 2)
-                        )
+                    block_x = box_x + 2 + preview_block_size * (j + offset_x)
+                    block_y = box_y + 2 + preview_block_size * (i + offset_y)
+                    if preview_img is not None:
                         self.screen.blit(preview_img, (block_x, block_y))
                     else:
                         # Fallback to color
@@ -571,14 +644,23 @@ class Renderer:
                             ]
                         )
 
+    # The buttons are drawn off-screen once per set of buttons and window size, then the whole
+    # screen goes out in the next present()
     def _render_buttons(self, buttons):
-        self.screen.fill(LIGHT_BROWN)
+        key = ('buttons',) + tuple((button["label"], tuple(button["rect"])) for button in buttons)
+        self.screen.blit(self.overlays.layer(key, self.screen.get_size(),
+                                             lambda surface: self._draw_buttons(surface, buttons)), (0, 0))
+        self._overlay_rect = None
+        self._repaint = True
+        self._flip_all = True
+
+    def _draw_buttons(self, surface, buttons):
+        surface.fill(LIGHT_BROWN)
         for button in buttons:
-            pygame.draw.rect(self.screen, DARK_BROWN, button["rect"])
-            text = self.font.render(button["label"], True, (255, 255, 255))
+            pygame.draw.rect(surface, DARK_BROWN, button["rect"])
+            text = self.text.render(self.font, button["label"], True, (255, 255, 255))
             text_rect = text.get_rect(center=button["rect"].center)
-            self.screen.blit(text, text_rect)
-            pygame.display.flip()
+            surface.blit(text, text_rect)
 
     def render_menu(self, buttons):
         self._render_buttons(buttons)
@@ -590,22 +672,66 @@ class Renderer:
         self._render_buttons(buttons)
 
     def draw_level(self, level):
+        if not self._begin_hud_field('level', level):
+            return
+
         left_margin = 10
         level_y = 10  # Top margin
         
-        # Render "LEVEL" label
-        label_text = self.font.render('LEVEL', True, BLACK)
-        self.screen.blit(label_text, (left_margin, level_y))
-        
         # Render the actual level value below the label
-        level_text = self.font.render(str(level), True, BLACK)
+        level_text = self.text.render(self.font, str(level), True, BLACK)
         self.screen.blit(level_text, (left_margin, level_y + 35))
 
+    # Lines of text in a box at the bottom left, no lines takes the box down. In game the next
+    # render_board puts back what it covered like it does for the particles. The menus are only
+    # drawn once, there the box puts back the screen it covered itself. Not kept in the
+    # TextCache, the numbers change every frame
+    def draw_overlay(self, lines):
+        if self._overlay_rect is not None:
+            rect = self._overlay_rect
+            self.screen.blit(self._under_overlay, rect)
+            self._dirty.append(rect)
+            self._overlay_rect = None
+        if not lines:
+            return
+
+        font = self.text.font('Courier New', 14)
+        surfaces = [font.render(line, True, WHITE) for line in lines]
+        line_height = font.get_linesize()
+
+        width = max(surface.get_width() for surface in surfaces) + 8
+        height = line_height * len(surfaces) + 8
+        rect = pygame.Rect(0, self.screen.get_height() - height, width, height).clip(self.screen.get_rect())
+        self._under_overlay = self.screen.subsurface(rect).copy()
+        self.screen.fill(BLACK, rect)
+        for k, surface in enumerate(surfaces):
+            self.screen.blit(surface, (rect.x + 4, rect.y + 4 + line_height * k))
+        self._overlay_rect = rect
+        self._dirty.append(rect)
+
     def clear(self):
         self.screen.fill(LIGHT_BROWN)
-        self.particles = []  # Clear particles when clearing screen
-        self.flame_particles = []  # Clear flame particles
-        self.column_flame_particles = []  # Clear column flame particles
+        self.particles.clear()  # Clear particles when clearing screen
+        self.flame_particles.clear()  # Clear flame particles
+        self.column_flame_particles.clear()  # Clear column flame particles
         self.screen_flash_alpha = 0  # Reset screen flash
         self.screen_flash_duration = 0
-        return
\ No newline at end of file
+        self._overlay_rect = None
+        self._under_overlay = None
+        self._repaint = True
+        self._flip_all = True
+        return
+
+    # Puts this frame on the display: only the dirty rects unless everything was repainted.
+    # Past MAX_DIRTY_RECTS they are merged into one, a line clear burst is cheaper that way
+    def present(self):
+        if self._flip_all:
+            pygame.display.flip()
+        elif self._dirty:
+            rects = self._dirty
+            if len(rects) > MAX_DIRTY_RECTS:
+                rects = rects[0].unionall(rects[1:])
+            pygame.display.update(rects)
+
+        self._dirty = []
+        self._flip_all = False
\ No newline at end of file
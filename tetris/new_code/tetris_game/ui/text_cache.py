@@ -0,0 +1,61 @@
+"""
+    Fonts and rendered text shared by the Renderer and every state. A font is looked up (SysFont
+    searches the system fonts every time) once per name, size and style, and a string rendered
+    with the same font, color and antialiasing is only rendered once while it stays among the
+    most recently used ones.
+
+    Usage:
+        font = renderer.text.font('Comic Sans', 25, True, False)
+        surface = renderer.text.render(font, 'SCORE', True, BLACK)
+"""
+
+from collections import OrderedDict
+
+import pygame # type: ignore (ignores the "could not resolve" error)
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+
+        # (name, size, bold, italic) -> Font
+        self._fonts = {}
+
+        # (font, text, color, antialias) -> Surface, least recently used first
+        self._text = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # SysFont(name, size, bold, italic), name None is pygame's default font (Font(None, size))
+    def font(self, name, size, bold=False, italic=False):
+        key = (name, size, bold, italic)
+        if key not in self._fonts:
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(name, size, bold, italic)
+            self._fonts[key] = font
+        return self._fonts[key]
+
+    # Same as font.render(text, antialias, color), the surface is shared so don't draw on it
+    def render(self, font, text, antialias, color):
+        key = (font, text, tuple(color), antialias)
+        surface = self._text.get(key)
+        if surface is not None:
+            self._text.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._text[key] = surface
+        if len(self._text) > self.max_entries:
+            self._text.popitem(last=False)
+        return surface
+
+    def __len__(self):
+        return len(self._text)
+
+    def clear(self):
+        self._text.clear()